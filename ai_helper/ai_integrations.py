@@ -95,7 +95,7 @@ def _get(url: str, timeout: float = _DEFAULT_TIMEOUT) -> Optional[Any]:
     """GET *url* and return parsed JSON, or None on any error."""
     try:
         with urllib.request.urlopen(url, timeout=timeout) as resp:  # noqa: S310
-            return json.loads(resp.read().decode())
+            return json.loads(resp.read())
     except Exception:  # noqa: BLE001
         return None
 
@@ -110,7 +110,7 @@ def _post(url: str, payload: Dict[str, Any], timeout: float = _DEFAULT_TIMEOUT)
             method="POST",
         )
         with urllib.request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
-            return json.loads(resp.read().decode())
+            return json.loads(resp.read())
     except Exception:  # noqa: BLE001
         return None
 
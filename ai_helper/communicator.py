@@ -23,10 +23,12 @@ import shutil
 import subprocess
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_URGENCY_RANK: Dict[str, int] = {"low": 0, "normal": 1, "critical": 2}
+
 
 # ---------------------------------------------------------------------------
 # Message / bus
@@ -219,6 +221,28 @@ class Communicator:
         if self.speak_alerts and self.speaker is not None:
             self.speaker.speak(f"{source}. {message}")
 
+    def alert_batch(self, alerts: Iterable[Tuple[str, str, str, str]]) -> None:
+        """Deliver several alerts in one go.
+
+        Each item is a ``(message, source, urgency, topic)`` tuple.  Every
+        alert is still published on the bus individually, but the batch
+        produces a single desktop notification (at the highest urgency in
+        the batch) and a single spoken announcement.
+        """
+        alerts = list(alerts)
+        if len(alerts) <= 1:
+            for message, source, urgency, topic in alerts:
+                self.alert(message, source=source, urgency=urgency, topic=topic)
+            return
+
+        for message, source, _urgency, topic in alerts:
+            self.bus.publish(Message(topic=topic, payload=message, source=source))
+        urgency = max((a[2] for a in alerts), key=lambda u: _URGENCY_RANK.get(u, 1))
+        body = "\n".join(f"[{source}] {message}" for message, source, _, _ in alerts)
+        self.notifier.notify(title=f"{len(alerts)} alerts", message=body, urgency=urgency)
+        if self.speak_alerts and self.speaker is not None:
+            self.speaker.speak(" ".join(f"{source}. {message}" for message, source, _, _ in alerts))
+
     def publish(self, topic: str, payload: Any, source: str = "ai_helper") -> None:
         """Publish an arbitrary message on the internal bus."""
         self.bus.publish(Message(topic=topic, payload=payload, source=source))
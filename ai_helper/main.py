@@ -71,7 +71,6 @@ from .monitor import SystemMonitor
 from .notification_center import NotificationCenter
 from .orchestrator import Orchestrator
 from .process_manager import ProcessManager
-from .service import ServiceManager
 from .updater import Updater
 from .voice import Speaker, VoiceSettings
 from .wake_word import WakeWordListener
@@ -223,6 +222,9 @@ def main(argv: list[str] | None = None) -> None:  # noqa: UP006
     # Service management (early exit)
     # ------------------------------------------------------------------
     if args.install_service or args.uninstall_service or args.service_status:
+        # Only these one-shot commands need the installer; the daemon never
+        # imports it.
+        from .service import ServiceManager  # noqa: PLC0415
         svc = ServiceManager()
         if args.install_service:
             ok = svc.install()
@@ -345,7 +347,7 @@ def main(argv: list[str] | None = None) -> None:  # noqa: UP006
     if args.check_update:
         u = Updater()
         print("Checking for updates…", flush=True)
-        info = u.check()
+        info = u.check(force=True)
         print(info)
         if info.update_available:
             ans = input("Download update? [y/N] ").strip().lower()
@@ -8,13 +8,15 @@ under pressure.
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
 import psutil
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskStats:
     path: str
     total_gb: float
@@ -23,7 +25,7 @@ class DiskStats:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStats:
     bytes_sent: int
     bytes_recv: int
@@ -31,7 +33,7 @@ class NetworkStats:
     packets_recv: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemSnapshot:
     """A point-in-time snapshot of system resource usage."""
 
@@ -45,11 +47,11 @@ class SystemSnapshot:
 
 
 # Thresholds (%) above which a resource is considered stressed.
-DEFAULT_THRESHOLDS: Dict[str, float] = {
+DEFAULT_THRESHOLDS: Mapping[str, float] = MappingProxyType({
     "cpu": 85.0,
     "memory": 85.0,
     "disk": 90.0,
-}
+})
 
 
 class SystemMonitor:
@@ -63,6 +65,8 @@ class SystemMonitor:
         ``DEFAULT_THRESHOLDS``.
     disk_paths:
         List of filesystem paths to monitor.  Defaults to the root path.
+        When several paths are given they are queried concurrently so one
+        slow (e.g. network) mount doesn't hold up the others.
     """
 
     def __init__(
@@ -70,8 +74,33 @@ class SystemMonitor:
         thresholds: Optional[Dict[str, float]] = None,
         disk_paths: Optional[List[str]] = None,
     ) -> None:
-        self.thresholds: Dict[str, float] = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        self.thresholds = (
+            DEFAULT_THRESHOLDS if not thresholds else {**DEFAULT_THRESHOLDS, **thresholds}
+        )
         self.disk_paths: List[str] = disk_paths if disk_paths is not None else ["/"]
+        self._disk_executor: Optional[ThreadPoolExecutor] = None
+        # psutil.cpu_percent(interval=None) compares against the previous
+        # call and returns a meaningless 0.0 the first time; prime it so the
+        # first snapshot() already reports real usage.
+        psutil.cpu_percent(interval=None)
+
+    @property
+    def thresholds(self) -> Mapping[str, float]:
+        """Alert thresholds (%) keyed by ``cpu``, ``memory`` and ``disk``."""
+        return self._thresholds
+
+    @thresholds.setter
+    def thresholds(self, value: Mapping[str, float]) -> None:
+        # Keep a read-only copy: the notes below are built from it, so the
+        # caller mutating their own dict mustn't change one but not the other.
+        if value is not DEFAULT_THRESHOLDS:
+            value = MappingProxyType(dict(value))
+        self._thresholds = value
+        # The "(threshold N%)" suffixes only change with the thresholds, so
+        # build them once here rather than on every alerts() call.
+        self._cpu_note = f"(threshold {value['cpu']:.0f}%)"
+        self._memory_note = f"(threshold {value['memory']:.0f}%)"
+        self._disk_note = f"(threshold {value['disk']:.0f}%)"
 
     # ------------------------------------------------------------------
     # Public API
@@ -82,21 +111,16 @@ class SystemMonitor:
         vm = psutil.virtual_memory()
         net = psutil.net_io_counters()
 
-        disks: List[DiskStats] = []
-        for path in self.disk_paths:
-            try:
-                usage = psutil.disk_usage(path)
-                disks.append(
-                    DiskStats(
-                        path=path,
-                        total_gb=round(usage.total / 1e9, 2),
-                        used_gb=round(usage.used / 1e9, 2),
-                        free_gb=round(usage.free / 1e9, 2),
-                        percent=usage.percent,
-                    )
+        if len(self.disk_paths) > 1:
+            if self._disk_executor is None:
+                self._disk_executor = ThreadPoolExecutor(
+                    max_workers=min(8, len(self.disk_paths)),
+                    thread_name_prefix="ai-helper-disk",
                 )
-            except (PermissionError, FileNotFoundError):
-                pass
+            results = self._disk_executor.map(self._disk_stats, self.disk_paths)
+        else:
+            results = map(self._disk_stats, self.disk_paths)
+        disks: List[DiskStats] = [d for d in results if d is not None]
 
         network = NetworkStats(
             bytes_sent=net.bytes_sent,
@@ -115,6 +139,20 @@ class SystemMonitor:
             network=network,
         )
 
+    @staticmethod
+    def _disk_stats(path: str) -> Optional[DiskStats]:
+        try:
+            usage = psutil.disk_usage(path)
+        except (PermissionError, FileNotFoundError):
+            return None
+        return DiskStats(
+            path=path,
+            total_gb=round(usage.total / 1e9, 2),
+            used_gb=round(usage.used / 1e9, 2),
+            free_gb=round(usage.free / 1e9, 2),
+            percent=usage.percent,
+        )
+
     def alerts(self, snap: Optional[SystemSnapshot] = None) -> List[str]:
         """Return a list of human-readable alert strings for stressed resources.
 
@@ -128,25 +166,26 @@ class SystemMonitor:
 
         messages: List[str] = []
 
-        if snap.cpu_percent >= self.thresholds["cpu"]:
+        thresholds = self._thresholds
+
+        if snap.cpu_percent >= thresholds["cpu"]:
             messages.append(
-                f"High CPU usage: {snap.cpu_percent:.1f}% "
-                f"(threshold {self.thresholds['cpu']:.0f}%)"
+                f"High CPU usage: {snap.cpu_percent:.1f}% {self._cpu_note}"
             )
 
-        if snap.memory_percent >= self.thresholds["memory"]:
+        if snap.memory_percent >= thresholds["memory"]:
             messages.append(
                 f"High memory usage: {snap.memory_percent:.1f}% "
                 f"({snap.memory_used_mb:.0f} MB / {snap.memory_total_mb:.0f} MB) "
-                f"(threshold {self.thresholds['memory']:.0f}%)"
+                f"{self._memory_note}"
             )
 
+        disk_threshold = thresholds["disk"]
         for disk in snap.disks:
-            if disk.percent >= self.thresholds["disk"]:
+            if disk.percent >= disk_threshold:
                 messages.append(
                     f"Low disk space on {disk.path}: {disk.percent:.1f}% used "
-                    f"({disk.free_gb:.2f} GB free) "
-                    f"(threshold {self.thresholds['disk']:.0f}%)"
+                    f"({disk.free_gb:.2f} GB free) {self._disk_note}"
                 )
 
         return messages
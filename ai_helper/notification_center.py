@@ -25,10 +25,15 @@ Usage
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import sys
+import threading
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -39,7 +44,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationRecord:
     """One recorded notification."""
     message: str
@@ -49,10 +54,11 @@ class NotificationRecord:
     ts: float = field(default_factory=time.time)
     suppressed: bool = False
     escalated: bool = False
+    # Rendered once here; format_history() may display a record many times
+    time_str: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def time_str(self) -> str:
-        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.ts))
+    def __post_init__(self) -> None:
+        self.time_str = _format_ts(int(self.ts))
 
     def __str__(self) -> str:
         tags: List[str] = []
@@ -65,6 +71,20 @@ class NotificationRecord:
         return f"[{self.time_str}] {urgency_icon} [{self.source}] {self.message}{tag_str}"
 
 
+# Alert storms produce many records in the same second and repeat the same
+# few messages, so both helpers below are memoised.
+
+@lru_cache(maxsize=64)
+def _format_ts(ts: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+
+
+@lru_cache(maxsize=1024)
+def _message_digest(message: str) -> bytes:
+    """Return a short fixed-size digest of *message* for use in dedup keys."""
+    return hashlib.blake2b(message.encode("utf-8", "replace"), digest_size=8).digest()
+
+
 # ---------------------------------------------------------------------------
 # NotificationCenter
 # ---------------------------------------------------------------------------
@@ -92,6 +112,11 @@ class NotificationCenter:
         Default: 500.
     on_notify:
         Optional callback invoked for every *non-suppressed* notification.
+        Callbacks run on a background worker thread so a slow callback
+        never blocks :meth:`notify`; use :meth:`flush` to wait for them.
+    max_inflight:
+        Maximum number of records waiting for ``on_notify``.  When the
+        queue is full the oldest pending record is dropped.  Default: 1000.
     """
 
     def __init__(
@@ -102,6 +127,7 @@ class NotificationCenter:
         escalate_window: float = 300.0,
         history_size: int = 500,
         on_notify: Optional[Callable[[NotificationRecord], None]] = None,
+        max_inflight: int = 1000,
     ) -> None:
         self.dedup_seconds = dedup_seconds
         self.throttle_seconds = throttle_seconds
@@ -109,21 +135,45 @@ class NotificationCenter:
         self.escalate_window = escalate_window
         self.history_size = history_size
         self.on_notify = on_notify
+        self.max_inflight = max_inflight
 
         # In-memory history (newest at end)
         self._history: Deque[NotificationRecord] = deque(maxlen=history_size)
 
-        # Dedup: (source, message) → last fire timestamp
-        self._last_fire: Dict[Tuple[str, str], float] = {}
+        # Non-suppressed subset of ``_history``, same order
+        self._active: Deque[NotificationRecord] = deque()
+
+        # Running tallies over ``_history`` so stats() needn't rescan it
+        self._n_active = 0
+        self._n_critical = 0
+        self._n_escalated = 0
+
+        # Dedup: (source, message digest) → last fire timestamp
+        self._last_fire: Dict[Tuple[str, bytes], float] = {}
 
         # Throttle: (source, topic) → last fire timestamp
         self._last_topic: Dict[Tuple[str, str], float] = {}
 
-        # Escalation: (source, message) → deque of fire timestamps
-        self._fire_times: Dict[Tuple[str, str], Deque[float]] = defaultdict(
+        # Escalation: (source, message digest) → deque of fire timestamps
+        self._fire_times: Dict[Tuple[str, bytes], Deque[float]] = defaultdict(
             lambda: deque(maxlen=100)
         )
 
+        # Expired dedup/throttle/escalation entries are purged at most once
+        # per ``_purge_interval`` seconds so the state stays bounded.
+        self._purge_interval = max(
+            min(dedup_seconds, throttle_seconds, escalate_window) / 4, 1.0
+        )
+        self._last_purge = time.monotonic()
+
+        # on_notify delivery: pending records, drained by a lazily started
+        # daemon thread
+        self._cb_queue: Deque[NotificationRecord] = deque()
+        self._cb_cond = threading.Condition()
+        self._cb_thread: Optional[threading.Thread] = None
+        self._cb_busy = False
+        self._n_dropped = 0
+
     # ------------------------------------------------------------------
     # Core API
     # ------------------------------------------------------------------
@@ -141,59 +191,161 @@ class NotificationCenter:
         source+topic has been throttled.  Escalation is applied when needed.
         Returns the :class:`NotificationRecord` (even if suppressed).
         """
-        now = time.time()
-        key = (source, message)
-        topic_key = (source, topic)
+        # Dedup/throttle/escalation windows use the monotonic clock so wall
+        # clock adjustments can't unsuppress or stall alerts; the wall time
+        # is only needed for the record itself.
+        now = time.monotonic()
+        ts = time.time()
+        # Sources and topics come from a small, fixed vocabulary; interning
+        # them keeps the throttle keys cheap to compare.  Messages can be
+        # long, so only a short digest is kept in the dedup state.
+        source = sys.intern(source)
+        topic = sys.intern(topic)
+        key = (source, _message_digest(message))
+
+        if now - self._last_purge >= self._purge_interval:
+            self._purge(now)
 
         # ---- Deduplication -------------------------------------------
-        last = self._last_fire.get(key, 0.0)
-        if now - last < self.dedup_seconds:
-            rec = NotificationRecord(
-                message=message, source=source, urgency=urgency,
-                topic=topic, ts=now, suppressed=True,
-            )
-            self._history.append(rec)
-            logger.debug("Notification suppressed (dup): %s", message[:60])
-            return rec
+        last = self._last_fire.get(key)
+        if last is not None and now - last < self.dedup_seconds:
+            logger.debug("Notification suppressed (dup): %.60s", message)
+            return self._record_suppressed(message, source, urgency, topic, ts)
 
         # ---- Throttle ------------------------------------------------
-        last_topic = self._last_topic.get(topic_key, 0.0)
-        if now - last_topic < self.throttle_seconds:
-            rec = NotificationRecord(
-                message=message, source=source, urgency=urgency,
-                topic=topic, ts=now, suppressed=True,
-            )
-            self._history.append(rec)
-            logger.debug("Notification throttled: %s", message[:60])
-            return rec
+        topic_key = (source, topic)
+        last = self._last_topic.get(topic_key)
+        if last is not None and now - last < self.throttle_seconds:
+            logger.debug("Notification throttled: %.60s", message)
+            return self._record_suppressed(message, source, urgency, topic, ts)
+
+        return self._fire(message, source, urgency, topic, ts, now, key, topic_key)
 
+    def _record_suppressed(
+        self, message: str, source: str, urgency: str, topic: str, ts: float
+    ) -> NotificationRecord:
+        rec = NotificationRecord(message, source, urgency, topic, ts, True, False)
+        self._append(rec)
+        return rec
+
+    def _fire(
+        self,
+        message: str,
+        source: str,
+        urgency: str,
+        topic: str,
+        ts: float,
+        now: float,
+        key: Tuple[str, bytes],
+        topic_key: Tuple[str, str],
+    ) -> NotificationRecord:
+        """Record and dispatch a notification that passed dedup and throttle."""
         # ---- Escalation ----------------------------------------------
+        # Timestamps are appended in order, so expired ones sit at the left
+        # and the remaining length is the in-window count.
         times = self._fire_times[key]
         times.append(now)
-        recent = sum(1 for t in times if now - t <= self.escalate_window)
-        escalated = False
-        if recent >= self.escalate_count and urgency != "critical":
+        window = self.escalate_window
+        while now - times[0] > window:
+            times.popleft()
+        escalated = len(times) >= self.escalate_count and urgency != "critical"
+        if escalated:
             urgency = "critical"
-            escalated = True
 
         # ---- Record & fire -------------------------------------------
         self._last_fire[key] = now
         self._last_topic[topic_key] = now
 
-        rec = NotificationRecord(
-            message=message, source=source, urgency=urgency,
-            topic=topic, ts=now, suppressed=False, escalated=escalated,
-        )
-        self._history.append(rec)
-        logger.info("NOTIFY [%s/%s] %s", source, urgency, message[:100])
+        rec = NotificationRecord(message, source, urgency, topic, ts, False, escalated)
+        self._append(rec)
+        logger.info("NOTIFY [%s/%s] %.100s", source, urgency, message)
 
         if self.on_notify:
+            self._dispatch(rec)
+
+        return rec
+
+    # ------------------------------------------------------------------
+    # Callback delivery
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, rec: NotificationRecord) -> None:
+        """Queue *rec* for the ``on_notify`` worker thread."""
+        with self._cb_cond:
+            if len(self._cb_queue) >= self.max_inflight:
+                self._cb_queue.popleft()
+                self._n_dropped += 1
+            self._cb_queue.append(rec)
+            if self._cb_thread is None:
+                self._cb_thread = threading.Thread(
+                    target=self._callback_loop, name="ai-helper-notify", daemon=True
+                )
+                self._cb_thread.start()
+            self._cb_cond.notify_all()
+
+    def _callback_loop(self) -> None:
+        while True:
+            with self._cb_cond:
+                while not self._cb_queue:
+                    self._cb_cond.wait()
+                rec = self._cb_queue.popleft()
+                self._cb_busy = True
             try:
-                self.on_notify(rec)
+                callback = self.on_notify
+                if callback:
+                    callback(rec)
             except Exception:  # noqa: BLE001
                 logger.exception("on_notify callback failed")
+            finally:
+                with self._cb_cond:
+                    self._cb_busy = False
+                    self._cb_cond.notify_all()
 
-        return rec
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued ``on_notify`` callback has run.
+
+        Returns ``False`` if *timeout* expired first.
+        """
+        with self._cb_cond:
+            return self._cb_cond.wait_for(
+                lambda: not self._cb_queue and not self._cb_busy, timeout
+            )
+
+    def _append(self, rec: NotificationRecord) -> None:
+        """Add *rec* to the history, keeping the stats tallies in step."""
+        if len(self._history) == self._history.maxlen:
+            if not self._history:
+                return
+            self._tally(self._history.popleft(), -1)
+        self._history.append(rec)
+        self._tally(rec, 1)
+
+    def _tally(self, rec: NotificationRecord, delta: int) -> None:
+        if rec.escalated:
+            self._n_escalated += delta
+        if not rec.suppressed:
+            if delta > 0:
+                self._active.append(rec)
+            else:
+                # History evicts oldest-first, so this is the oldest active one
+                self._active.popleft()
+            self._n_active += delta
+            if rec.urgency == "critical":
+                self._n_critical += delta
+
+    def _purge(self, now: float) -> None:
+        """Drop dedup, throttle and escalation entries that can no longer matter."""
+        self._last_purge = now
+        for k in [k for k, ts in self._last_fire.items() if now - ts >= self.dedup_seconds]:
+            del self._last_fire[k]
+        for k in [k for k, ts in self._last_topic.items() if now - ts >= self.throttle_seconds]:
+            del self._last_topic[k]
+        for k in list(self._fire_times):
+            times = self._fire_times[k]
+            while times and now - times[0] > self.escalate_window:
+                times.popleft()
+            if not times:
+                del self._fire_times[k]
 
     # ------------------------------------------------------------------
     # History
@@ -204,9 +356,15 @@ class NotificationCenter:
         """All stored notifications, oldest first."""
         return list(self._history)
 
-    def active_alerts(self) -> List[NotificationRecord]:
-        """Non-suppressed alerts, newest first."""
-        return [r for r in reversed(self._history) if not r.suppressed]
+    def active_alerts(self, limit: Optional[int] = None) -> List[NotificationRecord]:
+        """Non-suppressed alerts, newest first.
+
+        Parameters
+        ----------
+        limit:
+            Return at most this many alerts.  Default: all of them.
+        """
+        return list(islice(reversed(self._active), limit))
 
     def format_history(
         self,
@@ -228,14 +386,14 @@ class NotificationCenter:
         include_suppressed:
             Include suppressed (deduplicated/throttled) entries.
         """
-        records = list(reversed(self._history))
-        if not include_suppressed:
-            records = [r for r in records if not r.suppressed]
-        if urgency:
-            records = [r for r in records if r.urgency == urgency]
-        if source:
-            records = [r for r in records if r.source == source]
-        records = records[:limit]
+        records = list(islice(
+            (
+                r for r in reversed(self._history if include_suppressed else self._active)
+                if (not urgency or r.urgency == urgency)
+                and (not source or r.source == source)
+            ),
+            limit,
+        ))
 
         if not records:
             return "No notifications matching the filters."
@@ -247,19 +405,21 @@ class NotificationCenter:
 
     def stats(self) -> str:
         """Return a brief statistics string."""
-        total = len(self._history)
-        active = sum(1 for r in self._history if not r.suppressed)
-        suppressed = total - active
-        critical = sum(1 for r in self._history if r.urgency == "critical" and not r.suppressed)
-        escalated = sum(1 for r in self._history if r.escalated)
-        return (
+        active = self._n_active
+        suppressed = len(self._history) - active
+        text = (
             f"Notifications: {active} active, {suppressed} suppressed, "
-            f"{critical} critical, {escalated} escalated"
+            f"{self._n_critical} critical, {self._n_escalated} escalated"
         )
+        if self._n_dropped:
+            text += f", {self._n_dropped} callbacks dropped"
+        return text
 
     def clear_history(self) -> None:
         """Wipe the in-memory notification history."""
         self._history.clear()
+        self._active.clear()
+        self._n_active = self._n_critical = self._n_escalated = 0
         self._last_fire.clear()
         self._last_topic.clear()
         self._fire_times.clear()
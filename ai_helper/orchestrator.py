@@ -13,9 +13,12 @@ polling loop that keeps the desktop *running smooth*, *organised* and
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from .ai_integrations import AIAppRegistry
 from .communicator import Communicator
@@ -23,7 +26,8 @@ from .gpu_monitor import GpuMonitor
 from .memory import Memory
 from .monitor import SystemMonitor, SystemSnapshot
 from .notification_center import NotificationCenter
-from .process_manager import ProcessManager
+from .process_manager import ProcessInfo, ProcessManager
+from .scheduler import TaskScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +38,9 @@ class Orchestrator:
     Parameters
     ----------
     poll_interval:
-        Seconds between each monitoring cycle.  Default is 30 s.
+        Seconds between each monitoring cycle.  Default is 30 s.  While no
+        alerts are raised the background loop gradually backs off to at
+        most twice this interval, and snaps back as soon as one fires.
     monitor:
         Optional pre-configured :class:`~ai_helper.monitor.SystemMonitor`.
     process_manager:
@@ -49,6 +55,16 @@ class Orchestrator:
         Optional pre-configured :class:`~ai_helper.notification_center.NotificationCenter`.
     memory:
         Optional pre-configured :class:`~ai_helper.memory.Memory`.
+    parallel:
+        When ``True`` (default) the system snapshot and the process list are
+        collected concurrently on each tick.  Alert handling always runs on
+        the calling thread.
+    scheduler:
+        Optional shared :class:`~ai_helper.scheduler.TaskScheduler`.  When
+        given, :meth:`start` registers the monitoring cycle as a task on it
+        instead of spawning a dedicated thread, so any number of
+        orchestrators can share one background thread.  The first cycle
+        then runs one ``poll_interval`` after :meth:`start`.
     """
 
     def __init__(
@@ -61,6 +77,8 @@ class Orchestrator:
         ai_registry: Optional[AIAppRegistry] = None,
         notification_center: Optional[NotificationCenter] = None,
         memory: Optional[Memory] = None,
+        parallel: bool = True,
+        scheduler: Optional[TaskScheduler] = None,
     ) -> None:
         self.poll_interval = poll_interval
         self.monitor = monitor or SystemMonitor()
@@ -70,37 +88,126 @@ class Orchestrator:
         self.ai_registry = ai_registry or AIAppRegistry()
         self.notification_center = notification_center or NotificationCenter()
         self.memory = memory or Memory()
+        self.parallel = parallel
+        self.scheduler = scheduler
 
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Guards _ticking, so stop() and a scheduler worker agree on who
+        # shuts the executor down.
+        self._tick_lock = threading.Lock()
+        self._ticking = False
+        self._current_interval = poll_interval
+        self._alerts_this_tick = 0
+        # Alerts raised during a tick, delivered together when it ends
+        self._pending_alerts: List[Tuple[str, str, str, str]] = []
+
+        # Set while arun() drives the loop on an asyncio event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_stop: Optional[asyncio.Event] = None
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def start(self) -> None:
-        """Start the background monitoring loop in a daemon thread."""
-        if self._thread and self._thread.is_alive():
+        """Start the background monitoring loop.
+
+        Runs in a daemon thread, or as a task on the shared
+        :attr:`scheduler` when one was supplied.
+        """
+        if self.running:
             logger.warning("Orchestrator already running")
             return
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._run, name="ai-helper-orchestrator", daemon=True)
-        self._thread.start()
+        self._current_interval = self.poll_interval
+        if self.scheduler is not None:
+            self.scheduler.add(self._task_name, self._scheduled_tick,
+                               self.poll_interval, replace=True)
+            if not self.scheduler.running:
+                self.scheduler.start()
+        else:
+            self._thread = threading.Thread(target=self._run, name="ai-helper-orchestrator",
+                                            daemon=True)
+            self._thread.start()
         logger.info("AI Helper orchestrator started (interval=%ss)", self.poll_interval)
         self.communicator.publish("status", "started")
 
+    async def arun(self) -> None:
+        """Run the monitoring loop on the current asyncio event loop.
+
+        Blocking psutil work is handed to the loop's default executor, so
+        no dedicated thread is kept alive between ticks.  Returns once
+        :meth:`stop` is called (from any thread).
+        """
+        if self.running:
+            logger.warning("Orchestrator already running")
+            return
+        loop = asyncio.get_running_loop()
+        self._stop_event.clear()
+        self._async_stop = asyncio.Event()
+        self._loop = loop
+        self._current_interval = self.poll_interval
+        logger.info("AI Helper orchestrator started (async, interval=%ss)", self.poll_interval)
+        self.communicator.publish("status", "started")
+        try:
+            while not self._stop_event.is_set():
+                deadline = time.perf_counter() + self._current_interval
+                try:
+                    await loop.run_in_executor(None, self.tick)
+                except Exception:  # noqa: BLE001
+                    logger.exception("Unexpected error in orchestrator tick")
+                self._current_interval = self._next_interval()
+                try:
+                    await asyncio.wait_for(
+                        self._async_stop.wait(),
+                        timeout=max(0.0, deadline - time.perf_counter()),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._loop = None
+            self._async_stop = None
+            self._shutdown_executor()
+
     def stop(self) -> None:
         """Signal the background loop to stop and wait for it to finish."""
         self._stop_event.set()
-        if self._thread:
-            self._thread.join(timeout=self.poll_interval + 5)
+        loop, async_stop = self._loop, self._async_stop
+        if loop is not None and async_stop is not None:
+            # arun() shuts the executor down itself once its tick finishes
+            loop.call_soon_threadsafe(async_stop.set)
+        elif self.scheduler is not None and self.scheduler.remove(self._task_name):
+            with self._tick_lock:
+                # A tick already running on a scheduler worker still needs
+                # the executor; _scheduled_tick shuts it down when it ends.
+                if not self._ticking:
+                    self._shutdown_executor()
+        else:
+            if self._thread:
+                self._thread.join(timeout=self.poll_interval + 5)
+            self._shutdown_executor()
         logger.info("AI Helper orchestrator stopped")
         self.communicator.publish("status", "stopped")
 
+    def _shutdown_executor(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     @property
     def running(self) -> bool:
         """``True`` while the background loop is active."""
-        return bool(self._thread and self._thread.is_alive() and not self._stop_event.is_set())
+        if self._stop_event.is_set():
+            return False
+        if self.scheduler is not None and self.scheduler.get(self._task_name) is not None:
+            return self.scheduler.running
+        return bool((self._thread and self._thread.is_alive()) or self._loop is not None)
+
+    @property
+    def _task_name(self) -> str:
+        return f"orchestrator-{id(self):x}"
 
     # ------------------------------------------------------------------
     # One monitoring cycle (public so tests can call it directly)
@@ -108,37 +215,90 @@ class Orchestrator:
 
     def tick(self) -> None:
         """Run a single monitoring cycle synchronously."""
-        self._check_system()
-        self._check_processes()
-        self._check_gpu()
-        self._check_ai_apps()
+        self._alerts_this_tick = 0
+        try:
+            executor = self._executor
+            if self.parallel and executor is None and not self._stop_event.is_set():
+                # Never after stop(): nothing would shut a new pool down.
+                executor = self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="ai-helper"
+                )
+            if self.parallel and executor is not None:
+                snap_future = executor.submit(self.monitor.snapshot)
+                procs_future = executor.submit(self.process_manager.list_processes)
+                self._check_system(snap_future.result())
+                self._check_processes(procs_future.result())
+            else:
+                self._check_system()
+                self._check_processes()
+            self._check_gpu()
+            self._check_ai_apps()
+        finally:
+            self._flush_alerts()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _run(self) -> None:
+        self._current_interval = self.poll_interval
         while not self._stop_event.is_set():
+            deadline = time.perf_counter() + self._current_interval
             try:
                 self.tick()
             except Exception:  # noqa: BLE001
                 logger.exception("Unexpected error in orchestrator tick")
-            self._stop_event.wait(timeout=self.poll_interval)
+            self._current_interval = self._next_interval()
+            self._stop_event.wait(timeout=max(0.0, deadline - time.perf_counter()))
+
+    def _scheduled_tick(self) -> None:
+        """Task body used when running on a shared scheduler."""
+        with self._tick_lock:
+            if self._stop_event.is_set():
+                return
+            self._ticking = True
+        try:
+            self.tick()
+        finally:
+            with self._tick_lock:
+                self._ticking = False
+                if self._stop_event.is_set():
+                    self._shutdown_executor()
+            self._current_interval = self._next_interval()
+            task = self.scheduler.get(self._task_name) if self.scheduler else None
+            if task is not None:
+                # Task.run() schedules the next run from this interval
+                task.interval = self._current_interval
+
+    def _next_interval(self) -> float:
+        """Return the wait before the next tick, backing off while calm."""
+        if self._alerts_this_tick:
+            return self.poll_interval
+        return min(self._current_interval * 1.5, 2 * self.poll_interval)
 
     def _alert(self, message: str, source: str, urgency: str = "normal",
                topic: str = "alert", metric: str = "", value: float = 0.0) -> None:
         """Fire an alert through the notification center, communicator and memory."""
+        self._alerts_this_tick += 1
         rec = self.notification_center.notify(message, source=source,
                                               urgency=urgency, topic=topic)
         if not rec.suppressed:
-            self.communicator.alert(message, source=source, urgency=urgency, topic=topic)
+            self._pending_alerts.append((message, source, urgency, topic))
             if metric:
                 self.memory.record_anomaly(metric, value=value, z_score=0.0, details=message)
 
-    def _check_system(self) -> None:
-        snap: SystemSnapshot = self.monitor.snapshot()
+    def _flush_alerts(self) -> None:
+        """Hand every alert queued during this tick to the communicator at once."""
+        if self._pending_alerts:
+            pending, self._pending_alerts = self._pending_alerts, []
+            self.communicator.alert_batch(pending)
+
+    def _check_system(self, snap: Optional[SystemSnapshot] = None) -> None:
+        if snap is None:
+            snap = self.monitor.snapshot()
         self.communicator.publish("snapshot", snap, source="monitor")
-        logger.debug("%s", self.monitor.format_snapshot(snap))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", self.monitor.format_snapshot(snap))
 
         for alert_msg in self.monitor.alerts(snap):
             logger.warning("SYSTEM ALERT: %s", alert_msg)
@@ -146,10 +306,12 @@ class Orchestrator:
                         topic="alert", metric="system",
                         value=snap.cpu_percent)
 
-    def _check_processes(self) -> None:
-        procs = self.process_manager.list_processes()
+    def _check_processes(self, procs: Optional[List[ProcessInfo]] = None) -> None:
+        if procs is None:
+            procs = self.process_manager.list_processes()
         self.communicator.publish("processes", procs, source="process_manager")
-        logger.debug("%s", self.process_manager.summary(procs))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", self.process_manager.summary(procs))
 
         for proc in self.process_manager.high_cpu_processes(procs):
             msg = f"Process {proc.name!r} (PID {proc.pid}) using {proc.cpu_percent:.1f}% CPU"
@@ -170,7 +332,8 @@ class Orchestrator:
         snaps = self.gpu_monitor.snapshots()
         if snaps:
             self.communicator.publish("gpu", snaps, source="gpu_monitor")
-            logger.debug("%s", self.gpu_monitor.format_snapshots(snaps))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s", self.gpu_monitor.format_snapshots(snaps))
         for alert_msg in self.gpu_monitor.alerts(snaps):
             logger.warning("GPU ALERT: %s", alert_msg)
             self._alert(alert_msg, source="gpu_monitor", urgency="critical",
@@ -180,5 +343,6 @@ class Orchestrator:
         running_apps = self.ai_registry.running()
         if running_apps:
             self.communicator.publish("ai_apps", running_apps, source="ai_registry")
-            names = ", ".join(s.name for s in running_apps)
-            logger.debug("Running AI apps: %s", names)
+            if logger.isEnabledFor(logging.DEBUG):
+                names = ", ".join(s.name for s in running_apps)
+                logger.debug("Running AI apps: %s", names)
@@ -11,17 +11,27 @@ without touching any files.
 
 from __future__ import annotations
 
+import errno
 import logging
+import os
 import shutil
+import sys
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Deque, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
 from . import config as _cfg
 
 logger = logging.getLogger(__name__)
 
+# Default Windows and macOS filesystems ignore case, so destination names
+# are compared case-folded there to avoid overwriting e.g. README.txt.
+_CASE_INSENSITIVE_FS = sys.platform in ("win32", "darwin")
+
 
 # ---------------------------------------------------------------------------
 # Category definitions
@@ -156,12 +166,29 @@ EXTENSION_MAP: Dict[str, FileCategory] = {
     ".woff2": FileCategory.FONTS,
 }
 
+# Shared read-only view handed to every organiser without a custom map, so
+# the common case doesn't copy the table per instance.
+_EXT_MAP_FROZEN: Mapping[str, FileCategory] = MappingProxyType(EXTENSION_MAP)
+
+
+@lru_cache(maxsize=1)
+def _default_target_dir() -> Path:
+    """``~/Desktop``, resolved once (``Path.home()`` is a system call)."""
+    return Path.home() / "Desktop"
+
 
 def categorise_file(path: Path) -> FileCategory:
     """Return the :class:`FileCategory` for *path* based on its extension."""
     return EXTENSION_MAP.get(path.suffix.lower(), FileCategory.OTHER)
 
 
+def _suffix(name: str) -> str:
+    """Return the extension of a bare file *name*, like :attr:`Path.suffix`."""
+    i = name.rfind(".")
+    # A leading dot marks a hidden file, not an extension
+    return name[i:] if 0 < i < len(name) - 1 else ""
+
+
 # ---------------------------------------------------------------------------
 # Result types
 # ---------------------------------------------------------------------------
@@ -219,6 +246,50 @@ class OrganiseResult:
         return "\n".join(lines)
 
 
+class _DestNames:
+    """Names present in (or already claimed for) one destination folder.
+
+    Read once with :func:`os.listdir`; collisions are then resolved in
+    memory.  The next free ``" (N)"`` counter is remembered per name so a
+    run of identically named files doesn't rescan from 1 each time.
+    """
+
+    __slots__ = ("_names", "_counters")
+
+    def __init__(self, names: Iterator[str]) -> None:
+        self._names: Set[str] = {self._key(n) for n in names}
+        self._counters: Dict[str, int] = {}
+
+    @classmethod
+    def listdir(cls, dest_dir: Path) -> "_DestNames":
+        try:
+            return cls(iter(os.listdir(dest_dir)))
+        except OSError:
+            return cls(iter(()))
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.casefold() if _CASE_INSENSITIVE_FS else name
+
+    def claim(self, name: str) -> str:
+        """Return *name*, or the first free ``"stem (N).ext"``, and reserve it."""
+        key = self._key(name)
+        if key in self._names:
+            # Slice the bare string rather than building a Path per collision.
+            suffix = _suffix(name)
+            stem = name[: len(name) - len(suffix)]
+            counter = self._counters.get(key, 1)
+            while True:
+                candidate = f"{stem} ({counter}){suffix}"
+                counter += 1
+                if self._key(candidate) not in self._names:
+                    break
+            self._counters[key] = counter
+            name = candidate
+        self._names.add(self._key(name))
+        return name
+
+
 # ---------------------------------------------------------------------------
 # Organiser
 # ---------------------------------------------------------------------------
@@ -261,12 +332,21 @@ class FileOrganizer:
         recursive: bool = False,
         custom_map: Optional[Dict[str, FileCategory]] = None,
     ) -> None:
-        self.target_dir = target_dir or (Path.home() / "Desktop")
+        self.target_dir = target_dir or _default_target_dir()
         # All organised files land on the D drive (or configured install dir).
         self.downloads_dir: Path = downloads_dir or _cfg.get_organized_dir()
         self.dry_run = dry_run
         self.recursive = recursive
-        self._ext_map: Dict[str, FileCategory] = {**EXTENSION_MAP, **(custom_map or {})}
+        # Keys are kept lower-case so _categorise_name can try the suffix as
+        # written before paying for a .lower() copy.
+        self._ext_map: Mapping[str, FileCategory] = (
+            {
+                **EXTENSION_MAP,
+                **{ext.lower(): cat for ext, cat in custom_map.items()},
+            }
+            if custom_map
+            else _EXT_MAP_FROZEN
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -275,8 +355,8 @@ class FileOrganizer:
     def scan(self) -> Dict[FileCategory, List[Path]]:
         """Return a dict mapping each category to its files, without moving anything."""
         result: Dict[FileCategory, List[Path]] = {cat: [] for cat in FileCategory}
-        for path in self._iter_files():
-            result[self._categorise(path)].append(path)
+        for entry, _top_level in self._iter_entries():
+            result[self._categorise_name(entry.name)].append(Path(entry.path))
         return result
 
     def organise(self) -> OrganiseResult:
@@ -285,23 +365,39 @@ class FileOrganizer:
         Returns an :class:`OrganiseResult` summarising every action taken.
         """
         result = OrganiseResult(target_dir=self.target_dir, dry_run=self.dry_run)
-
-        for path in self._iter_files():
+        created: Set[Path] = set()
+        # Names present in (or already claimed for) each destination folder,
+        # listed once per folder instead of probing with exists() per file.
+        taken: Dict[Path, _DestNames] = {}
+        same_fs: Optional[bool] = None
+
+        for entry, top_level in self._iter_entries():
+            path = Path(entry.path)
             # Skip files already inside one of our category sub-directories
-            if path.parent != self.target_dir:
+            if not top_level:
                 result.skipped.append(path)
                 continue
 
-            category = self._categorise(path)
+            category = self._categorise_name(entry.name)
             dest_dir = self.downloads_dir / category.value
-            dest = self._unique_dest(dest_dir, path.name)
+            names = taken.get(dest_dir)
+            if names is None:
+                names = taken[dest_dir] = _DestNames.listdir(dest_dir)
+            dest = self._unique_dest(dest_dir, entry.name, names)
 
             record = MoveRecord(source=path, destination=dest, category=category, dry_run=self.dry_run)
 
             if not self.dry_run:
                 try:
-                    dest_dir.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(path), str(dest))
+                    if dest_dir not in created:
+                        dest_dir.mkdir(parents=True, exist_ok=True)
+                        created.add(dest_dir)
+                    if same_fs is None:
+                        same_fs = (
+                            os.stat(self.target_dir).st_dev
+                            == os.stat(self.downloads_dir).st_dev
+                        )
+                    self._move(path, dest, same_fs)
                     logger.info("Moved %s → %s", path.name, dest)
                 except OSError as exc:
                     result.errors.append((path, str(exc)))
@@ -332,28 +428,66 @@ class FileOrganizer:
     # Internals
     # ------------------------------------------------------------------
 
-    def _iter_files(self):
-        if not self.target_dir.is_dir():
+    def _iter_entries(self) -> Iterator[Tuple[os.DirEntry, bool]]:
+        """Yield ``(entry, top_level)`` for every file under :attr:`target_dir`.
+
+        Uses :func:`os.scandir` so file/dir checks come from the directory
+        listing itself instead of a ``stat`` per entry.  Sub-directories are
+        walked breadth-first when :attr:`recursive` is set; directory
+        symlinks are not followed.
+        """
+        root = str(self.target_dir)
+        if not os.path.isdir(root):
             return
-        pattern = "**/*" if self.recursive else "*"
-        for path in self.target_dir.glob(pattern):
-            if path.is_file():
-                yield path
+        pending: Deque[str] = deque([root])
+        while pending:
+            current = pending.popleft()
+            try:
+                # Read the whole listing first: organise() moves files out of
+                # the directory while this generator is suspended.
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            top_level = current == root
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        yield entry, top_level
+                    elif self.recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                except OSError:
+                    continue
 
-    def _categorise(self, path: Path) -> FileCategory:
-        return self._ext_map.get(path.suffix.lower(), FileCategory.OTHER)
+    def _categorise_name(self, name: str) -> FileCategory:
+        ext = _suffix(name)
+        if not ext:
+            return FileCategory.OTHER
+        ext_map = self._ext_map
+        # Most extensions are already lower-case; only fold case on a miss
+        return ext_map.get(ext) or ext_map.get(ext.lower(), FileCategory.OTHER)
 
     @staticmethod
-    def _unique_dest(dest_dir: Path, name: str) -> Path:
-        """Return a destination path that does not already exist."""
-        candidate = dest_dir / name
-        if not candidate.exists():
-            return candidate
-        stem = Path(name).stem
-        suffix = Path(name).suffix
-        counter = 1
-        while True:
-            candidate = dest_dir / f"{stem} ({counter}){suffix}"
-            if not candidate.exists():
-                return candidate
-            counter += 1
+    def _move(src: Path, dest: Path, same_fs: bool) -> None:
+        """Move *src* to *dest*, as a single rename when on the same filesystem."""
+        if same_fs:
+            try:
+                os.replace(src, dest)
+                return
+            except OSError as exc:
+                if exc.errno != errno.EXDEV:
+                    raise
+        shutil.move(str(src), str(dest))
+
+    @staticmethod
+    def _unique_dest(
+        dest_dir: Path, name: str, taken: Optional[_DestNames] = None
+    ) -> Path:
+        """Return a destination path that does not already exist.
+
+        Callers placing many files pass the folder's :class:`_DestNames` so
+        it is listed only once; the chosen name is reserved in it.
+        """
+        if taken is None:
+            taken = _DestNames.listdir(dest_dir)
+        return dest_dir / taken.claim(name)
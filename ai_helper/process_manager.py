@@ -7,6 +7,7 @@ can keep the desktop *organised* and identify misbehaving programs.
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional
 
@@ -24,7 +25,7 @@ class ProcessInfo:
     status: str
     cpu_percent: float
     memory_mb: float
-    num_threads: int
+    num_threads: int = 0
 
 
 class ProcessManager:
@@ -36,41 +37,77 @@ class ProcessManager:
         Percentage above which a single process is flagged as a CPU hog.
     memory_threshold_mb:
         MB above which a single process is flagged as a memory hog.
+    cache_ttl:
+        Seconds for which :meth:`list_processes` reuses its previous result,
+        so several queries in quick succession share one process walk.
+        ``0`` disables the cache.
+    include_threads:
+        Also collect each process's thread count.  Off by default because
+        nothing in AI Helper uses it and it costs an extra read per process
+        (``/proc/<pid>/status`` on Linux); :attr:`ProcessInfo.num_threads`
+        is ``0`` when disabled.
     """
 
     def __init__(
         self,
         cpu_threshold: float = 50.0,
         memory_threshold_mb: float = 500.0,
+        cache_ttl: float = 1.0,
+        include_threads: bool = False,
     ) -> None:
         self.cpu_threshold = cpu_threshold
         self.memory_threshold_mb = memory_threshold_mb
+        self.cache_ttl = cache_ttl
+        self.include_threads = include_threads
+        self._cache: Optional[List[ProcessInfo]] = None
+        self._cache_ts = 0.0
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def list_processes(self) -> List[ProcessInfo]:
-        """Return a list of :class:`ProcessInfo` for all running processes."""
+        """Return a list of :class:`ProcessInfo` for all running processes.
+
+        Results are cached for :attr:`cache_ttl` seconds; call
+        :meth:`invalidate` to force a fresh walk.
+        """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self.cache_ttl:
+            return self._cache
+        self._cache = self._refresh()
+        self._cache_ts = now
+        return self._cache
+
+    def invalidate(self) -> None:
+        """Discard the cached process list."""
+        self._cache = None
+
+    def _refresh(self) -> List[ProcessInfo]:
         result: List[ProcessInfo] = []
-        for proc in psutil.process_iter(
-            ["pid", "name", "status", "cpu_percent", "memory_info", "num_threads"]
-        ):
+        append = result.append
+        include_threads = self.include_threads
+        # process_iter() reads every requested attribute inside
+        # Process.oneshot(), so each one here is served from the same batch.
+        # It also maps AccessDenied on a single attribute to None instead of
+        # dropping the process, which calling the getters directly would not.
+        attrs = ["pid", "name", "status", "cpu_percent", "memory_info"]
+        if include_threads:
+            attrs.append("num_threads")
+        for proc in psutil.process_iter(attrs):
             try:
                 info = proc.info
-                mem_mb = (
-                    round(info["memory_info"].rss / 1e6, 1)
-                    if info.get("memory_info")
-                    else 0.0
-                )
-                result.append(
+                # Every requested key is always present, so index directly
+                # and read each one exactly once.
+                mem = info["memory_info"]
+                append(
                     ProcessInfo(
-                        pid=info["pid"],
-                        name=info["name"] or "<unknown>",
-                        status=info["status"] or "unknown",
-                        cpu_percent=info.get("cpu_percent") or 0.0,
-                        memory_mb=mem_mb,
-                        num_threads=info.get("num_threads") or 0,
+                        info["pid"],
+                        info["name"] or "<unknown>",
+                        info["status"] or "unknown",
+                        info["cpu_percent"] or 0.0,
+                        round(mem.rss / 1e6, 1) if mem else 0.0,
+                        (info["num_threads"] or 0) if include_threads else 0,
                     )
                 )
             except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -80,7 +117,35 @@ class ProcessManager:
     def find_by_name(self, name: str) -> List[ProcessInfo]:
         """Return all processes whose name contains *name* (case-insensitive)."""
         name_lower = name.lower()
-        return [p for p in self.list_processes() if name_lower in p.name.lower()]
+        if self._cache is not None and time.monotonic() - self._cache_ts < self.cache_ttl:
+            return [p for p in self._cache if name_lower in p.name.lower()]
+
+        # Filter on the name first so the remaining attributes are only
+        # read for the (usually few) matching processes.
+        attrs = ["status", "cpu_percent", "memory_info"]
+        if self.include_threads:
+            attrs.append("num_threads")
+        result: List[ProcessInfo] = []
+        for proc in psutil.process_iter(["pid", "name"]):
+            try:
+                pname = proc.info["name"]
+                if not pname or name_lower not in pname.lower():
+                    continue
+                info = proc.as_dict(attrs)
+                mem = info.get("memory_info")
+                result.append(
+                    ProcessInfo(
+                        pid=proc.info["pid"],
+                        name=pname,
+                        status=info.get("status") or "unknown",
+                        cpu_percent=info.get("cpu_percent") or 0.0,
+                        memory_mb=round(mem.rss / 1e6, 1) if mem else 0.0,
+                        num_threads=info.get("num_threads") or 0,
+                    )
+                )
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return result
 
     def high_cpu_processes(
         self, processes: Optional[List[ProcessInfo]] = None
@@ -105,6 +170,7 @@ class ProcessManager:
         try:
             proc = psutil.Process(pid)
             proc.terminate()
+            self.invalidate()
             logger.info("Terminated PID %d (%s)", pid, proc.name())
             return True
         except psutil.NoSuchProcess:
@@ -118,11 +184,23 @@ class ProcessManager:
         """Return a human-readable summary of process statistics."""
         procs = processes if processes is not None else self.list_processes()
         total = len(procs)
-        running = sum(1 for p in procs if p.status == "running")
-        sleeping = sum(1 for p in procs if p.status == "sleeping")
-        zombie = sum(1 for p in procs if p.status == "zombie")
-        high_cpu = self.high_cpu_processes(procs)
-        high_mem = self.high_memory_processes(procs)
+        running = sleeping = zombie = 0
+        high_cpu: List[ProcessInfo] = []
+        high_mem: List[ProcessInfo] = []
+        cpu_threshold = self.cpu_threshold
+        memory_threshold_mb = self.memory_threshold_mb
+        for p in procs:
+            status = p.status
+            if status == "running":
+                running += 1
+            elif status == "sleeping":
+                sleeping += 1
+            elif status == "zombie":
+                zombie += 1
+            if p.cpu_percent >= cpu_threshold:
+                high_cpu.append(p)
+            if p.memory_mb >= memory_threshold_mb:
+                high_mem.append(p)
 
         lines = [
             f"=== Process Summary (total: {total}) ===",
@@ -14,6 +14,7 @@ frozen application cannot block the AI Helper.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import platform
@@ -21,9 +22,12 @@ import shlex
 import shutil
 import signal
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import psutil
 
@@ -54,8 +58,8 @@ class LaunchResult:
 class CommunicateResult:
     command: str
     returncode: Optional[int]
-    stdout: str
-    stderr: str
+    stdout: Union[str, bytes]
+    stderr: Union[str, bytes]
     timed_out: bool = False
 
     def __str__(self) -> str:
@@ -78,6 +82,167 @@ class AppInfo:
         return f"{self.name} ({self.path})"
 
 
+# ---------------------------------------------------------------------------
+# Directory walking
+# ---------------------------------------------------------------------------
+
+
+# FindFirstFileExW constants (minwinbase.h / winnt.h).
+_FIND_EX_INFO_BASIC = 1
+_FIND_EX_SEARCH_NAME_MATCH = 0
+_FIND_FIRST_EX_LARGE_FETCH = 2
+_FILE_ATTRIBUTE_DIRECTORY = 0x10
+_FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+
+@lru_cache(maxsize=1)
+def _win_find_api():
+    """Return the ``kernel32`` find functions, or ``None`` if unavailable."""
+    try:
+        import ctypes  # noqa: PLC0415
+        from ctypes import wintypes  # noqa: PLC0415
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+    except (ImportError, AttributeError, OSError):
+        return None
+    find_first = kernel32.FindFirstFileExW
+    find_first.argtypes = [
+        wintypes.LPCWSTR, ctypes.c_int, ctypes.c_void_p,
+        ctypes.c_int, ctypes.c_void_p, wintypes.DWORD,
+    ]
+    find_first.restype = wintypes.HANDLE
+    find_next = kernel32.FindNextFileW
+    find_next.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+    find_next.restype = wintypes.BOOL
+    find_close = kernel32.FindClose
+    find_close.argtypes = [wintypes.HANDLE]
+    find_close.restype = wintypes.BOOL
+    invalid = ctypes.c_void_p(-1).value
+    return ctypes, wintypes.WIN32_FIND_DATAW, find_first, find_next, find_close, invalid
+
+
+def _scandir_iter_dir(path: str) -> Iterator[Tuple[str, bool]]:
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            yield entry.name, is_dir
+
+
+def _win_iter_dir(path: str) -> Iterator[Tuple[str, bool]]:
+    """Yield ``(name, is_dir)`` using ``FindFirstFileExW`` with large fetch.
+
+    ``FIND_FIRST_EX_LARGE_FETCH`` lets the kernel return far more entries
+    per round-trip than the plain ``FindFirstFileW`` used by
+    :func:`os.scandir`, and ``FindExInfoBasic`` skips the 8.3 short name.
+    Reparse-point directories (symlinks, junctions) are reported as files
+    so walks never loop through them.
+    """
+    api = _win_find_api()
+    if api is None:
+        yield from _scandir_iter_dir(path)
+        return
+    ctypes, find_data_t, find_first, find_next, find_close, invalid = api
+    data = find_data_t()
+    handle = find_first(
+        os.path.join(path, "*"), _FIND_EX_INFO_BASIC, ctypes.byref(data),
+        _FIND_EX_SEARCH_NAME_MATCH, None, _FIND_FIRST_EX_LARGE_FETCH,
+    )
+    if handle is None or handle == invalid:
+        err = ctypes.get_last_error()
+        raise OSError(err, ctypes.FormatError(err), path)  # type: ignore[attr-defined]
+    try:
+        while True:
+            name = data.cFileName
+            if name != "." and name != "..":
+                attrs = data.dwFileAttributes
+                yield name, (
+                    attrs & _FILE_ATTRIBUTE_DIRECTORY != 0
+                    and attrs & _FILE_ATTRIBUTE_REPARSE_POINT == 0
+                )
+            if not find_next(handle, ctypes.byref(data)):
+                break
+    finally:
+        find_close(handle)
+
+
+# Directory lister for the installed-app walk: the native bulk API on
+# Windows, os.scandir elsewhere.
+_iter_dir = _win_iter_dir if _SYSTEM == "Windows" else _scandir_iter_dir
+
+
+def _scandir_exes(root: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(name, path)`` for every ``.exe`` below *root*.
+
+    An iterative walk over :func:`_iter_dir`: entry types come straight
+    from the directory listing, so no per-entry ``stat`` or
+    :class:`~pathlib.Path` is needed, and the ``.exe`` suffix is checked on
+    the bare name before any path is joined.  Unreadable directories are
+    skipped and directory symlinks are not followed.
+    """
+    join = os.path.join
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            for name, is_dir in _iter_dir(current):
+                if is_dir:
+                    stack.append(join(current, name))
+                elif name[-4:].lower() == ".exe":
+                    yield name, join(current, name)
+        except OSError:
+            continue
+
+
+def _argv(command: Union[str, Sequence[str]], args: Optional[List[str]]) -> Tuple[List[str], str]:
+    """Return ``(argv, display)`` for *command* plus *args*.
+
+    Strings are tokenised with :func:`shlex.split`; a pre-built argv
+    sequence is used as-is so programmatic callers skip the tokenizer.
+    """
+    if isinstance(command, str):
+        return shlex.split(command) + (args or []), command
+    argv = list(command) + (args or [])
+    return argv, shlex.join(command)
+
+
+def _collect_exes(root: str) -> List[Tuple[str, str]]:
+    return list(_scandir_exes(root))
+
+
+def _path_roots() -> List[str]:
+    return [d for d in os.environ.get("PATH", "").split(os.pathsep) if d]
+
+
+def _applications_roots() -> List[str]:
+    return ["/Applications"]
+
+
+def _program_files_roots() -> List[str]:
+    return [
+        os.environ.get("PROGRAMFILES", r"C:\Program Files"),
+        os.environ.get("PROGRAMFILES(X86)", r"C:\Program Files (x86)"),
+    ]
+
+
+# Platform scanner for list_installed(), and the directories it reads,
+# resolved once since _SYSTEM is fixed at import.  The roots are functions
+# so environment changes (PATH, PROGRAMFILES) are still picked up.
+_LIST_INSTALLED: Optional[str] = {
+    "Linux": "_list_installed_linux",
+    "Darwin": "_list_installed_macos",
+    "Windows": "_list_installed_windows",
+}.get(_SYSTEM)
+_INSTALLED_ROOTS: Optional[Callable[[], List[str]]] = {
+    "Linux": _path_roots,
+    "Darwin": _applications_roots,
+    "Windows": _program_files_roots,
+}.get(_SYSTEM)
+_INSTALLED_TTL = 3600.0   # seconds a list_installed() result is trusted at most
+
+
 # ---------------------------------------------------------------------------
 # Core interactor
 # ---------------------------------------------------------------------------
@@ -90,10 +255,26 @@ class ProgramInteractor:
     ----------
     default_timeout:
         Default seconds to wait before ``communicate()`` times out.
+    cache_file:
+        Optional JSON file in which :meth:`list_installed` persists its
+        result between runs.  The in-memory cache is always used.
+    cache_ttl:
+        Maximum age in seconds of a cached :meth:`list_installed` result,
+        even if none of the watched directories changed.
     """
 
-    def __init__(self, default_timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        default_timeout: float = 30.0,
+        cache_file: Optional[Path] = None,
+        cache_ttl: float = _INSTALLED_TTL,
+    ) -> None:
         self.default_timeout = default_timeout
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl
+        # (fingerprint, apps, wall-clock scan time); wall clock so the age
+        # still means something when loaded from cache_file in a later run.
+        self._installed_cache: Optional[Tuple[tuple, List[AppInfo], float]] = None
 
     # ------------------------------------------------------------------
     # Launching
@@ -101,7 +282,7 @@ class ProgramInteractor:
 
     def launch(
         self,
-        command: str,
+        command: Union[str, Sequence[str]],
         args: Optional[List[str]] = None,
         cwd: Optional[str] = None,
         env: Optional[Dict[str, str]] = None,
@@ -112,7 +293,8 @@ class ProgramInteractor:
         Parameters
         ----------
         command:
-            Executable name or full path.
+            Command line string (split with :func:`shlex.split`), or a
+            ready-made argv list/tuple which is used without re-parsing.
         args:
             Additional arguments.
         cwd:
@@ -127,13 +309,16 @@ class ProgramInteractor:
         -------
         LaunchResult
         """
-        full_args = shlex.split(command) + (args or [])
-        merged_env = {**os.environ, **(env or {})}
-
-        kwargs: dict = {
-            "cwd": cwd,
-            "env": merged_env,
-        }
+        full_args, command = _argv(command, args)
+        kwargs: dict = {"cwd": cwd}
+        # env=None makes Popen inherit os.environ without copying it; only
+        # build a merged dict when there is something to add.
+        if env:
+            kwargs["env"] = {**os.environ, **env}
+        if _SYSTEM != "Windows":
+            # Explicit so fd cleanup stays on the close_range()/posix_spawn
+            # fast path (no preexec_fn is ever passed).
+            kwargs["close_fds"] = True
         if detach:
             if _SYSTEM != "Windows":
                 kwargs["start_new_session"] = True
@@ -162,37 +347,46 @@ class ProgramInteractor:
 
     def communicate(
         self,
-        command: str,
+        command: Union[str, Sequence[str]],
         args: Optional[List[str]] = None,
-        input_data: Optional[str] = None,
+        input_data: Optional[Union[str, bytes]] = None,
         timeout: Optional[float] = None,
         cwd: Optional[str] = None,
+        binary: bool = False,
     ) -> CommunicateResult:
         """Run *command*, optionally send *input_data* and capture output.
 
         Parameters
         ----------
         command:
-            Executable name or full path.
+            Command line string (split with :func:`shlex.split`), or a
+            ready-made argv list/tuple which is used without re-parsing.
         args:
             Additional arguments.
         input_data:
-            Text to write to the process's stdin.
+            Text (or bytes in *binary* mode) to write to the process's stdin.
         timeout:
             Seconds before the process is killed (defaults to
             :attr:`default_timeout`).
         cwd:
             Working directory.
+        binary:
+            When ``True``, output is returned as raw ``bytes`` and never
+            decoded — cheaper for callers that parse large binary output
+            themselves.
         """
-        full_args = shlex.split(command) + (args or [])
+        full_args, command = _argv(command, args)
         timeout = timeout if timeout is not None else self.default_timeout
+        empty: Union[str, bytes] = b"" if binary else ""
+        if binary and isinstance(input_data, str):
+            input_data = input_data.encode()
 
         try:
             result = subprocess.run(  # noqa: S603
                 full_args,
                 input=input_data,
                 capture_output=True,
-                text=True,
+                text=not binary,
                 timeout=timeout,
                 cwd=cwd,
             )
@@ -204,14 +398,16 @@ class ProgramInteractor:
             )
         except subprocess.TimeoutExpired:
             logger.warning("Command %r timed out after %ss", command, timeout)
-            return CommunicateResult(command=command, returncode=None, stdout="", stderr="", timed_out=True)
+            return CommunicateResult(command=command, returncode=None, stdout=empty, stderr=empty, timed_out=True)
         except FileNotFoundError:
             msg = f"executable not found: {full_args[0]!r}"
             logger.error("communicate failed: %s", msg)
-            return CommunicateResult(command=command, returncode=-1, stdout="", stderr=msg)
+            return CommunicateResult(command=command, returncode=-1, stdout=empty,
+                                     stderr=msg.encode() if binary else msg)
         except OSError as exc:
             logger.error("communicate failed: %s", exc)
-            return CommunicateResult(command=command, returncode=-1, stdout="", stderr=str(exc))
+            return CommunicateResult(command=command, returncode=-1, stdout=empty,
+                                     stderr=str(exc).encode() if binary else str(exc))
 
     # ------------------------------------------------------------------
     # Discovery
@@ -237,14 +433,72 @@ class ProgramInteractor:
         * **Linux** – scans ``PATH`` for executables.
         * **macOS** – lists ``/Applications/*.app`` bundles.
         * **Windows** – lists entries in common ``Program Files`` directories.
+
+        The result is cached and reused until the modification time of one
+        of the scanned directories or their immediate subdirectories changes
+        (installers add or remove entries there), or it is older than
+        :attr:`cache_ttl` (to catch changes deeper in the tree).
         """
-        if _SYSTEM == "Linux":
-            return self._list_installed_linux()
-        if _SYSTEM == "Darwin":
-            return self._list_installed_macos()
-        if _SYSTEM == "Windows":
-            return self._list_installed_windows()
-        return []
+        fingerprint = self._installed_fingerprint()
+        if self._installed_cache is None and self.cache_file is not None:
+            self._installed_cache = self._load_installed_cache()
+        cached = self._installed_cache
+        if (
+            cached is not None
+            and cached[0] == fingerprint
+            and 0 <= time.time() - cached[2] < self.cache_ttl
+        ):
+            return list(cached[1])
+
+        method = getattr(self, _LIST_INSTALLED, None) if _LIST_INSTALLED else None
+        apps = method() if method is not None else []
+        self._installed_cache = (fingerprint, apps, time.time())
+        if self.cache_file is not None:
+            self._save_installed_cache(*self._installed_cache)
+        return list(apps)
+
+    def _installed_fingerprint(self) -> tuple:
+        """Modification times of the scanned roots and their subdirectories.
+
+        Installing into an existing vendor directory changes that
+        directory's mtime but not its parent's, so one level down is
+        included too.
+        """
+        fingerprint = []
+        for root in _INSTALLED_ROOTS() if _INSTALLED_ROOTS else ():
+            try:
+                fingerprint.append((root, os.stat(root).st_mtime_ns))
+                with os.scandir(root) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                            fingerprint.append((entry.path, mtime))
+            except OSError:
+                fingerprint.append((root, None))
+        return tuple(fingerprint)
+
+    def _load_installed_cache(self) -> Optional[Tuple[tuple, List[AppInfo], float]]:
+        try:
+            data = json.loads(Path(self.cache_file).read_text(encoding="utf-8"))
+            fingerprint = tuple((root, mtime) for root, mtime in data["fingerprint"])
+            apps = [AppInfo(name=name, path=path) for name, path in data["apps"]]
+            scanned_at = float(data.get("scanned_at", 0.0))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+        return fingerprint, apps, scanned_at
+
+    def _save_installed_cache(self, fingerprint: tuple, apps: List[AppInfo], scanned_at: float) -> None:
+        data = {
+            "fingerprint": [list(item) for item in fingerprint],
+            "apps": [[a.name, a.path] for a in apps],
+            "scanned_at": scanned_at,
+        }
+        try:
+            path = Path(self.cache_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data), encoding="utf-8")
+        except OSError as exc:
+            logger.debug("Could not write installed-apps cache: %s", exc)
 
     # ------------------------------------------------------------------
     # Signalling
@@ -279,18 +533,16 @@ class ProgramInteractor:
     def _list_installed_linux(self) -> List[AppInfo]:
         apps: List[AppInfo] = []
         seen: set = set()
-        for dir_str in os.environ.get("PATH", "").split(os.pathsep):
-            dir_path = Path(dir_str)
-            if not dir_path.is_dir():
-                continue
+        for dir_str in _path_roots():
             try:
-                for entry in dir_path.iterdir():
-                    if entry.name in seen:
-                        continue
-                    if entry.is_file() and os.access(entry, os.X_OK):
-                        seen.add(entry.name)
-                        apps.append(AppInfo(name=entry.name, path=str(entry)))
-            except PermissionError:
+                with os.scandir(dir_str) as it:
+                    for entry in it:
+                        if entry.name in seen:
+                            continue
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            seen.add(entry.name)
+                            apps.append(AppInfo(name=entry.name, path=entry.path))
+            except OSError:
                 continue
         return sorted(apps, key=lambda a: a.name.lower())
 
@@ -304,17 +556,29 @@ class ProgramInteractor:
         return sorted(apps, key=lambda a: a.name.lower())
 
     def _list_installed_windows(self) -> List[AppInfo]:
-        apps: List[AppInfo] = []
-        for base in [
-            os.environ.get("PROGRAMFILES", r"C:\Program Files"),
-            os.environ.get("PROGRAMFILES(X86)", r"C:\Program Files (x86)"),
-        ]:
-            base_path = Path(base)
-            if not base_path.is_dir():
-                continue
+        # Each vendor directory directly under Program Files is walked as an
+        # independent unit on a thread pool; both os.scandir and ctypes
+        # calls release the GIL while the OS enumerates, so cold-cache walks
+        # overlap.
+        found: List[Tuple[str, str]] = []
+        subdirs: List[str] = []
+        for base in _program_files_roots():
             try:
-                for exe in base_path.rglob("*.exe"):
-                    apps.append(AppInfo(name=exe.stem, path=str(exe)))
-            except PermissionError:
+                for name, is_dir in _iter_dir(base):
+                    if is_dir:
+                        subdirs.append(os.path.join(base, name))
+                    elif name[-4:].lower() == ".exe":
+                        found.append((name, os.path.join(base, name)))
+            except OSError:
                 continue
+        if len(subdirs) > 1:
+            workers = min(8, os.cpu_count() or 1, len(subdirs))
+            with ThreadPoolExecutor(max_workers=workers,
+                                    thread_name_prefix="ai-helper-scan") as pool:
+                for chunk in pool.map(_collect_exes, subdirs):
+                    found.extend(chunk)
+        else:
+            for sub in subdirs:
+                found.extend(_scandir_exes(sub))
+        apps = [AppInfo(name=name[:-4], path=path) for name, path in found]
         return sorted(apps, key=lambda a: a.name.lower())
@@ -7,20 +7,26 @@ runs, report generation) without relying on external cron or APScheduler.
 Each :class:`Task` specifies a callable and an interval; the
 :class:`TaskScheduler` runs them in a single daemon thread, catching and
 logging exceptions so one bad task never crashes the whole application.
+Pending runs are kept in a min-heap ordered by due time, so the thread
+sleeps until the next task is due instead of polling every task.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A named recurring task.
 
@@ -31,7 +37,9 @@ class Task:
     func:
         Zero-argument callable to invoke on each tick.
     interval:
-        Seconds between executions.
+        Seconds between executions.  Runs keep a fixed cadence from the
+        first due time; if a run overruns one or more slots, those slots
+        are skipped (counted in :attr:`missed_runs`) rather than queued.
     enabled:
         Set to ``False`` to pause without removing from the scheduler.
     """
@@ -44,13 +52,24 @@ class Task:
     error_count: int = field(default=0, init=False)
     last_run: Optional[float] = field(default=None, init=False)
     last_error: Optional[str] = field(default=None, init=False)
-    _next_run: float = field(default=0.0, init=False)
+    running: bool = field(default=False, init=False)
+    missed_runs: int = field(default=0, init=False)
+    _failing: int = field(default=0, init=False)  # consecutive errors
+    # Deadline in integer time.monotonic_ns() units: exact, and cheaper to
+    # compare as a heap key than floats.
+    _next_run_ns: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
-        self._next_run = time.monotonic() + self.interval
+        self._next_run_ns = time.monotonic_ns() + self._interval_ns()
 
-    def is_due(self) -> bool:
-        return self.enabled and time.monotonic() >= self._next_run
+    def _interval_ns(self) -> int:
+        # Derived on use: callers such as the orchestrator retune interval.
+        return int(self.interval * 1e9)
+
+    def is_due(self, now_ns: Optional[int] = None) -> bool:
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return self.enabled and now_ns >= self._next_run_ns
 
     def run(self) -> None:
         try:
@@ -58,15 +77,41 @@ class Task:
             self.run_count += 1
             self.last_run = time.time()
             self.last_error = None
+            self._failing = 0
         except Exception as exc:  # noqa: BLE001
             self.error_count += 1
-            self.last_error = str(exc)
-            logger.exception("Task %r raised an error", self.name)
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            self._failing += 1
+            # A task that keeps failing logs its traceback on failures 1, 2,
+            # 4, 8, ... of the streak instead of on every tick.
+            if self._failing & (self._failing - 1) == 0:
+                logger.exception("Task %r raised an error (%d in a row)",
+                                 self.name, self._failing)
+            else:
+                logger.debug("Task %r failed again: %s", self.name, self.last_error)
         finally:
-            self._next_run = time.monotonic() + self.interval
+            self._schedule_next(time.monotonic_ns())
+
+    def _schedule_next(self, now_ns: int) -> None:
+        interval_ns = self._interval_ns()
+        due_ns = self._next_run_ns
+        if interval_ns <= 0 or now_ns < due_ns:
+            # Zero interval, or run early by hand: restart the cadence.
+            self._next_run_ns = now_ns + interval_ns
+            return
+        missed = (now_ns - due_ns) // interval_ns
+        self.missed_runs += missed
+        self._next_run_ns = due_ns + (missed + 1) * interval_ns
+
 
+@lru_cache(maxsize=256)
+def _format_clock(ts: int) -> str:
+    # last_run only changes when a task runs, so repeated status renders
+    # hit the cache instead of localtime()/strftime().
+    return time.strftime("%H:%M:%S", time.localtime(ts))
 
-@dataclass
+
+@dataclass(slots=True)
 class TaskStatus:
     name: str
     interval: float
@@ -75,39 +120,52 @@ class TaskStatus:
     error_count: int
     last_run: Optional[float]
     last_error: Optional[str]
+    missed_runs: int = 0
 
     def __str__(self) -> str:
         status = "enabled" if self.enabled else "disabled"
-        last = (
-            time.strftime("%H:%M:%S", time.localtime(self.last_run))
-            if self.last_run
-            else "never"
-        )
+        last = _format_clock(int(self.last_run)) if self.last_run else "never"
+        missed = f"  missed={self.missed_runs}" if self.missed_runs else ""
         err = f"  last_error={self.last_error!r}" if self.last_error else ""
         return (
             f"[{self.name}] {status}  interval={self.interval:.0f}s  "
-            f"runs={self.run_count}  errors={self.error_count}  last_run={last}{err}"
+            f"runs={self.run_count}  errors={self.error_count}{missed}  last_run={last}{err}"
         )
 
 
 class TaskScheduler:
     """Run registered :class:`Task` objects on their configured intervals.
 
-    The scheduler runs in a single background daemon thread, sleeping for
-    at most *resolution* seconds between checks so it stays responsive
-    to newly added tasks or ``stop()`` calls.
+    A background daemon thread sleeps until the earliest pending run is
+    due, then hands due tasks to a small worker pool so one slow task never
+    delays its siblings.  Adding or enabling a task and ``stop()`` wake it
+    immediately, so there is no polling interval.  A task is not queued
+    again until its current run finishes.
 
     Parameters
     ----------
     resolution:
-        Seconds between internal schedule checks (default: 1 s).
+        Seconds granted per join attempt when stopping the background
+        thread (default: 1 s).
+    max_workers:
+        Size of the worker pool used by the background thread (default 4).
     """
 
-    def __init__(self, resolution: float = 1.0) -> None:
+    def __init__(self, resolution: float = 1.0, max_workers: int = 4) -> None:
         self.resolution = resolution
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
         self._tasks: Dict[str, Task] = {}
+        # (next_run_ns, seq, task) entries.  Removed, replaced or disabled tasks
+        # are left in place and discarded when they reach the top.
+        self._heap: List[Tuple[int, int, Task]] = []
+        self._seq = itertools.count()
+        self._stale = 0  # dead heap entries, see _retire()
         self._lock = threading.Lock()
-        self._stop_event = threading.Event()
+        # Signalled (under _lock) when a run becomes due earlier or on stop,
+        # so the sleeping thread re-reads the heap head atomically.
+        self._cv = threading.Condition(self._lock)
+        self._stopping = False
         self._thread: Optional[threading.Thread] = None
 
     # ------------------------------------------------------------------
@@ -140,18 +198,24 @@ class TaskScheduler:
             If ``True``, silently replace an existing task with the same name.
         """
         with self._lock:
-            if name in self._tasks and not replace:
+            old = self._tasks.get(name)
+            if old is not None and not replace:
                 raise ValueError(f"Task {name!r} already registered; use replace=True to overwrite")
             task = Task(name=name, func=func, interval=interval, enabled=enabled)
             self._tasks[name] = task
+            if old is not None:
+                self._retire(old)
+            if enabled:
+                self._push_and_wake(task)
             logger.debug("Registered task %r (interval=%ss)", name, interval)
             return task
 
     def remove(self, name: str) -> bool:
         """Unregister a task by name.  Returns ``True`` if it existed."""
         with self._lock:
-            if name in self._tasks:
-                del self._tasks[name]
+            task = self._tasks.pop(name, None)
+            if task is not None:
+                self._retire(task)
                 logger.debug("Removed task %r", name)
                 return True
             return False
@@ -159,33 +223,57 @@ class TaskScheduler:
     def enable(self, name: str) -> None:
         """Enable a paused task."""
         with self._lock:
-            self._tasks[name].enabled = True
+            task = self._tasks[name]
+            if not task.enabled:
+                task.enabled = True
+                self._push_and_wake(task)
 
     def disable(self, name: str) -> None:
         """Pause a task without removing it."""
         with self._lock:
-            self._tasks[name].enabled = False
+            task = self._tasks[name]
+            if task.enabled:
+                self._retire(task)
+                task.enabled = False
 
     def get(self, name: str) -> Optional[Task]:
         """Return a task by name, or *None*."""
-        with self._lock:
-            return self._tasks.get(name)
+        # A single dict lookup is atomic and _tasks is only mutated in place,
+        # so no lock is needed here.
+        return self._tasks.get(name)
 
     def status(self) -> List[TaskStatus]:
         """Return a :class:`TaskStatus` snapshot for every registered task."""
+        # Only the task list is copied under the lock; the snapshots are
+        # built afterwards so status polls don't hold up the dispatcher.
         with self._lock:
-            return [
-                TaskStatus(
-                    name=t.name,
-                    interval=t.interval,
-                    enabled=t.enabled,
-                    run_count=t.run_count,
-                    error_count=t.error_count,
-                    last_run=t.last_run,
-                    last_error=t.last_error,
-                )
-                for t in self._tasks.values()
-            ]
+            tasks = list(self._tasks.values())
+        return [
+            TaskStatus(
+                name=t.name,
+                interval=t.interval,
+                enabled=t.enabled,
+                run_count=t.run_count,
+                error_count=t.error_count,
+                last_run=t.last_run,
+                last_error=t.last_error,
+                missed_runs=t.missed_runs,
+            )
+            for t in tasks
+        ]
+
+    def iter_status(
+        self,
+    ) -> Iterator[Tuple[str, float, bool, int, int, Optional[float], Optional[str]]]:
+        """Yield ``(name, interval, enabled, run_count, error_count, last_run,
+        last_error)`` per task, for pollers that don't need
+        :class:`TaskStatus` objects.  The lock is not held while yielding.
+        """
+        with self._lock:
+            tasks = list(self._tasks.values())
+        for t in tasks:
+            yield (t.name, t.interval, t.enabled, t.run_count,
+                   t.error_count, t.last_run, t.last_error)
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -196,7 +284,12 @@ class TaskScheduler:
         if self._thread and self._thread.is_alive():
             logger.warning("Scheduler already running")
             return
-        self._stop_event.clear()
+        with self._lock:
+            self._stopping = False
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ai-helper-task"
+            )
         self._thread = threading.Thread(
             target=self._run, name="ai-helper-scheduler", daemon=True
         )
@@ -205,14 +298,21 @@ class TaskScheduler:
 
     def stop(self) -> None:
         """Stop the scheduler and wait for the background thread to exit."""
-        self._stop_event.set()
+        with self._cv:
+            self._stopping = True
+            self._cv.notify_all()
         if self._thread:
             self._thread.join(timeout=self.resolution * 3)
+        if self._pool is not None:
+            # Queued runs are dropped; a run already in progress finishes on
+            # its own rather than holding up shutdown.
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         logger.info("Task scheduler stopped")
 
     @property
     def running(self) -> bool:
-        return bool(self._thread and self._thread.is_alive() and not self._stop_event.is_set())
+        return bool(self._thread and self._thread.is_alive() and not self._stopping)
 
     # ------------------------------------------------------------------
     # Run once (useful for testing)
@@ -220,18 +320,116 @@ class TaskScheduler:
 
     def run_due(self) -> int:
         """Execute all currently due tasks synchronously.  Returns count run."""
-        due: List[Task] = []
         with self._lock:
-            due = [t for t in self._tasks.values() if t.is_due()]
+            due = self._pop_due(time.monotonic_ns())
         for task in due:
-            task.run()
+            self._run_task(task)
         return len(due)
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    def _retire(self, task: Task) -> None:
+        """Note that *task*'s heap entry is now dead.  Caller holds ``_lock``.
+
+        Dead entries are normally skipped when they reach the top, but if
+        many tasks are paused or removed the heap is rebuilt from the live
+        ones so it stays proportional to the enabled set.
+        """
+        if not task.enabled or task.running:
+            return  # no queued entry
+        self._stale += 1
+        if self._stale > 16 and 2 * self._stale > len(self._heap):
+            live = {
+                id(t): t
+                for t in (entry[2] for entry in self._heap)
+                if t is not task and t.enabled and self._tasks.get(t.name) is t
+            }
+            self._heap = [(t._next_run_ns, next(self._seq), t) for t in live.values()]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _push(self, task: Task) -> None:
+        """Queue *task* at its ``_next_run_ns``.  Caller holds ``_lock``."""
+        heapq.heappush(self._heap, (task._next_run_ns, next(self._seq), task))
+
+    def _push_and_wake(self, task: Task) -> None:
+        """Queue *task* and wake the thread if it is now the earliest run.
+
+        Caller holds ``_lock`` (required to notify ``_cv``).
+        """
+        self._push(task)
+        if self._heap[0][2] is task:
+            self._cv.notify()
+
+    def _run_task(self, task: Task) -> None:
+        """Run a popped *task* and queue its next run (worker side)."""
+        try:
+            task.run()
+        finally:
+            self._release(task)
+
+    def _release(self, task: Task) -> None:
+        """Mark a popped *task* idle and queue it again if still registered."""
+        with self._cv:
+            task.running = False
+            if task.enabled and self._tasks.get(task.name) is task:
+                self._push_and_wake(task)
+
+    def _dispatch(self, due: List[Task]) -> None:
+        """Hand popped tasks to the worker pool."""
+        pool = self._pool
+        for task in due:
+            try:
+                if pool is None:
+                    raise RuntimeError("scheduler stopped")
+                future = pool.submit(self._run_task, task)
+            except RuntimeError:  # pool shut down by stop()
+                self._release(task)
+                continue
+            # A run cancelled by stop() never reaches _run_task's cleanup.
+            future.add_done_callback(
+                lambda f, t=task: self._release(t) if f.cancelled() else None
+            )
+
+    def _pop_due(self, now_ns: int) -> List[Task]:
+        """Pop every live entry due by *now_ns*.  Caller holds ``_lock``."""
+        heap = self._heap
+        due: List[Task] = []
+        seen = set()
+        while heap and heap[0][0] <= now_ns:
+            task = heapq.heappop(heap)[2]
+            if not task.enabled or self._tasks.get(task.name) is not task:
+                self._stale = max(0, self._stale - 1)
+                continue
+            if id(task) in seen or task.running:
+                continue
+            seen.add(id(task))
+            if task._next_run_ns > now_ns:
+                # Rescheduled since it was queued (e.g. run directly).
+                self._push(task)
+                continue
+            task.running = True
+            due.append(task)
+        return due
+
     def _run(self) -> None:
-        while not self._stop_event.is_set():
-            self.run_due()
-            self._stop_event.wait(timeout=self.resolution)
+        while True:
+            with self._lock:
+                due = self._pop_due(time.monotonic_ns())
+            if due:
+                self._dispatch(due)
+            with self._cv:
+                if self._stopping:
+                    return
+                delay = (
+                    (self._heap[0][0] - time.monotonic_ns()) / 1e9 if self._heap else None
+                )
+                if delay is None or delay > 0:
+                    # Releases the GIL and blocks in a single futex /
+                    # semaphore wait until notified or the deadline passes;
+                    # there is no fd to drain and nothing to clean up.
+                    self._cv.wait(timeout=delay)
+                if self._stopping:
+                    return
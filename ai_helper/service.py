@@ -42,9 +42,12 @@ import platform
 import shutil
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape as xml_escape
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,123 @@ _DISPLAY_NAME = "AI Helper"
 _DESCRIPTION = "AI Helper – keeps the desktop running smooth, organised and communicating."
 
 
+# Service file templates; the constant parts are filled in here once and
+# only the per-instance paths and arguments are substituted.
+_SYSTEMD_UNIT_TEMPLATE = (
+    "[Unit]\n"
+    f"Description={_DESCRIPTION}\n"
+    "After=network.target\n"
+    "\n"
+    "[Service]\n"
+    "Type=simple\n"
+    "ExecStart={exec_start}\n"
+    "StandardOutput=append:{stdout_log}\n"
+    "StandardError=append:{stderr_log}\n"
+    "Restart=always\n"
+    "RestartSec=5s\n"
+    "\n"
+    "[Install]\n"
+    "WantedBy=default.target\n"
+)
+
+_LAUNCHD_PLIST_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"'
+    ' "http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n'
+    '<plist version="1.0">\n'
+    '<dict>\n'
+    '    <key>Label</key>\n'
+    f'    <string>com.{_SERVICE_NAME}</string>\n'
+    '    <key>ProgramArguments</key>\n'
+    '    <array>\n'
+    '{program_args}\n'
+    '    </array>\n'
+    '    <key>KeepAlive</key>\n'
+    '    <true/>\n'
+    '    <key>RunAtLoad</key>\n'
+    '    <true/>\n'
+    '    <key>StandardOutPath</key>\n'
+    '    <string>{stdout_log}</string>\n'
+    '    <key>StandardErrorPath</key>\n'
+    '    <string>{stderr_log}</string>\n'
+    '    <key>ThrottleInterval</key>\n'
+    '    <integer>5</integer>\n'
+    '</dict>\n'
+    '</plist>\n'
+)
+
+# Same task schtasks /SC ONLOGON /RL HIGHEST /DELAY 0001:00 would create,
+# plus restart-on-failure (1 min interval, up to 99 times).
+_WINDOWS_TASK_XML_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-16"?>\n'
+    '<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">\n'
+    '  <RegistrationInfo>\n'
+    f'    <Description>{xml_escape(_DESCRIPTION)}</Description>\n'
+    '  </RegistrationInfo>\n'
+    '  <Triggers>\n'
+    '    <LogonTrigger>\n'
+    '      <Enabled>true</Enabled>\n'
+    '      <Delay>PT1M</Delay>\n'
+    '    </LogonTrigger>\n'
+    '  </Triggers>\n'
+    '  <Principals>\n'
+    '    <Principal id="Author">\n'
+    '      <LogonType>InteractiveToken</LogonType>\n'
+    '      <RunLevel>HighestAvailable</RunLevel>\n'
+    '    </Principal>\n'
+    '  </Principals>\n'
+    '  <Settings>\n'
+    '    <RestartOnFailure>\n'
+    '      <Interval>PT1M</Interval>\n'
+    '      <Count>99</Count>\n'
+    '    </RestartOnFailure>\n'
+    '  </Settings>\n'
+    '  <Actions Context="Author">\n'
+    '    <Exec>\n'
+    '      <Command>powershell</Command>\n'
+    '      <Arguments>{arguments}</Arguments>\n'
+    '    </Exec>\n'
+    '  </Actions>\n'
+    '</Task>\n'
+)
+
+# (install, uninstall, status) method names for this platform, resolved
+# once since _SYSTEM is fixed at import.
+_PLATFORM_METHODS: Optional[Tuple[str, str, str]] = {
+    "Windows": ("_install_windows", "_uninstall_windows", "_status_windows"),
+    "Linux": ("_install_linux", "_uninstall_linux", "_status_linux"),
+    "Darwin": ("_install_macos", "_uninstall_macos", "_status_macos"),
+}.get(_SYSTEM)
+
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """:func:`shutil.which`, scanning ``PATH`` at most once per tool."""
+    return shutil.which(name)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a temp file and :func:`os.replace`.
+
+    Raw ``os.open``/``os.write`` skip the text-IO wrapper, and the rename
+    means the service manager never sees a half-written file.
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        os.unlink(tmp)
+        raise
+
+
 @dataclass
 class ServiceStatus:
     installed: bool
@@ -80,6 +200,9 @@ class ServiceManager:
     install_dir:
         The AI Helper install directory used for log paths.  Defaults to the
         value from :mod:`ai_helper.config`.
+    status_ttl:
+        Seconds a :meth:`status` result is reused before the platform tool
+        is queried again (default 2 s; ``0`` disables caching).
     """
 
     def __init__(
@@ -87,12 +210,15 @@ class ServiceManager:
         python_executable: Optional[str] = None,
         extra_args: Optional[List[str]] = None,
         install_dir: Optional[Path] = None,
+        status_ttl: float = 2.0,
     ) -> None:
         self.python = python_executable or sys.executable
         self.extra_args = extra_args or []
         from . import config as _cfg  # lazy to avoid circular at package init
         self.install_dir = install_dir or _cfg.get_install_dir()
         self.log_dir = self.install_dir / "Logs"
+        self.status_ttl = status_ttl
+        self._status_cache: Optional[Tuple[float, ServiceStatus]] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -104,14 +230,11 @@ class ServiceManager:
         Returns ``True`` on success, ``False`` on failure.
         """
         logger.info("Installing AI Helper service on %s…", _SYSTEM)
+        self._status_cache = None
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        if _SYSTEM == "Windows":
-            return self._install_windows()
-        if _SYSTEM == "Linux":
-            return self._install_linux()
-        if _SYSTEM == "Darwin":
-            return self._install_macos()
+        if _PLATFORM_METHODS is not None:
+            return getattr(self, _PLATFORM_METHODS[0])()
 
         logger.error("Auto-start not supported on %s", _SYSTEM)
         return False
@@ -122,90 +245,74 @@ class ServiceManager:
         Returns ``True`` on success, ``False`` on failure.
         """
         logger.info("Uninstalling AI Helper service on %s…", _SYSTEM)
+        self._status_cache = None
 
-        if _SYSTEM == "Windows":
-            return self._uninstall_windows()
-        if _SYSTEM == "Linux":
-            return self._uninstall_linux()
-        if _SYSTEM == "Darwin":
-            return self._uninstall_macos()
+        if _PLATFORM_METHODS is not None:
+            return getattr(self, _PLATFORM_METHODS[1])()
 
         logger.error("Auto-start not supported on %s", _SYSTEM)
         return False
 
     def status(self) -> ServiceStatus:
-        """Return the current installation and running status."""
-        if _SYSTEM == "Windows":
-            return self._status_windows()
-        if _SYSTEM == "Linux":
-            return self._status_linux()
-        if _SYSTEM == "Darwin":
-            return self._status_macos()
-        return ServiceStatus(installed=False, running=False, platform=_SYSTEM,
-                             details="Platform not supported.")
+        """Return the current installation and running status.
+
+        Results are reused for :attr:`status_ttl` seconds so repeated polls
+        don't spawn ``schtasks`` / ``systemctl`` / ``launchctl`` each time.
+        """
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now - cached[0] < self.status_ttl:
+            return cached[1]
+        if _PLATFORM_METHODS is not None:
+            result = getattr(self, _PLATFORM_METHODS[2])()
+        else:
+            result = ServiceStatus(installed=False, running=False, platform=_SYSTEM,
+                                   details="Platform not supported.")
+        self._status_cache = (now, result)
+        return result
 
     # ------------------------------------------------------------------
     # Windows – Task Scheduler
     # ------------------------------------------------------------------
 
-    def _cmd(self) -> str:
+    # The command line and generated files depend only on attributes fixed at
+    # construction, so each is built once per instance.
+
+    @cached_property
+    def _cmd_parts(self) -> List[str]:
+        return [self.python, "-m", "ai_helper", "--daemon"] + self.extra_args
+
+    @cached_property
+    def _cmd_str(self) -> str:
         """Return the full command string for the daemon."""
-        parts = [self.python, "-m", "ai_helper", "--daemon"] + self.extra_args
-        return " ".join(f'"{p}"' if " " in str(p) else str(p) for p in parts)
+        return " ".join(f'"{p}"' if " " in str(p) else str(p) for p in self._cmd_parts)
 
-    def _install_windows(self) -> bool:
+    @cached_property
+    def _windows_task_xml(self) -> str:
         stdout_log = self.log_dir / "ai-helper-stdout.log"
-        cmd = self._cmd()
         # Wrap in a PowerShell script so we can redirect output to a log file.
         ps_wrapper = (
             f"Start-Process -NoNewWindow -FilePath 'cmd.exe' "
-            f"-ArgumentList '/c {cmd} >> \"{stdout_log}\" 2>&1'"
+            f"-ArgumentList '/c {self._cmd_str} >> \"{stdout_log}\" 2>&1'"
+        )
+        arguments = f"-NonInteractive -WindowStyle Hidden -Command \"{ps_wrapper}\""
+        return _WINDOWS_TASK_XML_TEMPLATE.format(arguments=xml_escape(arguments))
+
+    def _install_windows(self) -> bool:
+        # The task definition, including restart-on-failure, is registered
+        # from XML in a single schtasks call.
+        xml_path = self.log_dir / "ai-helper-task.xml"
+        _atomic_write_bytes(xml_path, self._windows_task_xml.encode("utf-16"))
+        result = subprocess.run(  # noqa: S603
+            ["schtasks", "/Create", "/F", "/TN", _SERVICE_NAME, "/XML", str(xml_path)],
+            capture_output=True, text=True,
         )
-        schtasks_cmd = [
-            "schtasks", "/Create", "/F",
-            "/TN", _SERVICE_NAME,
-            "/TR", f"powershell -NonInteractive -WindowStyle Hidden -Command \"{ps_wrapper}\"",
-            "/SC", "ONLOGON",
-            "/RL", "HIGHEST",
-            "/DELAY", "0001:00",  # 1 minute after logon
-        ]
-        result = subprocess.run(schtasks_cmd, capture_output=True, text=True)  # noqa: S603
         if result.returncode == 0:
             logger.info("Task Scheduler task %r created.", _SERVICE_NAME)
-            # Also set it to restart on failure via XML – best effort
-            self._windows_set_restart_on_failure()
             return True
         logger.error("schtasks failed: %s", result.stderr.strip())
         return False
 
-    def _windows_set_restart_on_failure(self) -> None:
-        """Export, patch and re-import the task XML to add restart-on-failure."""
-        try:
-            export = subprocess.run(
-                ["schtasks", "/Query", "/TN", _SERVICE_NAME, "/XML"],
-                capture_output=True, text=True,
-            )  # noqa: S603
-            if export.returncode != 0:
-                return
-            xml = export.stdout
-            # Inject RestartOnFailure settings if not already present
-            if "RestartOnFailure" not in xml:
-                restart_xml = (
-                    "<RestartOnFailure>"
-                    "<Interval>PT1M</Interval>"
-                    "<Count>99</Count>"
-                    "</RestartOnFailure>"
-                )
-                xml = xml.replace("</Settings>", f"{restart_xml}</Settings>", 1)
-            xml_path = self.log_dir / "ai-helper-task.xml"
-            xml_path.write_text(xml, encoding="utf-8")
-            subprocess.run(
-                ["schtasks", "/Create", "/F", "/TN", _SERVICE_NAME, "/XML", str(xml_path)],
-                capture_output=True,
-            )  # noqa: S603
-        except Exception:  # noqa: BLE001
-            logger.debug("Could not patch task for restart-on-failure", exc_info=True)
-
     def _uninstall_windows(self) -> bool:
         result = subprocess.run(
             ["schtasks", "/Delete", "/F", "/TN", _SERVICE_NAME],
@@ -235,48 +342,51 @@ class ServiceManager:
     # Linux – systemd user service
     # ------------------------------------------------------------------
 
-    @property
+    @cached_property
     def _systemd_service_dir(self) -> Path:
         xdg = os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config"))
         return Path(xdg) / "systemd" / "user"
 
-    @property
+    @cached_property
     def _systemd_service_file(self) -> Path:
         return self._systemd_service_dir / f"{_SERVICE_NAME}.service"
 
-    def _install_linux(self) -> bool:
+    @cached_property
+    def _systemd_unit_text(self) -> str:
         stdout_log = self.log_dir / "ai-helper-stdout.log"
         stderr_log = self.log_dir / "ai-helper-stderr.log"
-        cmd_parts = [self.python, "-m", "ai_helper", "--daemon"] + self.extra_args
-        exec_start = " ".join(str(p) for p in cmd_parts)
-
-        unit = (
-            f"[Unit]\n"
-            f"Description={_DESCRIPTION}\n"
-            f"After=network.target\n"
-            f"\n"
-            f"[Service]\n"
-            f"Type=simple\n"
-            f"ExecStart={exec_start}\n"
-            f"StandardOutput=append:{stdout_log}\n"
-            f"StandardError=append:{stderr_log}\n"
-            f"Restart=always\n"
-            f"RestartSec=5s\n"
-            f"\n"
-            f"[Install]\n"
-            f"WantedBy=default.target\n"
+        exec_start = " ".join(str(p) for p in self._cmd_parts)
+        return _SYSTEMD_UNIT_TEMPLATE.format(
+            exec_start=exec_start, stdout_log=stdout_log, stderr_log=stderr_log,
         )
 
+    def _install_linux(self) -> bool:
         self._systemd_service_dir.mkdir(parents=True, exist_ok=True)
-        self._systemd_service_file.write_text(unit, encoding="utf-8")
-        logger.info("Wrote systemd unit → %s", self._systemd_service_file)
-
-        if shutil.which("systemctl"):
-            subprocess.run(["systemctl", "--user", "daemon-reload"], check=False)
-            result = subprocess.run(
-                ["systemctl", "--user", "enable", "--now", f"{_SERVICE_NAME}.service"],
-                capture_output=True, text=True,
-            )  # noqa: S603
+        unit = self._systemd_unit_text.encode("utf-8")
+        try:
+            old: Optional[bytes] = self._systemd_service_file.read_bytes()
+        except OSError:
+            old = None
+        # Only an existing unit whose content changed needs an explicit
+        # daemon-reload; see below.
+        changed = old is not None and old != unit
+        if old != unit:
+            _atomic_write_bytes(self._systemd_service_file, unit)
+            logger.info("Wrote systemd unit → %s", self._systemd_service_file)
+
+        if _which("systemctl"):
+            enable_cmd = ["systemctl", "--user", "enable", "--now", f"{_SERVICE_NAME}.service"]
+            # enable reloads the manager when it creates the symlinks, which
+            # covers a new unit.  An already-enabled unit whose file just
+            # changed needs an explicit daemon-reload up front; otherwise
+            # the reload only happens if enable fails, before one retry.
+            if changed:
+                subprocess.run(["systemctl", "--user", "daemon-reload"], check=False)
+            result = subprocess.run(enable_cmd, capture_output=True, text=True)  # noqa: S603
+            if result.returncode != 0:
+                if not changed:
+                    subprocess.run(["systemctl", "--user", "daemon-reload"], check=False)
+                result = subprocess.run(enable_cmd, capture_output=True, text=True)  # noqa: S603
             if result.returncode == 0:
                 logger.info("systemd service enabled and started.")
                 return True
@@ -289,23 +399,23 @@ class ServiceManager:
         return True  # File written successfully even if systemctl unavailable
 
     def _uninstall_linux(self) -> bool:
-        if shutil.which("systemctl"):
+        if _which("systemctl"):
             subprocess.run(
                 ["systemctl", "--user", "disable", "--now", f"{_SERVICE_NAME}.service"],
-                check=False, capture_output=True,
+                check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
             )
+        # disable reloads the manager itself; the stopped unit is dropped on
+        # the next reload, so no extra systemctl call after the unlink.
         if self._systemd_service_file.exists():
             self._systemd_service_file.unlink()
             logger.info("Removed %s", self._systemd_service_file)
-        if shutil.which("systemctl"):
-            subprocess.run(["systemctl", "--user", "daemon-reload"], check=False)
         return True
 
     def _status_linux(self) -> ServiceStatus:
         installed = self._systemd_service_file.exists()
         running = False
         details = str(self._systemd_service_file) if installed else "Unit file not found."
-        if installed and shutil.which("systemctl"):
+        if installed and _which("systemctl"):
             r = subprocess.run(
                 ["systemctl", "--user", "is-active", f"{_SERVICE_NAME}.service"],
                 capture_output=True, text=True,
@@ -319,51 +429,29 @@ class ServiceManager:
     # macOS – launchd user agent
     # ------------------------------------------------------------------
 
-    @property
+    @cached_property
     def _launchd_plist_dir(self) -> Path:
         return Path.home() / "Library" / "LaunchAgents"
 
-    @property
+    @cached_property
     def _launchd_plist_file(self) -> Path:
         return self._launchd_plist_dir / f"com.{_SERVICE_NAME}.plist"
 
-    def _install_macos(self) -> bool:
+    @cached_property
+    def _launchd_plist_text(self) -> str:
         stdout_log = self.log_dir / "ai-helper-stdout.log"
         stderr_log = self.log_dir / "ai-helper-stderr.log"
-        cmd_parts = [self.python, "-m", "ai_helper", "--daemon"] + self.extra_args
-        program_args = "\n".join(f"        <string>{p}</string>" for p in cmd_parts)
-
-        plist = (
-            '<?xml version="1.0" encoding="UTF-8"?>\n'
-            '<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"'
-            ' "http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n'
-            '<plist version="1.0">\n'
-            '<dict>\n'
-            f'    <key>Label</key>\n'
-            f'    <string>com.{_SERVICE_NAME}</string>\n'
-            f'    <key>ProgramArguments</key>\n'
-            f'    <array>\n'
-            f'{program_args}\n'
-            f'    </array>\n'
-            f'    <key>KeepAlive</key>\n'
-            f'    <true/>\n'
-            f'    <key>RunAtLoad</key>\n'
-            f'    <true/>\n'
-            f'    <key>StandardOutPath</key>\n'
-            f'    <string>{stdout_log}</string>\n'
-            f'    <key>StandardErrorPath</key>\n'
-            f'    <string>{stderr_log}</string>\n'
-            f'    <key>ThrottleInterval</key>\n'
-            f'    <integer>5</integer>\n'
-            '</dict>\n'
-            '</plist>\n'
+        program_args = "\n".join(f"        <string>{p}</string>" for p in self._cmd_parts)
+        return _LAUNCHD_PLIST_TEMPLATE.format(
+            program_args=program_args, stdout_log=stdout_log, stderr_log=stderr_log,
         )
 
+    def _install_macos(self) -> bool:
         self._launchd_plist_dir.mkdir(parents=True, exist_ok=True)
-        self._launchd_plist_file.write_text(plist, encoding="utf-8")
+        _atomic_write_bytes(self._launchd_plist_file, self._launchd_plist_text.encode("utf-8"))
         logger.info("Wrote launchd plist → %s", self._launchd_plist_file)
 
-        if shutil.which("launchctl"):
+        if _which("launchctl"):
             result = subprocess.run(
                 ["launchctl", "load", "-w", str(self._launchd_plist_file)],
                 capture_output=True, text=True,
@@ -375,10 +463,10 @@ class ServiceManager:
         return True  # Plist written even if launchctl not run
 
     def _uninstall_macos(self) -> bool:
-        if shutil.which("launchctl") and self._launchd_plist_file.exists():
+        if _which("launchctl") and self._launchd_plist_file.exists():
             subprocess.run(
                 ["launchctl", "unload", "-w", str(self._launchd_plist_file)],
-                check=False, capture_output=True,
+                check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
             )
         if self._launchd_plist_file.exists():
             self._launchd_plist_file.unlink()
@@ -389,7 +477,8 @@ class ServiceManager:
         installed = self._launchd_plist_file.exists()
         running = False
         details = str(self._launchd_plist_file) if installed else "Plist not found."
-        if shutil.which("launchctl"):
+        # No plist means nothing for launchctl to report; skip the fork.
+        if installed and _which("launchctl"):
             r = subprocess.run(
                 ["launchctl", "list", f"com.{_SERVICE_NAME}"],
                 capture_output=True, text=True,
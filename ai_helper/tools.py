@@ -15,10 +15,22 @@ Built-in tools cover:
 from __future__ import annotations
 
 import logging
-import traceback
+import os
+import shlex
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from .ai_integrations import AIAppRegistry, OllamaClient
+    from .gpu_monitor import GpuMonitor
+    from .monitor import SystemMonitor
+    from .process_manager import ProcessManager
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +40,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolParam:
     """Description of one parameter accepted by a :class:`Tool`."""
     name: str
@@ -38,7 +50,7 @@ class ToolParam:
     default: Any = None
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ToolResult:
     """The outcome of invoking a :class:`Tool`."""
     tool_name: str
@@ -52,8 +64,21 @@ class ToolResult:
             return self.output
         return f"[ERROR from {self.tool_name}] {self.error}"
 
+    def __repr__(self) -> str:
+        # Outputs and payloads can be whole files; keep log lines short.
+        data = self.data
+        if data is None:
+            data_repr = "None"
+        elif hasattr(data, "__len__"):
+            data_repr = f"<{type(data).__name__} len={len(data)}>"
+        else:
+            data_repr = f"<{type(data).__name__}>"
+        return (f"ToolResult({self.tool_name!r}, success={self.success}, "
+                f"output_len={len(self.output)}, error={self.error[:200]!r}, "
+                f"data={data_repr})")
 
-@dataclass
+
+@dataclass(slots=True)
 class Tool:
     """A named, typed capability that the agent can invoke."""
     name: str
@@ -61,31 +86,81 @@ class Tool:
     params: List[ToolParam]
     handler: Callable[..., ToolResult]
     category: str = "general"
+    # False for tools with side effects that must not overlap other calls;
+    # invoke_many() runs those serially.
+    is_concurrency_safe: bool = True
+    # Append the formatted traceback to error results (for debugging; the
+    # traceback is always logged either way).
+    include_traceback: bool = False
+    _required: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _description: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._required = frozenset(p.name for p in self.params if p.required)
 
     def invoke(self, **kwargs: Any) -> ToolResult:
         """Validate required params then call the handler."""
-        for p in self.params:
-            if p.required and p.name not in kwargs:
-                return ToolResult(
-                    tool_name=self.name, success=False, output="",
-                    error=f"Missing required parameter: {p.name!r}",
-                )
+        missing = self._required - kwargs.keys()
+        if missing:
+            # Report the first missing parameter in declaration order.
+            first = next(p.name for p in self.params if p.name in missing)
+            return ToolResult(
+                tool_name=self.name, success=False, output="",
+                error=f"Missing required parameter: {first!r}",
+            )
         try:
             return self.handler(**kwargs)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Tool %r raised an exception", self.name)
+            error = f"{type(exc).__name__}: {exc}"
+            if self.include_traceback:
+                import traceback  # noqa: PLC0415
+                error += "\n" + traceback.format_exc()
             return ToolResult(
-                tool_name=self.name, success=False, output="",
-                error=f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}",
+                tool_name=self.name, success=False, output="", error=error,
             )
 
     def describe(self) -> str:
         """Return a compact human-readable description for LLM prompts."""
-        params_str = ", ".join(
-            f"{p.name}: {p.type}{'?' if not p.required else ''}"
-            for p in self.params
-        )
-        return f"{self.name}({params_str}) — {self.description}"
+        if self._description is None:
+            self._description = _describe(self.name, self.params, self.description)
+        return self._description
+
+
+def _describe(name: str, params: List[ToolParam], description: str) -> str:
+    params_str = ", ".join(
+        f"{p.name}: {p.type}{'?' if not p.required else ''}"
+        for p in params
+    )
+    return f"{name}({params_str}) — {description}"
+
+
+@dataclass(frozen=True)
+class _ToolSpec:
+    """Declaration of a built-in tool; turned into a :class:`Tool` on first use."""
+    name: str
+    description: str
+    params: Tuple[ToolParam, ...]
+    handler: Callable[..., ToolResult]
+    category: str
+    is_concurrency_safe: bool = True
+
+    def build(self) -> Tool:
+        return Tool(name=self.name, description=self.description,
+                    params=list(self.params), handler=self.handler,
+                    category=self.category,
+                    is_concurrency_safe=self.is_concurrency_safe)
+
+    @cached_property
+    def _description(self) -> str:
+        return _describe(self.name, list(self.params), self.description)
+
+    def describe(self) -> str:
+        return self._description
+
+
+# Built-in tools in declaration order, filled by @_builtin below.
+_BUILTIN_SPECS: Dict[str, _ToolSpec] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -105,8 +180,13 @@ class ToolRegistry:
 
     def __init__(self, register_defaults: bool = True) -> None:
         self._tools: Dict[str, Tool] = {}
-        if register_defaults:
-            _register_builtin_tools(self)
+        # Built-ins not yet looked up; each becomes a Tool on first use.
+        self._lazy: Dict[str, _ToolSpec] = dict(_BUILTIN_SPECS) if register_defaults else {}
+        # describe_all() text and all tools sorted by (category, name);
+        # both are cleared whenever the set of tools changes.
+        self._catalogue: Optional[str] = None
+        self._sorted: Optional[Tuple[Tool, ...]] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     # ------------------------------------------------------------------
     # Registration
@@ -114,15 +194,22 @@ class ToolRegistry:
 
     def register(self, tool: Tool) -> None:
         """Add *tool* to the registry, replacing any existing tool with the same name."""
+        self._lazy.pop(tool.name, None)
         self._tools[tool.name] = tool
+        self._invalidate()
         logger.debug("Registered tool %r", tool.name)
 
     def unregister(self, name: str) -> bool:
         """Remove a tool by name.  Returns ``True`` if it existed."""
-        if name in self._tools:
-            del self._tools[name]
-            return True
-        return False
+        found = self._lazy.pop(name, None) is not None
+        found = self._tools.pop(name, None) is not None or found
+        if found:
+            self._invalidate()
+        return found
+
+    def _invalidate(self) -> None:
+        self._catalogue = None
+        self._sorted = None
 
     # ------------------------------------------------------------------
     # Lookup / listing
@@ -130,21 +217,40 @@ class ToolRegistry:
 
     def get(self, name: str) -> Optional[Tool]:
         """Return the named tool, or *None*."""
-        return self._tools.get(name)
+        tool = self._tools.get(name)
+        if tool is None:
+            spec = self._lazy.pop(name, None)
+            if spec is not None:
+                tool = self._tools[name] = spec.build()
+        return tool
+
+    def _names(self) -> List[str]:
+        return [*self._tools, *self._lazy]
 
     def list_tools(self, category: Optional[str] = None) -> List[Tool]:
         """Return all registered tools, optionally filtered by category."""
-        tools = list(self._tools.values())
+        if self._sorted is None:
+            for name in list(self._lazy):
+                self.get(name)
+            self._sorted = tuple(sorted(self._tools.values(),
+                                        key=lambda t: (t.category, t.name)))
         if category:
-            tools = [t for t in tools if t.category == category]
-        return sorted(tools, key=lambda t: (t.category, t.name))
+            return [t for t in self._sorted if t.category == category]
+        return list(self._sorted)
 
     def describe_all(self) -> str:
         """Return a formatted tool catalogue for use in LLM system prompts."""
+        if self._catalogue is not None:
+            return self._catalogue
+        # Pending built-ins are described from their specs, without being
+        # turned into Tool objects.
+        entries = [*self._tools.values(), *self._lazy.values()]
+        entries.sort(key=lambda t: (t.category, t.name))
         lines: List[str] = ["Available tools:"]
-        for tool in self.list_tools():
-            lines.append(f"  {tool.describe()}")
-        return "\n".join(lines)
+        for entry in entries:
+            lines.append(f"  {entry.describe()}")
+        self._catalogue = "\n".join(lines)
+        return self._catalogue
 
     # ------------------------------------------------------------------
     # Invocation
@@ -155,15 +261,70 @@ class ToolRegistry:
 
         Returns an error :class:`ToolResult` if the tool is not found.
         """
-        tool = self._tools.get(name)
+        tool = self.get(name)
         if tool is None:
             return ToolResult(
                 tool_name=name, success=False, output="",
                 error=f"Unknown tool: {name!r}. "
-                      f"Available: {', '.join(sorted(self._tools))}",
+                      f"Available: {', '.join(sorted(self._names()))}",
             )
         return tool.invoke(**kwargs)
 
+    def invoke_many(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        timeout: Optional[float] = None,
+    ) -> List[ToolResult]:
+        """Invoke several tools at once and return their results in order.
+
+        Concurrency-safe tools run on a shared thread pool; the others run
+        one after another on the calling thread while the pool works.
+
+        Parameters
+        ----------
+        calls:
+            ``(tool_name, kwargs)`` pairs.
+        timeout:
+            Seconds to wait for each pooled call.  A call that is still
+            running when it expires yields an error result (the worker
+            thread is left to finish in the background).
+        """
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+        from concurrent.futures import TimeoutError as FutureTimeoutError  # noqa: PLC0415
+        results: List[Optional[ToolResult]] = [None] * len(calls)
+        pending: List[Tuple[int, str, Future]] = []
+        serial: List[Tuple[int, str, Dict[str, Any]]] = []
+        for i, (name, kwargs) in enumerate(calls):
+            tool = self.get(name)
+            if tool is not None and tool.is_concurrency_safe and len(calls) > 1:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=8, thread_name_prefix="ai-helper-tool"
+                    )
+                pending.append((i, name, self._pool.submit(tool.invoke, **kwargs)))
+            else:
+                serial.append((i, name, kwargs))
+        for i, name, kwargs in serial:
+            results[i] = self.invoke(name, **kwargs)
+        for i, name, future in pending:
+            try:
+                results[i] = future.result(timeout)
+            except FutureTimeoutError:
+                results[i] = ToolResult(
+                    tool_name=name, success=False, output="",
+                    error=f"Timed out after {timeout}s",
+                )
+        return results  # type: ignore[return-value]
+
+    async def ainvoke_many(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        timeout: Optional[float] = None,
+    ) -> List[ToolResult]:
+        """Run :meth:`invoke_many` without blocking the event loop."""
+        import asyncio  # noqa: PLC0415
+        return await asyncio.to_thread(self.invoke_many, calls, timeout)
+
 
 # ---------------------------------------------------------------------------
 # Built-in tool handlers
@@ -178,317 +339,376 @@ def _err(name: str, error: str) -> ToolResult:
     return ToolResult(tool_name=name, success=False, output="", error=error)
 
 
-def _register_builtin_tools(reg: ToolRegistry) -> None:
-    """Register all built-in tools into *reg*."""
+def _builtin(
+    *, name: str, description: str, params: List[ToolParam], category: str,
+    concurrency_safe: bool = True,
+) -> Callable[[Callable[..., ToolResult]], Callable[..., ToolResult]]:
+    """Declare the decorated function as the handler of built-in tool *name*."""
+    def decorator(handler: Callable[..., ToolResult]) -> Callable[..., ToolResult]:
+        _BUILTIN_SPECS[name] = _ToolSpec(name, description, tuple(params), handler,
+                                         category, concurrency_safe)
+        return handler
+    return decorator
 
-    # ------------------------------------------------------------------ #
-    # FILE TOOLS                                                           #
-    # ------------------------------------------------------------------ #
 
-    def _read_file(path: str) -> ToolResult:
-        from .file_system import FileReader  # noqa: PLC0415
-        try:
-            content = FileReader().read(Path(path))
-            return _ok("read_file", content, data={"path": path, "content": content})
-        except (FileNotFoundError, IsADirectoryError) as exc:
-            return _err("read_file", str(exc))
-
-    reg.register(Tool(
-        name="read_file",
-        description="Read the full text content of any file on disk.",
-        params=[ToolParam("path", "str", "Absolute or relative path to the file.")],
-        handler=_read_file,
-        category="files",
-    ))
-
-    def _write_file(path: str, content: str) -> ToolResult:
-        from .file_system import FileWriter  # noqa: PLC0415
-        written = FileWriter().write(Path(path), content)
-        return _ok("write_file", f"Wrote {len(content)} characters to {written}",
-                   data={"path": str(written)})
-
-    reg.register(Tool(
-        name="write_file",
-        description="Write text content to a file, creating it if needed (backs up the original).",
-        params=[
-            ToolParam("path", "str", "Destination file path."),
-            ToolParam("content", "str", "Text content to write."),
-        ],
-        handler=_write_file,
-        category="files",
-    ))
-
-    def _append_file(path: str, content: str) -> ToolResult:
-        from .file_system import FileWriter  # noqa: PLC0415
-        FileWriter().append(Path(path), content)
-        return _ok("append_file", f"Appended {len(content)} characters to {path}")
-
-    reg.register(Tool(
-        name="append_file",
-        description="Append text to the end of a file without overwriting it.",
-        params=[
-            ToolParam("path", "str", "File path."),
-            ToolParam("content", "str", "Text to append."),
-        ],
-        handler=_append_file,
-        category="files",
-    ))
-
-    def _search_files(query: str = "*", root: str = "",
-                      extensions: str = "", content: str = "") -> ToolResult:
-        from .file_system import FileSearcher  # noqa: PLC0415
-        searcher = FileSearcher(max_results=50)
-        root_path = Path(root) if root else None
-        ext_list = [e.strip() for e in extensions.split(",") if e.strip()] if extensions else None
-        matches = searcher.search(
-            name_pattern=query,
-            root=root_path,
-            extensions=ext_list,
-            content_keyword=content,
-        )
-        if not matches:
-            return _ok("search_files", "No files found matching the criteria.", data=[])
-        lines = [str(m) for m in matches]
-        return _ok("search_files", "\n".join(lines), data=[str(m.path) for m in matches])
-
-    reg.register(Tool(
-        name="search_files",
-        description="Search for files by name pattern, extension or text content.",
-        params=[
-            ToolParam("query", "str", "Filename glob pattern, e.g. '*.py' or 'report*'.",
-                      required=False, default="*"),
-            ToolParam("root", "str", "Directory to search (default: home directory).",
-                      required=False, default=""),
-            ToolParam("extensions", "str",
-                      "Comma-separated extensions to filter, e.g. '.py,.txt'.",
-                      required=False, default=""),
-            ToolParam("content", "str", "Keyword that must appear inside the file.",
-                      required=False, default=""),
-        ],
-        handler=_search_files,
-        category="files",
-    ))
-
-    def _list_directory(path: str = "") -> ToolResult:
-        target = Path(path) if path else Path.home()
-        if not target.exists():
-            return _err("list_directory", f"Path does not exist: {target}")
-        if target.is_file():
-            return _err("list_directory", f"Path is a file, not a directory: {target}")
-        entries = sorted(target.iterdir(), key=lambda p: (p.is_file(), p.name.lower()))
-        lines = []
-        for e in entries[:200]:
-            tag = "/" if e.is_dir() else ""
-            size = f"  {e.stat().st_size / 1024:.1f} KB" if e.is_file() else ""
-            lines.append(f"  {e.name}{tag}{size}")
-        return _ok("list_directory", f"Contents of {target}:\n" + "\n".join(lines),
-                   data=[str(e) for e in entries])
-
-    reg.register(Tool(
-        name="list_directory",
-        description="List the files and folders inside a directory.",
-        params=[ToolParam("path", "str", "Directory path (default: home).",
-                          required=False, default="")],
-        handler=_list_directory,
-        category="files",
-    ))
-
-    # ------------------------------------------------------------------ #
-    # PROGRAM TOOLS                                                        #
-    # ------------------------------------------------------------------ #
-
-    def _run_program(command: str, args: str = "", input_data: str = "",
-                     timeout: float = 30.0) -> ToolResult:
-        from .program_interactor import ProgramInteractor  # noqa: PLC0415
-        pi = ProgramInteractor(default_timeout=timeout)
-        arg_list = args.split() if args else []
-        result = pi.communicate(command, args=arg_list,
-                                input_data=input_data or None,
-                                timeout=timeout)
-        if result.timed_out:
-            return _err("run_program", f"Command timed out after {timeout}s")
-        combined = (result.stdout + result.stderr).strip()
-        success = result.returncode == 0
-        if success:
-            return _ok("run_program", combined or "(no output)",
-                       data={"returncode": result.returncode, "stdout": result.stdout,
-                             "stderr": result.stderr})
-        return ToolResult(
-            tool_name="run_program", success=False,
-            output=combined,
-            error=f"Exited with code {result.returncode}",
-            data={"returncode": result.returncode},
-        )
-
-    reg.register(Tool(
-        name="run_program",
-        description="Run any installed program and return its output.",
-        params=[
-            ToolParam("command", "str", "The executable name or full path."),
-            ToolParam("args", "str", "Space-separated arguments (optional).",
-                      required=False, default=""),
-            ToolParam("input_data", "str", "Text to send to the program's stdin.",
-                      required=False, default=""),
-            ToolParam("timeout", "float", "Seconds before giving up (default 30).",
-                      required=False, default=30.0),
-        ],
-        handler=_run_program,
-        category="programs",
-    ))
-
-    def _launch_program(command: str, args: str = "") -> ToolResult:
-        from .program_interactor import ProgramInteractor  # noqa: PLC0415
-        pi = ProgramInteractor()
-        arg_list = args.split() if args else []
-        result = pi.launch(command, args=arg_list, detach=True)
-        if result.success:
-            return _ok("launch_program", str(result), data={"pid": result.pid})
-        return _err("launch_program", result.error)
-
-    reg.register(Tool(
-        name="launch_program",
-        description="Launch an application in the background (detached, non-blocking).",
-        params=[
-            ToolParam("command", "str", "Executable name or path."),
-            ToolParam("args", "str", "Space-separated arguments.", required=False, default=""),
-        ],
-        handler=_launch_program,
-        category="programs",
-    ))
-
-    def _list_programs(name_filter: str = "") -> ToolResult:
-        from .process_manager import ProcessManager  # noqa: PLC0415
-        pm = ProcessManager()
-        if name_filter:
-            procs = pm.find_by_name(name_filter)
-        else:
-            procs = pm.list_processes()
-        summary = pm.summary(procs)
-        top = sorted(procs, key=lambda p: p.cpu_percent, reverse=True)[:20]
-        lines = [f"  PID {p.pid:6d}  CPU {p.cpu_percent:5.1f}%  "
-                 f"MEM {p.memory_mb:6.0f} MB  {p.name}"
-                 for p in top]
-        output = summary + "\n\nTop processes by CPU:\n" + "\n".join(lines)
-        return _ok("list_programs", output, data=[{"pid": p.pid, "name": p.name} for p in top])
-
-    reg.register(Tool(
-        name="list_programs",
-        description="List running programs / processes, optionally filtered by name.",
-        params=[ToolParam("name_filter", "str", "Filter by program name (optional).",
-                          required=False, default="")],
-        handler=_list_programs,
-        category="programs",
-    ))
-
-    # ------------------------------------------------------------------ #
-    # SYSTEM TOOLS                                                         #
-    # ------------------------------------------------------------------ #
-
-    def _system_snapshot() -> ToolResult:
-        from .monitor import SystemMonitor  # noqa: PLC0415
-        mon = SystemMonitor()
-        snap = mon.snapshot()
-        text = mon.format_snapshot(snap)
-        alerts = mon.alerts(snap)
-        if alerts:
-            text += "\n\nAlerts:\n" + "\n".join(f"  ⚠ {a}" for a in alerts)
-        return _ok("system_snapshot", text, data={
-            "cpu_percent": snap.cpu_percent,
-            "memory_percent": snap.memory_percent,
-        })
-
-    reg.register(Tool(
-        name="system_snapshot",
-        description="Get current CPU, memory and disk usage with any active alerts.",
-        params=[],
-        handler=_system_snapshot,
-        category="system",
-    ))
-
-    def _gpu_stats() -> ToolResult:
-        from .gpu_monitor import GpuMonitor  # noqa: PLC0415
-        gpu = GpuMonitor()
-        snaps = gpu.snapshots()
-        text = gpu.format_snapshots(snaps)
-        alerts = gpu.alerts(snaps)
-        if alerts:
-            text += "\n\nAlerts:\n" + "\n".join(f"  ⚠ {a}" for a in alerts)
-        return _ok("gpu_stats", text, data=[{
-            "index": s.index, "name": s.name,
-            "vram_percent": s.vram_percent, "temperature_c": s.temperature_c,
-        } for s in snaps])
-
-    reg.register(Tool(
-        name="gpu_stats",
-        description="Get NVIDIA GPU VRAM, temperature, utilisation and per-process memory.",
-        params=[],
-        handler=_gpu_stats,
-        category="system",
-    ))
-
-    # ------------------------------------------------------------------ #
-    # AI TOOLS                                                             #
-    # ------------------------------------------------------------------ #
-
-    def _list_ai_apps() -> ToolResult:
-        from .ai_integrations import AIAppRegistry  # noqa: PLC0415
-        registry = AIAppRegistry(timeout=2.0)
-        statuses = registry.discover()
-        text = registry.format_status(statuses)
-        return _ok("list_ai_apps", text,
-                   data=[{"name": s.name, "running": s.running} for s in statuses])
-
-    reg.register(Tool(
-        name="list_ai_apps",
-        description="Discover all known AI programs (Ollama, ComfyUI, LM Studio, etc.) and show which are running.",
-        params=[],
-        handler=_list_ai_apps,
-        category="ai",
-    ))
-
-    def _ask_ollama(prompt: str, model: str = "llama3",
-                    url: str = "http://localhost:11434") -> ToolResult:
-        from .ai_integrations import OllamaClient  # noqa: PLC0415
-        client = OllamaClient(base_url=url)
+# ---------------------------------------------------------------------------
+# Shared backends
+# ---------------------------------------------------------------------------
+
+# Created on first use and then shared by every registry in the process, so
+# state they keep between calls (process-list cache, primed CPU counters,
+# NVML handle) survives from one tool call to the next.
+
+
+@lru_cache(maxsize=1)
+def _process_manager() -> ProcessManager:
+    from .process_manager import ProcessManager  # noqa: PLC0415
+    return ProcessManager()
+
+
+@lru_cache(maxsize=1)
+def _system_monitor() -> SystemMonitor:
+    from .monitor import SystemMonitor  # noqa: PLC0415
+    return SystemMonitor()
+
+
+@lru_cache(maxsize=1)
+def _gpu_monitor() -> GpuMonitor:
+    from .gpu_monitor import GpuMonitor  # noqa: PLC0415
+    return GpuMonitor()
+
+
+@lru_cache(maxsize=1)
+def _ai_app_registry() -> AIAppRegistry:
+    from .ai_integrations import AIAppRegistry  # noqa: PLC0415
+    return AIAppRegistry(timeout=2.0)
+
+
+@lru_cache(maxsize=8)
+def _ollama_client(url: str) -> OllamaClient:
+    from .ai_integrations import OllamaClient  # noqa: PLC0415
+    return OllamaClient(base_url=url)
+
+
+# ---------------------------------------------------------------------------
+# Built-in tools: files
+# ---------------------------------------------------------------------------
+
+
+@_builtin(
+    name="read_file",
+    description="Read the full text content of any file on disk.",
+    params=[ToolParam("path", "str", "Absolute or relative path to the file.")],
+    category="files",
+)
+def _read_file(path: str) -> ToolResult:
+    from .file_system import FileReader  # noqa: PLC0415
+    try:
+        content = FileReader().read(Path(path))
+        return _ok("read_file", content, data={"path": path, "content": content})
+    except (FileNotFoundError, IsADirectoryError) as exc:
+        return _err("read_file", str(exc))
+
+
+@_builtin(
+    name="write_file",
+    description="Write text content to a file, creating it if needed (backs up the original).",
+    params=[
+        ToolParam("path", "str", "Destination file path."),
+        ToolParam("content", "str", "Text content to write."),
+    ],
+    category="files",
+    concurrency_safe=False,
+)
+def _write_file(path: str, content: str) -> ToolResult:
+    from .file_system import FileWriter  # noqa: PLC0415
+    written = FileWriter().write(Path(path), content)
+    return _ok("write_file", f"Wrote {len(content)} characters to {written}",
+               data={"path": str(written)})
+
+
+@_builtin(
+    name="append_file",
+    description="Append text to the end of a file without overwriting it.",
+    params=[
+        ToolParam("path", "str", "File path."),
+        ToolParam("content", "str", "Text to append."),
+    ],
+    category="files",
+    concurrency_safe=False,
+)
+def _append_file(path: str, content: str) -> ToolResult:
+    from .file_system import FileWriter  # noqa: PLC0415
+    FileWriter().append(Path(path), content)
+    return _ok("append_file", f"Appended {len(content)} characters to {path}")
+
+
+@_builtin(
+    name="search_files",
+    description="Search for files by name pattern, extension or text content.",
+    params=[
+        ToolParam("query", "str", "Filename glob pattern, e.g. '*.py' or 'report*'.",
+                  required=False, default="*"),
+        ToolParam("root", "str", "Directory to search (default: home directory).",
+                  required=False, default=""),
+        ToolParam("extensions", "str",
+                  "Comma-separated extensions to filter, e.g. '.py,.txt'.",
+                  required=False, default=""),
+        ToolParam("content", "str", "Keyword that must appear inside the file.",
+                  required=False, default=""),
+    ],
+    category="files",
+)
+def _search_files(query: str = "*", root: str = "",
+                  extensions: str = "", content: str = "") -> ToolResult:
+    from .file_system import FileSearcher  # noqa: PLC0415
+    searcher = FileSearcher(max_results=50)
+    root_path = Path(root) if root else None
+    ext_list = [e.strip() for e in extensions.split(",") if e.strip()] if extensions else None
+    matches = searcher.search(
+        name_pattern=query,
+        root=root_path,
+        extensions=ext_list,
+        content_keyword=content,
+    )
+    if not matches:
+        return _ok("search_files", "No files found matching the criteria.", data=[])
+    lines = [str(m) for m in matches]
+    return _ok("search_files", "\n".join(lines), data=[str(m.path) for m in matches])
+
+
+@_builtin(
+    name="list_directory",
+    description="List the files and folders inside a directory.",
+    params=[ToolParam("path", "str", "Directory path (default: home).",
+                      required=False, default="")],
+    category="files",
+)
+def _list_directory(path: str = "") -> ToolResult:
+    target = Path(path) if path else Path.home()
+    # DirEntry caches the file type from the directory read, so sorting and
+    # tagging need no extra stat() calls; only listed files are stat'ed.
+    try:
+        with os.scandir(target) as it:
+            entries = sorted(it, key=lambda e: (e.is_file(), e.name.lower()))
+    except FileNotFoundError:
+        return _err("list_directory", f"Path does not exist: {target}")
+    except NotADirectoryError:
+        return _err("list_directory", f"Path is a file, not a directory: {target}")
+    lines = []
+    for e in entries[:200]:
+        tag = "/" if e.is_dir() else ""
+        size = f"  {e.stat().st_size / 1024:.1f} KB" if e.is_file() else ""
+        lines.append(f"  {e.name}{tag}{size}")
+    return _ok("list_directory", f"Contents of {target}:\n" + "\n".join(lines),
+               data=[e.path for e in entries])
+
+
+# ---------------------------------------------------------------------------
+# Built-in tools: programs
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=128)
+def _tokenize_args(args: str) -> tuple[str, ...]:
+    """Split an argument string the way a shell would, honouring quotes.
+
+    Backslashes are literal on Windows so paths like ``C:\\dir`` survive.
+    """
+    if not args:
+        return ()
+    if os.name != "nt":
+        return tuple(shlex.split(args))
+    return tuple(
+        t[1:-1] if len(t) > 1 and t[0] == t[-1] and t[0] in "\"'" else t
+        for t in shlex.split(args, posix=False)
+    )
+
+
+@_builtin(
+    name="run_program",
+    description="Run any installed program and return its output.",
+    params=[
+        ToolParam("command", "str", "The executable name or full path."),
+        ToolParam("args", "str", "Arguments, quoted as on a command line (optional).",
+                  required=False, default=""),
+        ToolParam("input_data", "str", "Text to send to the program's stdin.",
+                  required=False, default=""),
+        ToolParam("timeout", "float", "Seconds before giving up (default 30).",
+                  required=False, default=30.0),
+    ],
+    category="programs",
+    concurrency_safe=False,
+)
+def _run_program(command: str, args: str = "", input_data: str = "",
+                 timeout: float = 30.0) -> ToolResult:
+    from .program_interactor import ProgramInteractor  # noqa: PLC0415
+    pi = ProgramInteractor(default_timeout=timeout)
+    arg_list = list(_tokenize_args(args))
+    result = pi.communicate(command, args=arg_list,
+                            input_data=input_data or None,
+                            timeout=timeout)
+    if result.timed_out:
+        return _err("run_program", f"Command timed out after {timeout}s")
+    combined = (result.stdout + result.stderr).strip()
+    success = result.returncode == 0
+    if success:
+        return _ok("run_program", combined or "(no output)",
+                   data={"returncode": result.returncode, "stdout": result.stdout,
+                         "stderr": result.stderr})
+    return ToolResult(
+        tool_name="run_program", success=False,
+        output=combined,
+        error=f"Exited with code {result.returncode}",
+        data={"returncode": result.returncode},
+    )
+
+
+@_builtin(
+    name="launch_program",
+    description="Launch an application in the background (detached, non-blocking).",
+    params=[
+        ToolParam("command", "str", "Executable name or path."),
+        ToolParam("args", "str", "Arguments, quoted as on a command line.",
+                  required=False, default=""),
+    ],
+    category="programs",
+    concurrency_safe=False,
+)
+def _launch_program(command: str, args: str = "") -> ToolResult:
+    from .program_interactor import ProgramInteractor  # noqa: PLC0415
+    pi = ProgramInteractor()
+    arg_list = list(_tokenize_args(args))
+    result = pi.launch(command, args=arg_list, detach=True)
+    if result.success:
+        return _ok("launch_program", str(result), data={"pid": result.pid})
+    return _err("launch_program", result.error)
+
+
+@_builtin(
+    name="list_programs",
+    description="List running programs / processes, optionally filtered by name.",
+    params=[ToolParam("name_filter", "str", "Filter by program name (optional).",
+                      required=False, default="")],
+    category="programs",
+)
+def _list_programs(name_filter: str = "") -> ToolResult:
+    pm = _process_manager()
+    if name_filter:
+        procs = pm.find_by_name(name_filter)
+    else:
+        procs = pm.list_processes()
+    summary = pm.summary(procs)
+    top = sorted(procs, key=lambda p: p.cpu_percent, reverse=True)[:20]
+    lines = [f"  PID {p.pid:6d}  CPU {p.cpu_percent:5.1f}%  "
+             f"MEM {p.memory_mb:6.0f} MB  {p.name}"
+             for p in top]
+    output = summary + "\n\nTop processes by CPU:\n" + "\n".join(lines)
+    return _ok("list_programs", output, data=[{"pid": p.pid, "name": p.name} for p in top])
+
+
+# ---------------------------------------------------------------------------
+# Built-in tools: system
+# ---------------------------------------------------------------------------
+
+
+@_builtin(
+    name="system_snapshot",
+    description="Get current CPU, memory and disk usage with any active alerts.",
+    params=[],
+    category="system",
+)
+def _system_snapshot() -> ToolResult:
+    mon = _system_monitor()
+    snap = mon.snapshot()
+    text = mon.format_snapshot(snap)
+    alerts = mon.alerts(snap)
+    if alerts:
+        text += "\n\nAlerts:\n" + "\n".join(f"  ⚠ {a}" for a in alerts)
+    return _ok("system_snapshot", text, data={
+        "cpu_percent": snap.cpu_percent,
+        "memory_percent": snap.memory_percent,
+    })
+
+
+@_builtin(
+    name="gpu_stats",
+    description="Get NVIDIA GPU VRAM, temperature, utilisation and per-process memory.",
+    params=[],
+    category="system",
+)
+def _gpu_stats() -> ToolResult:
+    gpu = _gpu_monitor()
+    snaps = gpu.snapshots()
+    text = gpu.format_snapshots(snaps)
+    alerts = gpu.alerts(snaps)
+    if alerts:
+        text += "\n\nAlerts:\n" + "\n".join(f"  ⚠ {a}" for a in alerts)
+    return _ok("gpu_stats", text, data=[{
+        "index": s.index, "name": s.name,
+        "vram_percent": s.vram_percent, "temperature_c": s.temperature_c,
+    } for s in snaps])
+
+
+# ---------------------------------------------------------------------------
+# Built-in tools: AI
+# ---------------------------------------------------------------------------
+
+
+@_builtin(
+    name="list_ai_apps",
+    description="Discover all known AI programs (Ollama, ComfyUI, LM Studio, etc.) and show which are running.",
+    params=[],
+    category="ai",
+)
+def _list_ai_apps() -> ToolResult:
+    registry = _ai_app_registry()
+    statuses = registry.discover()
+    text = registry.format_status(statuses)
+    return _ok("list_ai_apps", text,
+               data=[{"name": s.name, "running": s.running} for s in statuses])
+
+
+@_builtin(
+    name="ask_ollama",
+    description="Send a prompt to a local Ollama LLM model and return its response.",
+    params=[
+        ToolParam("prompt", "str", "The question or instruction."),
+        ToolParam("model", "str", "Ollama model name (default: llama3).",
+                  required=False, default="llama3"),
+        ToolParam("url", "str", "Ollama base URL.",
+                  required=False, default="http://localhost:11434"),
+    ],
+    category="ai",
+)
+def _ask_ollama(prompt: str, model: str = "llama3",
+                url: str = "http://localhost:11434") -> ToolResult:
+    client = _ollama_client(url)
+    # Go straight to the request; only probe the server to explain a failure.
+    result = client.generate(model=model, prompt=prompt)
+    if result.error:
         if not client.is_running():
             return _err("ask_ollama",
                         f"Ollama is not running at {url}. "
                         "Start it with: ollama serve")
-        result = client.generate(model=model, prompt=prompt)
-        if result.error:
-            return _err("ask_ollama", result.error)
-        return _ok("ask_ollama", result.response,
-                   data={"model": model, "response": result.response})
-
-    reg.register(Tool(
-        name="ask_ollama",
-        description="Send a prompt to a local Ollama LLM model and return its response.",
-        params=[
-            ToolParam("prompt", "str", "The question or instruction."),
-            ToolParam("model", "str", "Ollama model name (default: llama3).",
-                      required=False, default="llama3"),
-            ToolParam("url", "str", "Ollama base URL.",
-                      required=False, default="http://localhost:11434"),
-        ],
-        handler=_ask_ollama,
-        category="ai",
-    ))
-
-    def _list_ollama_models(url: str = "http://localhost:11434") -> ToolResult:
-        from .ai_integrations import OllamaClient  # noqa: PLC0415
-        client = OllamaClient(base_url=url)
-        models = client.list_models()
-        if not models:
-            return _ok("list_ollama_models", "No models found (or Ollama is not running).", data=[])
-        lines = [f"  {m}" for m in models]
-        return _ok("list_ollama_models", "Ollama models:\n" + "\n".join(lines),
-                   data=[m.name for m in models])
-
-    reg.register(Tool(
-        name="list_ollama_models",
-        description="List all models currently available in the local Ollama installation.",
-        params=[ToolParam("url", "str", "Ollama base URL.",
-                          required=False, default="http://localhost:11434")],
-        handler=_list_ollama_models,
-        category="ai",
-    ))
+        return _err("ask_ollama", result.error)
+    return _ok("ask_ollama", result.response,
+               data={"model": model, "response": result.response})
+
+
+@_builtin(
+    name="list_ollama_models",
+    description="List all models currently available in the local Ollama installation.",
+    params=[ToolParam("url", "str", "Ollama base URL.",
+                      required=False, default="http://localhost:11434")],
+    category="ai",
+)
+def _list_ollama_models(url: str = "http://localhost:11434") -> ToolResult:
+    models = _ollama_client(url).list_models()
+    if not models:
+        return _ok("list_ollama_models", "No models found (or Ollama is not running).", data=[])
+    lines = [f"  {m}" for m in models]
+    return _ok("list_ollama_models", "Ollama models:\n" + "\n".join(lines),
+               data=[m.name for m in models])
+
+
@@ -21,26 +21,32 @@ Usage
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import platform
 import re
-import tarfile
+import shutil
+import threading
 import time
 import urllib.error
 import urllib.request
-import zipfile
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 _GITHUB_API_URL = "https://api.github.com/repos/POINTYTHRUNDRA654/AI-Helper./releases/latest"
 _TIMEOUT = 10.0
+_CHECK_TTL = 3600.0          # seconds a cached check() result counts as fresh
+_CACHE_NAME = "update_check.json"
+_CHUNK_SIZE = 1 << 20       # download read/write block size
 _CURRENT_VERSION = "0.1.0"   # Updated by release process
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class UpdateInfo:
     """Result of an update check."""
     current_version: str
@@ -64,6 +70,83 @@ class UpdateInfo:
             f"  Download : {self.release_url}"
         )
 
+    def __repr__(self) -> str:
+        # Same as the generated repr, but with the release notes capped.
+        parts = []
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if f.name == "release_notes":
+                value = value[:200]
+            parts.append(f"{f.name}={value!r}")
+        return f"UpdateInfo({', '.join(parts)})"
+
+
+_VERSION_RE = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=256)
+def _version_parts(v: str) -> tuple[int, ...]:
+    """Numeric components of version string *v* (``(0,)`` if it has none)."""
+    return tuple(int(x) for x in _VERSION_RE.findall(v)) or (0,)
+
+
+_ASSET_PREFERENCES: Dict[str, Tuple[str, ...]] = {
+    "windows": ("windows", "win64", "win32", ".zip"),
+    "darwin": ("macos", "darwin", "osx", ".tar.gz", ".zip"),
+}
+_DEFAULT_ASSET_PREFERENCE = ("linux", "x86_64", "amd64", ".tar.gz", ".zip")
+
+
+@lru_cache(maxsize=None)
+def _asset_scorer(system: str) -> tuple[re.Pattern[str], int]:
+    """Pattern matching any preferred asset marker for *system*, and the marker count."""
+    prefer = _ASSET_PREFERENCES.get(system, _DEFAULT_ASSET_PREFERENCE)
+    return re.compile("|".join(map(re.escape, prefer))), len(prefer)
+
+
+def _member_path(target_dir: Path, name: str) -> Path:
+    """Destination of archive member *name*, refusing paths outside *target_dir*."""
+    dest = (target_dir / name).resolve()
+    if not dest.is_relative_to(target_dir.resolve()):
+        raise ValueError(f"Archive member escapes target directory: {name!r}")
+    return dest
+
+
+def _http_validator(headers) -> str:  # noqa: ANN001
+    """Return the response's ``If-Range`` validator, or ``""`` if it has none.
+
+    Weak ETags can't be used with ``If-Range``, so those fall back to
+    ``Last-Modified``.
+    """
+    etag = headers.get("ETag") or ""
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified") or ""
+
+
+def _resume_validator(meta: Path, url: str) -> str:
+    """Validator saved for a partial download of *url*, or ``""`` if unusable."""
+    try:
+        saved = json.loads(meta.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ""
+    if not isinstance(saved, dict) or saved.get("url") != url:
+        return ""
+    return str(saved.get("validator") or "")
+
+
+def _copy_member(src: BinaryIO, dest: Path, mode: int = 0) -> None:
+    """Stream one archive member to *dest* in ``_CHUNK_SIZE`` blocks.
+
+    Permission bits from *mode* are applied if given (tar members only,
+    matching what ``extractall`` did before).
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with dest.open("wb") as dst:
+        shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+    if mode & 0o777:
+        os.chmod(dest, mode & 0o777)
+
 
 class Updater:
     """Check for and download AI Helper updates.
@@ -76,6 +159,10 @@ class Updater:
         Where to save downloaded archives (default: ``<INSTALL_DIR>/Updates``).
     api_url:
         GitHub API URL for the latest release.
+    cache_ttl:
+        Seconds a saved :meth:`check` result is returned without contacting
+        GitHub.  An older result is still returned immediately while a
+        background thread refreshes it.
     """
 
     def __init__(
@@ -83,6 +170,7 @@ class Updater:
         current_version: str = _CURRENT_VERSION,
         download_dir: Optional[Path] = None,
         api_url: str = _GITHUB_API_URL,
+        cache_ttl: float = _CHECK_TTL,
     ) -> None:
         self.current_version = current_version
         self.api_url = api_url
@@ -90,39 +178,106 @@ class Updater:
             from . import config as _cfg  # noqa: PLC0415
             download_dir = _cfg.get_install_dir() / "Updates"
         self.download_dir = Path(download_dir)
+        self.cache_ttl = cache_ttl
+        self._cache_path = self.download_dir / _CACHE_NAME
+        self._refresh_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def check(self) -> UpdateInfo:
-        """Query the GitHub releases API and return an :class:`UpdateInfo`.
+    def check(self, force: bool = False) -> UpdateInfo:
+        """Return an :class:`UpdateInfo` for the latest GitHub release.
+
+        The last successful result is kept in ``update_check.json`` under
+        :attr:`download_dir`.  If it is younger than :attr:`cache_ttl` it is
+        returned as is; if older, it is returned immediately and refreshed
+        in the background.  Only when there is no saved result (or *force*
+        is true) does this block on the network.  Refreshes are conditional
+        on the saved ETag, so an unchanged release costs a bodiless 304.
 
         Never raises — errors are captured in ``UpdateInfo.error``.
         """
-        import json  # noqa: PLC0415
+        if not force:
+            cached = self._load_cache()
+            if cached is not None:
+                info, age, _ = cached
+                if age >= self.cache_ttl and self._refresh_lock.acquire(blocking=False):
+                    threading.Thread(
+                        target=self._background_refresh, daemon=True,
+                        name="ai-helper-update-check",
+                    ).start()
+                return info
+        return self._refresh()
+
+    def _background_refresh(self) -> None:
+        try:
+            self._refresh()
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self) -> UpdateInfo:
+        cached = self._load_cache()
+        info, etag = self._fetch(cached[2] if cached else "")
+        if info is None:
+            # 304 Not Modified: the saved result is still current.
+            try:
+                os.utime(self._cache_path)
+            except OSError:
+                pass
+            return cached[0]  # type: ignore[index]
+        if not info.error:
+            self._save_cache(info, etag)
+        return info
+
+    def _load_cache(self) -> Optional[tuple[UpdateInfo, float, str]]:
+        """Return the saved check result, its age in seconds and its ETag."""
+        try:
+            age = time.time() - self._cache_path.stat().st_mtime
+            saved = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            etag = saved.pop("etag", "")
+            info = UpdateInfo(**saved)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+        # The running version may have changed since the result was saved.
+        info.current_version = self.current_version
+        info.update_available = self._version_gt(info.latest_version, self.current_version)
+        return info, age, etag
+
+    def _save_cache(self, info: UpdateInfo, etag: str = "") -> None:
+        tmp = self._cache_path.with_name(self._cache_path.name + ".tmp")
+        try:
+            self.download_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({**asdict(info), "etag": etag}), encoding="utf-8")
+            os.replace(tmp, self._cache_path)
+        except OSError as exc:
+            logger.debug("Could not save update check result: %s", exc)
+
+    def _fetch(self, etag: str = "") -> tuple[Optional[UpdateInfo], str]:
+        """Query the GitHub releases API.
+
+        Returns the result and the response's ETag.  When *etag* is given
+        it is sent as ``If-None-Match``; if the release is unchanged GitHub
+        answers 304 with no body and ``(None, etag)`` is returned.
+        """
+        headers = {"Accept": "application/vnd.github+json",
+                   "User-Agent": "AI-Helper-Updater/1.0"}
+        if etag:
+            headers["If-None-Match"] = etag
         try:
-            req = urllib.request.Request(  # noqa: S310
-                self.api_url,
-                headers={"Accept": "application/vnd.github+json",
-                         "User-Agent": "AI-Helper-Updater/1.0"},
-            )
+            req = urllib.request.Request(self.api_url, headers=headers)  # noqa: S310
             with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:  # noqa: S310
-                data = json.loads(resp.read().decode())
-        except urllib.error.URLError as exc:
-            return UpdateInfo(
-                current_version=self.current_version,
-                latest_version="unknown",
-                update_available=False,
-                error=str(exc),
-            )
+                etag = resp.headers.get("ETag") or ""
+                data = json.loads(resp.read())
         except Exception as exc:  # noqa: BLE001
+            if isinstance(exc, urllib.error.HTTPError) and exc.code == 304 and etag:
+                return None, etag
             return UpdateInfo(
                 current_version=self.current_version,
                 latest_version="unknown",
                 update_available=False,
                 error=str(exc),
-            )
+            ), ""
 
         latest = data.get("tag_name", "").lstrip("v")
         release_url = data.get("html_url", "")
@@ -142,7 +297,7 @@ class Updater:
             asset_url=asset_url,
             asset_name=asset_name,
             published_at=published_at,
-        )
+        ), etag
 
     def download(self, info: UpdateInfo) -> Optional[Path]:
         """Download the release asset to the download directory.
@@ -158,30 +313,109 @@ class Updater:
 
         logger.info("Downloading %s → %s", info.asset_url, dest)
         try:
-            urllib.request.urlretrieve(info.asset_url, dest)  # noqa: S310
+            digest = self._fetch_to(info.asset_url, dest)
         except Exception as exc:  # noqa: BLE001
             logger.error("Download failed: %s", exc)
             return None
 
-        logger.info("Downloaded %s  (%d bytes)", dest.name, dest.stat().st_size)
+        # Same format as ``sha256sum`` so the file can be checked with it.
+        dest.with_name(dest.name + ".sha256").write_text(
+            f"{digest}  {dest.name}\n", encoding="utf-8"
+        )
+        logger.info("Downloaded %s  (%d bytes, sha256 %s)",
+                    dest.name, dest.stat().st_size, digest)
         return dest
 
+    @staticmethod
+    def _fetch_to(url: str, dest: Path) -> str:
+        """Stream *url* into *dest* and return the SHA-256 of its content.
+
+        Data goes to ``<dest>.part`` first, with the URL and the server's
+        validator (strong ETag or Last-Modified) saved in ``<dest>.part.json``.
+        A partial file left by an interrupted download is resumed with
+        ``Range``/``If-Range`` only when both match, so bytes of an older
+        file with the same name are never spliced onto a new one.
+        """
+        import hashlib  # noqa: PLC0415
+        part = dest.with_name(dest.name + ".part")
+        meta = dest.with_name(dest.name + ".part.json")
+        validator = _resume_validator(meta, url) if part.exists() else ""
+        h = hashlib.sha256()
+        offset = 0
+        if validator:
+            with part.open("rb") as f:
+                while chunk := f.read(_CHUNK_SIZE):
+                    h.update(chunk)
+                    offset += len(chunk)
+
+        headers = {"User-Agent": "AI-Helper-Updater/1.0"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+        req = urllib.request.Request(url, headers=headers)  # noqa: S310
+        try:
+            resp = urllib.request.urlopen(req, timeout=_TIMEOUT)  # noqa: S310
+        except urllib.error.HTTPError as exc:
+            if exc.code != 416 or not offset:
+                raise
+            # The partial file is already as long as (or longer than) the
+            # asset; it can't be trusted, so fetch the whole file again.
+            part.unlink(missing_ok=True)
+            meta.unlink(missing_ok=True)
+            return Updater._fetch_to(url, dest)
+        with resp:
+            if offset and resp.status != 206:
+                # The file changed or the server ignored the range, so it
+                # is sending everything.
+                h = hashlib.sha256()
+                offset = 0
+            if not offset:
+                meta.write_text(
+                    json.dumps({"url": url, "validator": _http_validator(resp.headers)}),
+                    encoding="utf-8",
+                )
+            with part.open("ab" if offset else "wb") as f:
+                while chunk := resp.read(_CHUNK_SIZE):
+                    f.write(chunk)
+                    h.update(chunk)
+        os.replace(part, dest)
+        meta.unlink(missing_ok=True)
+        return h.hexdigest()
+
     def extract(self, archive_path: Path, target_dir: Optional[Path] = None) -> Optional[Path]:
         """Extract a downloaded archive.
 
         Returns the extraction directory, or ``None`` on failure.
         """
+        import tarfile  # noqa: PLC0415
+        import zipfile  # noqa: PLC0415
         target_dir = target_dir or self.download_dir / archive_path.stem
         target_dir.mkdir(parents=True, exist_ok=True)
 
         try:
             if archive_path.suffix == ".zip" or archive_path.name.endswith(".zip"):
                 with zipfile.ZipFile(archive_path) as zf:
-                    zf.extractall(target_dir)
+                    # Check every path first so a bad member can't leave a
+                    # half-extracted tree behind.
+                    members = [(z, _member_path(target_dir, z.filename)) for z in zf.infolist()]
+                    for zinfo, dest in members:
+                        if zinfo.is_dir():
+                            dest.mkdir(parents=True, exist_ok=True)
+                            continue
+                        with zf.open(zinfo) as src:
+                            _copy_member(src, dest)
             elif any(archive_path.name.endswith(ext)
                      for ext in (".tar.gz", ".tgz", ".tar.bz2")):
                 with tarfile.open(archive_path) as tf:
-                    tf.extractall(target_dir)  # noqa: S202
+                    members = [(m, _member_path(target_dir, m.name)) for m in tf.getmembers()]
+                    for member, dest in members:
+                        if member.isdir():
+                            dest.mkdir(parents=True, exist_ok=True)
+                        elif member.isfile():
+                            with tf.extractfile(member) as src:  # type: ignore[union-attr]
+                                _copy_member(src, dest, member.mode)
+                        else:
+                            logger.debug("Skipping non-regular archive member %s", member.name)
             else:
                 logger.warning("Unknown archive format: %s", archive_path.suffix)
                 return None
@@ -199,31 +433,21 @@ class Updater:
     @staticmethod
     def _version_gt(a: str, b: str) -> bool:
         """Return True if version string *a* is greater than *b*."""
-        def _parts(v: str):
-            return tuple(int(x) for x in re.findall(r"\d+", v) or [0])
-        return _parts(a) > _parts(b)
+        return _version_parts(a) > _version_parts(b)
 
     @staticmethod
     def _pick_asset(assets: list) -> tuple[str, str]:
         """Choose the best release asset for the current platform."""
-        system = platform.system().lower()
-        machine = platform.machine().lower()
-
-        prefer: list[str] = []
-        if system == "windows":
-            prefer = ["windows", "win64", "win32", ".zip"]
-        elif system == "darwin":
-            prefer = ["macos", "darwin", "osx", ".tar.gz", ".zip"]
-        else:
-            prefer = ["linux", "x86_64", "amd64", ".tar.gz", ".zip"]
-
-        # Score each asset
+        score_re, perfect = _asset_scorer(platform.system().lower())
+
+        # Score each asset by how many preferred markers its name contains
         best_url, best_name, best_score = "", "", -1
         for asset in assets:
-            name = asset.get("name", "").lower()
-            url = asset.get("browser_download_url", "")
-            score = sum(1 for p in prefer if p in name)
+            name = asset.get("name", "")
+            score = len(set(score_re.findall(name.lower())))
             if score > best_score:
-                best_url, best_name, best_score = url, asset.get("name", ""), score
+                best_url, best_name, best_score = asset.get("browser_download_url", ""), name, score
+                if score == perfect:
+                    break
 
         return best_url, best_name
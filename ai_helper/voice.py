@@ -13,9 +13,9 @@ Engine priority
 3. **Log fallback** – if no TTS engine is available the text is simply
    logged at INFO level so the app never crashes in a headless environment.
 
-The :class:`Speaker` runs speech in a background daemon thread via a
-``queue.Queue`` so calls to :meth:`speak` are fully non-blocking and the
-monitoring loop is never stalled by a slow TTS engine.
+The :class:`Speaker` runs speech in a background daemon thread fed by a
+lock-free job queue so calls to :meth:`speak` are fully non-blocking and
+the monitoring loop is never stalled by a slow TTS engine.
 """
 
 from __future__ import annotations
@@ -23,9 +23,11 @@ from __future__ import annotations
 import logging
 import platform
 import queue
+import re
 import shutil
 import subprocess
 import threading
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 
@@ -33,6 +35,13 @@ logger = logging.getLogger(__name__)
 
 _SYSTEM = platform.system()
 
+# Most queued messages spoken in one engine call.
+_MAX_BATCH = 8
+
+# Text longer than this is handed to pyttsx3 one sentence at a time.
+_CHUNK_OVER = 120
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
 # ---------------------------------------------------------------------------
 # Engine detection
 # ---------------------------------------------------------------------------
@@ -47,17 +56,6 @@ def _try_import_pyttsx3():
         return None
 
 
-def _cli_fallback_available() -> bool:
-    """Return True if at least one command-line TTS tool is on PATH."""
-    if _SYSTEM == "Darwin" and shutil.which("say"):
-        return True
-    if _SYSTEM == "Linux" and shutil.which("espeak"):
-        return True
-    if _SYSTEM == "Windows":
-        return True  # PowerShell is always available on Windows
-    return False
-
-
 # ---------------------------------------------------------------------------
 # Data types
 # ---------------------------------------------------------------------------
@@ -72,6 +70,74 @@ class VoiceSettings:
     voice_id: Optional[str] = None  # pyttsx3 voice id; None = engine default
 
 
+# ---------------------------------------------------------------------------
+# Job queue
+# ---------------------------------------------------------------------------
+
+
+class _SpeechQueue:
+    """Unbounded queue for any number of producers and a single consumer.
+
+    ``deque.append`` and ``deque.popleft`` are atomic, so :meth:`put` takes
+    no lock; it only touches the wake-up event when the consumer may be
+    asleep.  Unlike :class:`queue.Queue` there is no ``task_done``/``join``.
+    """
+
+    __slots__ = ("_items", "_nonempty")
+
+    def __init__(self) -> None:
+        self._items: deque[object] = deque()
+        self._nonempty = threading.Event()
+
+    def put(self, item: object) -> None:
+        self._items.append(item)
+        if not self._nonempty.is_set():
+            self._nonempty.set()
+
+    def put_front(self, item: object) -> None:
+        """Queue *item* ahead of everything already waiting."""
+        self._items.appendleft(item)
+        if not self._nonempty.is_set():
+            self._nonempty.set()
+
+    def get_nowait(self) -> object:
+        """Pop the oldest item; raise :class:`queue.Empty` if there is none."""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def get(self, timeout: Optional[float] = None) -> object:
+        """Pop the oldest item, waiting for one (consumer thread only)."""
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            self._nonempty.clear()
+            # Re-check: a put() may have landed before clear() and skipped
+            # set() because the event still looked set.
+            if self._items:
+                continue
+            if not self._nonempty.wait(timeout) and not self._items:
+                raise queue.Empty
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+
+def _join_utterances(parts: list[str]) -> str:
+    """Join queued messages into one utterance with a pause between each."""
+    if len(parts) == 1:
+        return parts[0]
+    return " ".join(
+        p if p.endswith((".", "!", "?")) else p + "." for p in map(str.strip, parts)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Speaker
 # ---------------------------------------------------------------------------
@@ -95,25 +161,49 @@ class Speaker:
 
     # Sentinel pushed into the queue to stop the worker thread.
     _STOP = object()
+    # Tag of ``(_LIST_VOICES, reply_queue)`` items asking the worker to
+    # enumerate voices from its own engine.
+    _LIST_VOICES = object()
 
     def __init__(
         self,
         settings: Optional[VoiceSettings] = None,
         enabled: bool = True,
     ) -> None:
+        self._cli_argv: Optional[list[str]] = None
+        self._ps_setup_str: Optional[str] = None
         self.settings = settings or VoiceSettings()
         self.enabled = enabled
 
-        self._queue: queue.Queue[object] = queue.Queue()
+        self._queue = _SpeechQueue()
         self._pyttsx3 = _try_import_pyttsx3()
         self._engine = None  # initialised lazily inside the worker thread
         self._lock = threading.Lock()
+        self._voices: Optional[list[str]] = None
+        self._voices_lock = threading.Lock()
+        # Long-running PowerShell speech host (Windows CLI fallback only).
+        self._ps: Optional[subprocess.Popen[str]] = None
+        self._ps_script = ""
+        self._ps_lock = threading.Lock()
+        self._ps_unavailable = False
 
         self._worker = threading.Thread(
             target=self._run, name="ai-helper-speaker", daemon=True
         )
         self._worker.start()
 
+    @property
+    def settings(self) -> VoiceSettings:
+        """Voice parameters; assign a new :class:`VoiceSettings` to change them."""
+        return self._settings
+
+    @settings.setter
+    def settings(self, value: VoiceSettings) -> None:
+        self._settings = value
+        # Rebuilt from the new rate/volume/voice on next use.
+        self._cli_argv = None
+        self._ps_setup_str = None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -143,8 +233,7 @@ class Speaker:
 
     def stop(self) -> None:
         """Clear the speech queue and stop any in-progress utterance."""
-        with self._queue.mutex:
-            self._queue.queue.clear()
+        self._queue.clear()
         if self._engine is not None:
             try:
                 self._engine.stop()
@@ -155,14 +244,39 @@ class Speaker:
         """Signal the worker thread to exit and wait for it."""
         self._queue.put(self._STOP)
         self._worker.join(timeout=5)
+        with self._ps_lock:
+            self._close_ps_host()
 
-    def list_voices(self) -> list[str]:
+    def list_voices(self, timeout: float = 5.0) -> list[str]:
         """Return the names of all available pyttsx3 voices.
 
-        Returns an empty list when pyttsx3 is not installed.
+        The worker thread's engine is asked for them, so no second engine
+        has to be started.  The request jumps the speech queue, so it only
+        waits for the utterance in progress; a throwaway engine is created
+        when the worker has no engine or doesn't answer within *timeout*.
+        A non-empty list is cached.  Returns an empty list when pyttsx3 is
+        not installed or no voices could be read.
         """
         if self._pyttsx3 is None:
             return []
+        with self._voices_lock:
+            if self._voices is None:
+                voices: list[str] = []
+                if self._engine is not None and self._worker.is_alive():
+                    reply: queue.Queue[list[str]] = queue.Queue(maxsize=1)
+                    self._queue.put_front((self._LIST_VOICES, reply))
+                    try:
+                        voices = reply.get(timeout=timeout)
+                    except queue.Empty:
+                        voices = self._list_voices_fresh_engine()
+                else:
+                    voices = self._list_voices_fresh_engine()
+                if not voices:
+                    return []
+                self._voices = voices
+            return list(self._voices)
+
+    def _list_voices_fresh_engine(self) -> list[str]:
         try:
             engine = self._pyttsx3.init()
             voices = [v.name for v in engine.getProperty("voices")]
@@ -186,22 +300,47 @@ class Speaker:
                 logger.warning("pyttsx3 engine init failed; will use CLI fallback")
                 self._engine = None
 
+        pending: object = None
         while True:
-            item = self._queue.get()
+            if pending is not None:
+                item, pending = pending, None
+            else:
+                item = self._queue.get()
             if item is self._STOP:
                 break
+            if type(item) is tuple and item[0] is self._LIST_VOICES:
+                voices: list[str] = []
+                try:
+                    # speak_now() may be inside runAndWait() on this engine.
+                    with self._lock:
+                        voices = [v.name for v in self._engine.getProperty("voices")]
+                except Exception:  # noqa: BLE001
+                    logger.debug("Could not list pyttsx3 voices", exc_info=True)
+                item[1].put(voices)  # always answer, so the caller never waits it out
+                continue
+            # Speak whatever else is already queued in the same engine call,
+            # so an alert storm pays the engine start-up cost once rather
+            # than per line.  Control items end the batch and run next.
+            batch = [str(item)]
+            while len(batch) < _MAX_BATCH:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if not isinstance(nxt, str):
+                    pending = nxt
+                    break
+                batch.append(nxt)
             try:
-                self._utter(str(item))
+                self._utter(_join_utterances(batch))
             except Exception:  # noqa: BLE001
                 logger.exception("Speaker error while uttering text")
-            finally:
-                self._queue.task_done()
 
     def _utter(self, text: str) -> None:
         """Speak *text* using the best available engine (called from any thread)."""
         if self._engine is not None:
             self._utter_pyttsx3(text)
-        elif _cli_fallback_available():
+        elif _SYSTEM == "Windows" or self._cli_argv_prefix():
             self._utter_cli(text)
         else:
             logger.info("[TTS] %s", text)
@@ -209,48 +348,39 @@ class Speaker:
     def _utter_pyttsx3(self, text: str) -> None:
         with self._lock:
             try:
-                self._engine.say(text)
+                # Queue long text sentence by sentence ahead of a single
+                # runAndWait(): the driver synthesises the next sentence
+                # while the current one plays, and stop() takes effect at
+                # the next sentence boundary instead of after the lot.
+                chunks = _SENTENCE_END.split(text) if len(text) > _CHUNK_OVER else (text,)
+                for chunk in chunks:
+                    self._engine.say(chunk)
                 self._engine.runAndWait()
+                return
             except Exception:  # noqa: BLE001
                 logger.warning("pyttsx3 utter failed; retrying via CLI")
-                self._utter_cli(text)
+        # The CLI tools don't touch the engine, so run them without holding
+        # the engine lock; otherwise a slow fallback would also stall
+        # speak_now() and stop() callers for its whole duration.
+        self._utter_cli(text)
 
     def _utter_cli(self, text: str) -> None:
         """Speak using a platform command-line TTS tool."""
-        safe = text.replace('"', "'")  # basic quote sanitisation for shell args
         try:
-            if _SYSTEM == "Darwin" and shutil.which("say"):
-                rate_arg = str(int(self.settings.rate))
-                subprocess.run(
-                    ["say", "-r", rate_arg, safe],
-                    check=False, timeout=60,
-                )
-            elif _SYSTEM == "Linux" and shutil.which("espeak"):
-                rate_arg = str(int(self.settings.rate))
-                vol_arg = str(int(self.settings.volume * 100))
-                subprocess.run(
-                    ["espeak", "-s", rate_arg, "-a", vol_arg, safe],
-                    check=False, timeout=60,
-                )
+            prefix = self._cli_argv_prefix()
+            if prefix:
+                safe = text.replace('"', "'")  # basic quote sanitisation for shell args
+                subprocess.run([*prefix, safe], check=False, timeout=60)
             elif _SYSTEM == "Windows":
-                # Prefer a female voice on Windows by default; allow explicit overrides via settings.voice_id.
-                voice_cmd = (
-                    f'$s.SelectVoice("{self.settings.voice_id}"); '
-                    if self.settings.voice_id
-                    else "$s.SelectVoiceByHints([System.Speech.Synthesis.VoiceGender]::Female); "
-                )
-                ps_script = (
-                    "Add-Type -AssemblyName System.speech; "
-                    "$s = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
-                    f"$s.Rate = {self._ps_rate()}; "
-                    f"$s.Volume = {int(self.settings.volume * 100)}; "
-                    f"{voice_cmd}"
-                    f'$s.Speak("{safe}");'
-                )
-                subprocess.run(
-                    ["powershell", "-NoProfile", "-Command", ps_script],
-                    check=False, timeout=60,
-                )
+                if not self._utter_ps_host(text):
+                    # The text goes in on stdin, never into the script, so
+                    # nothing in it is parsed as PowerShell.
+                    subprocess.run(
+                        ["powershell", "-NoProfile", "-NonInteractive", "-Command",
+                         f"{self._ps_setup()}$s.Speak([Console]::In.ReadToEnd());"],
+                        input=text, text=True, encoding="utf-8",
+                        check=False, timeout=60,
+                    )
             else:
                 logger.info("[TTS] %s", text)
         except subprocess.TimeoutExpired:
@@ -258,10 +388,118 @@ class Speaker:
         except Exception:  # noqa: BLE001
             logger.exception("TTS CLI error")
 
+    def _utter_ps_host(self, text: str) -> bool:
+        """Speak *text* through the long-running PowerShell host.
+
+        Starting ``powershell.exe`` and loading System.Speech costs far
+        more than the speech setup itself, so one host process is kept
+        and fed one line of text per utterance on stdin; it answers with
+        a line on stdout when done.  Returns ``False`` if the host could
+        not be used, so the caller can fall back to a one-off process.
+        """
+        if self._ps_unavailable:
+            return False
+        script = (
+            f"{self._ps_setup()}"
+            "while ($null -ne ($line = [Console]::In.ReadLine())) "
+            "{ $s.Speak($line); [Console]::Out.WriteLine('.') }"
+        )
+        with self._ps_lock:
+            proc = self._ps
+            if proc is None or proc.poll() is not None or self._ps_script != script:
+                self._close_ps_host()
+                try:
+                    proc = subprocess.Popen(
+                        ["powershell", "-NoProfile", "-NonInteractive", "-Command", script],
+                        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL, text=True, encoding="utf-8",
+                        bufsize=1,
+                    )
+                except OSError:
+                    logger.debug("PowerShell speech host unavailable", exc_info=True)
+                    self._ps_unavailable = True
+                    return False
+                self._ps, self._ps_script = proc, script
+            timed_out: list[bool] = []
+            timer = threading.Timer(60, lambda: (timed_out.append(True), proc.kill()))
+            timer.daemon = True
+            timer.start()
+            try:
+                proc.stdin.write(" ".join(text.split()) + "\n")  # type: ignore[union-attr]
+                proc.stdin.flush()  # type: ignore[union-attr]
+                done = bool(proc.stdout.readline())  # type: ignore[union-attr]
+            except (OSError, ValueError):
+                done = False
+            finally:
+                timer.cancel()
+            if done:
+                return True
+            self._close_ps_host()
+            if timed_out:
+                logger.warning("TTS CLI timed out for text: %r", text[:60])
+                return True
+            return False
+
+    def _close_ps_host(self) -> None:
+        proc, self._ps = self._ps, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()  # type: ignore[union-attr]
+            proc.wait(timeout=2)
+        except Exception:  # noqa: BLE001
+            proc.kill()
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    def _cli_argv_prefix(self) -> list[str]:
+        """Return the ``say``/``espeak`` command line minus the text.
+
+        Resolved on first use (one PATH lookup) and kept until
+        :attr:`settings` is replaced; empty when no such tool exists.
+        """
+        argv = self._cli_argv
+        if argv is None:
+            rate_arg = str(int(self.settings.rate))
+            if _SYSTEM == "Darwin" and shutil.which("say"):
+                argv = ["say", "-r", rate_arg]
+            elif _SYSTEM == "Linux" and shutil.which("espeak"):
+                vol_arg = str(int(self.settings.volume * 100))
+                argv = ["espeak", "-s", rate_arg, "-a", vol_arg]
+            else:
+                argv = []
+            self._cli_argv = argv
+        return argv
+
+    def _ps_setup(self) -> str:
+        """PowerShell statements that create and configure synthesizer ``$s``.
+
+        Built once and kept until :attr:`settings` is replaced, like
+        :meth:`_cli_argv_prefix`.
+        """
+        setup = self._ps_setup_str
+        if setup is not None:
+            return setup
+        # Prefer a female voice on Windows by default; allow explicit overrides via settings.voice_id.
+        voice_cmd = (
+            f'$s.SelectVoice("{self.settings.voice_id}"); '
+            if self.settings.voice_id
+            else "$s.SelectVoiceByHints([System.Speech.Synthesis.VoiceGender]::Female); "
+        )
+        setup = self._ps_setup_str = (
+            # Text arrives on stdin as UTF-8; the console default is the
+            # OEM code page, which would garble anything non-ASCII.
+            "[Console]::InputEncoding = [System.Text.Encoding]::UTF8; "
+            "Add-Type -AssemblyName System.speech; "
+            "$s = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
+            f"$s.Rate = {self._ps_rate()}; "
+            f"$s.Volume = {int(self.settings.volume * 100)}; "
+            f"{voice_cmd}"
+        )
+        return setup
+
     def _apply_settings(self, engine) -> None:  # noqa: ANN001
         try:
             engine.setProperty("rate", self.settings.rate)
@@ -12,7 +12,13 @@ continues listening after errors.
 from __future__ import annotations
 
 import logging
+import os
+import re
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable, Optional
 
 import numpy as np
@@ -29,6 +35,36 @@ try:  # Optional dependency for local STT
 except Exception:  # noqa: BLE001
     WhisperModel = None
 
+try:  # Optional dependency for the voice-activity gate
+    import webrtcvad  # type: ignore
+except Exception:  # noqa: BLE001
+    webrtcvad = None
+
+
+_WHISPER_RATE = 16000
+# Voice-activity gate: phrases are split into 10 ms frames and only sent
+# for recognition when at least this share of them contain speech.
+_VAD_FRAME_SAMPLES = _WHISPER_RATE // 100
+_VAD_MIN_VOICED = 0.2
+# Captured phrases allowed to wait for recognition before the oldest is dropped.
+_AUDIO_QUEUE_SIZE = 4
+
+# Loaded Whisper models keyed by (name, device, compute type).  Shared by
+# all listeners so recreating one (e.g. after a config change) doesn't load
+# a few hundred MB of weights again.
+_WHISPER_CACHE: dict[tuple[str, str, str], WhisperModel] = {}
+_WHISPER_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _whisper_device() -> str:
+    """Return ``"cuda"`` if CTranslate2 (faster-whisper's runtime) sees a GPU."""
+    try:
+        import ctranslate2  # type: ignore  # noqa: PLC0415
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except Exception:  # noqa: BLE001
+        return "cpu"
+
 
 class WakeWordListener:
     """Background listener for a wake word followed by a spoken command."""
@@ -40,15 +76,28 @@ class WakeWordListener:
         device_index: int | None = None,
         backend: str = "google",  # "google" | "whisper"
         whisper_model: str = "small.en",
+        whisper_device: str = "auto",  # "auto" | "cuda" | "cpu"
     ) -> None:
         self.wake_word = wake_word.lower()
+        # Whole-word and case-insensitive: "mossy" matches "Mossy, open..."
+        # but not "mossyard".  Avoids lower-casing every transcript.
+        self._wake_re = re.compile(rf"(?<!\w){re.escape(self.wake_word)}(?!\w)", re.IGNORECASE)
         self.phrase_time_limit = phrase_time_limit
         self.device_index = device_index
         self.backend = backend
         self.whisper_model_name = whisper_model
-        self._whisper_model: WhisperModel | None = None
+        self.whisper_device = whisper_device
+        # Reused float32 sample buffer for Whisper input (see _to_float32).
+        self._f32_buf: np.ndarray | None = None
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        # Captured phrases waiting for recognition, with capture time.
+        self._audio_q: deque[tuple[sr.AudioData, float]] = deque(maxlen=_AUDIO_QUEUE_SIZE)
+        self._audio_cv = threading.Condition()
+        # Runs on_command callbacks; created per start() so a restarted
+        # listener gets a fresh pool after stop() shut the old one down.
+        self._executor: ThreadPoolExecutor | None = None
+        self._vad = webrtcvad.Vad(2) if webrtcvad is not None else None
 
     @property
     def available(self) -> bool:
@@ -66,20 +115,48 @@ class WakeWordListener:
             return
         if self._thread and self._thread.is_alive():
             return
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ai-helper-wake-command")
         self._thread = threading.Thread(
             target=self._run, args=(on_command,), daemon=True, name="ai-helper-wake-word"
         )
         self._thread.start()
+        if self.backend == "whisper" and WhisperModel is not None:
+            # Load the model and run it once while the microphone is still
+            # calibrating, so the first wake word isn't held up by it.
+            threading.Thread(
+                target=self._prewarm_whisper, daemon=True, name="ai-helper-whisper-warmup"
+            ).start()
 
     def stop(self) -> None:
         """Signal the listener to stop and wait briefly."""
         self._stop.set()
+        with self._audio_cv:
+            self._audio_cv.notify_all()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # Capture (producer) and recognition (consumer) threads
+    # ------------------------------------------------------------------
 
     def _run(self, on_command: Callable[[str], None]) -> None:
+        """Capture phrases from the microphone and queue them for recognition.
+
+        Recognition runs on its own thread so a slow Google round-trip or
+        Whisper decode never delays reading the microphone.
+        """
         assert sr is not None  # for type checkers
         recognizer = sr.Recognizer()
+        finished = threading.Event()
+        with self._audio_cv:
+            self._audio_q.clear()
+        consumer = threading.Thread(
+            target=self._recognize_loop, args=(recognizer, on_command, finished),
+            daemon=True, name="ai-helper-wake-recognize",
+        )
         try:
             with sr.Microphone(device_index=self.device_index) as source:
                 recognizer.adjust_for_ambient_noise(source, duration=1)
@@ -89,59 +166,161 @@ class WakeWordListener:
                     self.backend,
                     self.device_index if self.device_index is not None else "default",
                 )
+                consumer.start()
                 while not self._stop.is_set():
                     try:
                         audio = recognizer.listen(source, timeout=None, phrase_time_limit=self.phrase_time_limit)
-                        text = self._recognize(audio, recognizer)
-                        if not text:
-                            continue
-                        lowered = text.lower()
-                        if self.wake_word in lowered:
-                            logger.info("Wake word detected: %s", text)
-                            # Capture the next phrase as the command.
-                            cmd_audio = recognizer.listen(
-                                source,
-                                timeout=5,
-                                phrase_time_limit=self.phrase_time_limit,
-                            )
-                            cmd_text = self._recognize(cmd_audio, recognizer)
-                            if cmd_text:
-                                threading.Thread(
-                                    target=on_command, args=(cmd_text,), daemon=True, name="ai-helper-wake-command"
-                                ).start()
                     except sr.WaitTimeoutError:
                         continue
                     except Exception as exc:  # noqa: BLE001
                         logger.warning("Wake-word loop error: %s", exc)
+                        continue
+                    with self._audio_cv:
+                        # Bounded, newest wins: stale speech isn't worth
+                        # recognising, so a full queue drops its oldest.
+                        self._audio_q.append((audio, time.monotonic()))
+                        self._audio_cv.notify()
         except Exception as exc:  # noqa: BLE001
             logger.warning("Wake-word listener failed to start: %s", exc)
+        finally:
+            finished.set()
+            with self._audio_cv:
+                self._audio_cv.notify_all()
+
+    def _recognize_loop(
+        self,
+        recognizer: "sr.Recognizer",
+        on_command: Callable[[str], None],
+        finished: threading.Event,
+    ) -> None:
+        # After the wake word, the next phrase captured before this deadline
+        # is the command (the capture loop used to wait 5 s for it to start).
+        command_deadline = 0.0
+        while True:
+            with self._audio_cv:
+                self._audio_cv.wait_for(
+                    lambda: self._audio_q or self._stop.is_set() or finished.is_set()
+                )
+                if not self._audio_q or self._stop.is_set():
+                    return
+                audio, captured_at = self._audio_q.popleft()
+            try:
+                text = self._recognize(audio, recognizer)
+                if not text:
+                    continue
+                if captured_at <= command_deadline:
+                    command_deadline = 0.0
+                    executor = self._executor
+                    if executor is not None:
+                        executor.submit(on_command, text)
+                elif self._wake_re.search(text):
+                    logger.info("Wake word detected: %s", text)
+                    command_deadline = time.monotonic() + 5 + self.phrase_time_limit
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Wake-word loop error: %s", exc)
 
     def _recognize(self, audio: "sr.AudioData", recognizer: "sr.Recognizer") -> str:
+        if not self._is_voiced(audio, recognizer):
+            return ""
         if self.backend == "google":
             return self._recognize_google(audio, recognizer)
         if self.backend == "whisper":
             return self._recognize_whisper(audio)
         return ""
 
+    def _is_voiced(self, audio: "sr.AudioData", recognizer: "sr.Recognizer") -> bool:
+        """Return False if too little of *audio* is speech to be worth recognising.
+
+        Uses WebRTC VAD when installed, otherwise counts frames louder than
+        the recogniser's calibrated energy threshold.  Errs towards True so a
+        failing gate never drops a real command.
+        """
+        try:
+            raw = audio.get_raw_data(convert_rate=_WHISPER_RATE, convert_width=2)
+            frame_bytes = _VAD_FRAME_SAMPLES * 2
+            n_frames = len(raw) // frame_bytes
+            if n_frames == 0:
+                return False
+            if self._vad is not None:
+                voiced = sum(
+                    self._vad.is_speech(raw[i : i + frame_bytes], _WHISPER_RATE)
+                    for i in range(0, n_frames * frame_bytes, frame_bytes)
+                )
+            else:
+                frames = np.frombuffer(raw, dtype=np.int16, count=n_frames * _VAD_FRAME_SAMPLES)
+                frames = frames.reshape(n_frames, _VAD_FRAME_SAMPLES).astype(np.float32)
+                rms = np.sqrt(np.mean(frames * frames, axis=1))
+                voiced = int(np.count_nonzero(rms > recognizer.energy_threshold))
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Voice-activity check failed: %s", exc)
+            return True
+        return voiced / n_frames >= _VAD_MIN_VOICED
+
     def _recognize_google(self, audio: "sr.AudioData", recognizer: "sr.Recognizer") -> str:
         try:
             return recognizer.recognize_google(audio)
         except Exception:  # noqa: BLE001
             return ""
 
+    def _load_whisper(self) -> WhisperModel:
+        device = self.whisper_device
+        if device == "auto":
+            device = _whisper_device()
+        # int8 weights everywhere; on GPU the activations run in fp16.
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        key = (self.whisper_model_name, device, compute_type)
+        with _WHISPER_LOCK:
+            model = _WHISPER_CACHE.get(key)
+            if model is None:
+                model = _WHISPER_CACHE[key] = WhisperModel(
+                    self.whisper_model_name,
+                    device=device,
+                    compute_type=compute_type,
+                    num_workers=1,
+                    cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                )
+            return model
+
+    def _prewarm_whisper(self) -> None:
+        try:
+            # Segments are generated lazily; consume them so decoding runs.
+            segments, _ = self._load_whisper().transcribe(
+                np.zeros(1600, dtype=np.float32), language="en"
+            )
+            list(segments)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Whisper warm-up failed: %s", exc)
+
     def _recognize_whisper(self, audio: "sr.AudioData") -> str:
         if WhisperModel is None:
             return ""
         try:
-            if self._whisper_model is None:
-                self._whisper_model = WhisperModel(self.whisper_model_name, device="cpu", compute_type="int8")
-            # Convert audio bytes to numpy int16 then float32 in range [-1, 1]
-            raw = audio.get_raw_data()
-            np_audio = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
-            sample_rate = audio.sample_rate
-            segments, _ = self._whisper_model.transcribe(np_audio, language="en", beam_size=1, vad_filter=True, word_timestamps=False, temperature=0.0, condition_on_previous_text=False, initial_prompt=None, without_timestamps=True, vad_parameters={"min_silence_duration_ms": 500}, speed_up=False, sample_rate=sample_rate)
+            model = self._load_whisper()
+            # Whisper expects 16 kHz mono; let AudioData resample the
+            # microphone's native rate instead of passing it to the model.
+            raw = audio.get_raw_data(convert_rate=_WHISPER_RATE, convert_width=2)
+            np_audio = self._to_float32(raw)
+            segments, _ = model.transcribe(np_audio, language="en", beam_size=1, vad_filter=True, word_timestamps=False, temperature=0.0, condition_on_previous_text=False, initial_prompt=None, without_timestamps=True, vad_parameters={"min_silence_duration_ms": 500})
             text = " ".join(seg.text.strip() for seg in segments) if segments else ""
             return text.strip()
         except Exception as exc:  # noqa: BLE001
             logger.debug("Whisper recognize failed: %s", exc)
             return ""
+
+    def _to_float32(self, raw: bytes) -> np.ndarray:
+        """Convert 16-bit PCM to float32 samples in [-1, 1).
+
+        Scales straight from the int16 view into a buffer kept across
+        calls, in one pass, instead of allocating a float32 copy and then
+        a second array for the division.  The result is a view into that
+        buffer, valid until the next call.
+        """
+        n = len(raw) // 2
+        buf = self._f32_buf
+        if buf is None or buf.size < n:
+            buf = self._f32_buf = np.empty(
+                max(n, int(self.phrase_time_limit * _WHISPER_RATE)), dtype=np.float32
+            )
+        out = buf[:n]
+        np.multiply(np.frombuffer(raw, dtype=np.int16, count=n), np.float32(1 / 32768), out=out)
+        return out
@@ -87,6 +87,40 @@ class TestCommunicatorVoice(unittest.TestCase):
         self.assertIn("disk full", spoken)
 
 
+class TestCommunicatorAlertBatch(unittest.TestCase):
+    def test_single_alert_behaves_like_alert(self):
+        comm = Communicator()
+        comm.notifier = MagicMock()
+        comm.alert_batch([("disk full", "monitor", "normal", "alert")])
+        comm.notifier.notify.assert_called_once_with(
+            title="monitor", message="disk full", urgency="normal"
+        )
+
+    def test_batch_sends_one_notification(self):
+        mock_speaker = MagicMock()
+        comm = Communicator(speaker=mock_speaker, speak_alerts=True)
+        comm.notifier = MagicMock()
+        received = []
+        comm.subscribe("*", received.append)
+        comm.alert_batch([
+            ("CPU high", "monitor", "normal", "alert"),
+            ("GPU hot", "gpu_monitor", "critical", "gpu_alert"),
+        ])
+        self.assertEqual(len(received), 2)
+        comm.notifier.notify.assert_called_once()
+        kwargs = comm.notifier.notify.call_args.kwargs
+        self.assertEqual(kwargs["urgency"], "critical")
+        self.assertIn("CPU high", kwargs["message"])
+        self.assertIn("GPU hot", kwargs["message"])
+        mock_speaker.speak.assert_called_once()
+
+    def test_empty_batch_is_noop(self):
+        comm = Communicator()
+        comm.notifier = MagicMock()
+        comm.alert_batch([])
+        comm.notifier.notify.assert_not_called()
+
+
 class TestCommunicatorBus(unittest.TestCase):
     def test_publish_and_subscribe(self):
         received = []
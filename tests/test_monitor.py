@@ -37,6 +37,16 @@ class TestSystemMonitor(unittest.TestCase):
         self.assertGreaterEqual(snap.cpu_percent, 0.0)
         self.assertGreaterEqual(snap.memory_percent, 0.0)
 
+    def test_snapshot_multiple_disk_paths_keeps_order_and_skips_missing(self):
+        monitor = SystemMonitor(disk_paths=["/", "/definitely/not/here", "/"])
+        snap = monitor.snapshot()
+        self.assertEqual([d.path for d in snap.disks], ["/", "/"])
+
+    def test_init_primes_cpu_percent(self):
+        with patch("ai_helper.monitor.psutil.cpu_percent", return_value=0.0) as cpu:
+            SystemMonitor()
+        cpu.assert_called_once_with(interval=None)
+
     def test_no_alerts_when_below_threshold(self):
         snap = _make_snapshot(cpu=10.0, mem=20.0, disk_pct=30.0)
         alerts = self.monitor.alerts(snap)
@@ -71,6 +81,42 @@ class TestSystemMonitor(unittest.TestCase):
         alerts = self.monitor.alerts()
         self.assertIsInstance(alerts, list)
 
+    def test_alert_text_includes_threshold(self):
+        monitor = SystemMonitor(thresholds={"cpu": 50.0})
+        alerts = monitor.alerts(_make_snapshot(cpu=90.0))
+        self.assertEqual(alerts, ["High CPU usage: 90.0% (threshold 50%)"])
+
+    def test_reassigning_thresholds_updates_alert_text(self):
+        monitor = SystemMonitor()
+        monitor.thresholds = {"cpu": 40.0, "memory": 90.0, "disk": 90.0}
+        alerts = monitor.alerts(_make_snapshot(cpu=45.0))
+        self.assertEqual(alerts, ["High CPU usage: 45.0% (threshold 40%)"])
+
+    def test_mutating_assigned_dict_does_not_desync_alerts(self):
+        monitor = SystemMonitor()
+        values = {"cpu": 40.0, "memory": 90.0, "disk": 90.0}
+        monitor.thresholds = values
+        values["cpu"] = 10.0
+        alerts = monitor.alerts(_make_snapshot(cpu=45.0))
+        self.assertEqual(alerts, ["High CPU usage: 45.0% (threshold 40%)"])
+        with self.assertRaises(TypeError):
+            monitor.thresholds["cpu"] = 1.0  # type: ignore[index]
+
+    def test_default_thresholds_shared_and_read_only(self):
+        self.assertIs(SystemMonitor().thresholds, DEFAULT_THRESHOLDS)
+        with self.assertRaises(TypeError):
+            DEFAULT_THRESHOLDS["cpu"] = 1.0  # type: ignore[index]
+
+    def test_partial_thresholds_merge_with_defaults(self):
+        monitor = SystemMonitor(thresholds={"cpu": 50.0})
+        self.assertEqual(monitor.thresholds["cpu"], 50.0)
+        self.assertEqual(monitor.thresholds["disk"], DEFAULT_THRESHOLDS["disk"])
+
+    def test_snapshot_types_use_slots(self):
+        snap = _make_snapshot()
+        for obj in (snap, snap.disks[0], snap.network):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import unittest
 
@@ -32,6 +33,13 @@ class TestNotificationCenter(unittest.TestCase):
         rec2 = nc.notify("CPU high", source="monitor")
         self.assertFalse(rec2.suppressed)
 
+    def test_dedup_distinguishes_long_messages(self):
+        nc = self._nc(dedup_seconds=60, throttle_seconds=0)
+        prefix = "x" * 500
+        nc.notify(prefix + "a", source="monitor")
+        rec2 = nc.notify(prefix + "b", source="monitor")
+        self.assertFalse(rec2.suppressed)
+
     def test_throttle_suppresses_different_message_same_topic(self):
         nc = self._nc(throttle_seconds=60)
         nc.notify("msg1", source="monitor", topic="myapp")
@@ -82,6 +90,19 @@ class TestNotificationCenter(unittest.TestCase):
         active = nc.active_alerts()
         self.assertEqual(len(active), 1)
 
+    def test_active_alerts_limit_newest_first(self):
+        nc = self._nc(dedup_seconds=60, throttle_seconds=0)
+        for msg in ("a", "a", "b", "c"):
+            nc.notify(msg, source="s")
+        self.assertEqual([r.message for r in nc.active_alerts(limit=2)], ["c", "b"])
+        self.assertEqual([r.message for r in nc.active_alerts()], ["c", "b", "a"])
+
+    def test_active_alerts_follow_history_eviction(self):
+        nc = self._nc(history_size=2, dedup_seconds=0, throttle_seconds=0)
+        for i in range(3):
+            nc.notify(f"m{i}", source="s", topic=f"t{i}")
+        self.assertEqual([r.message for r in nc.active_alerts()], ["m2", "m1"])
+
     def test_format_history_contains_message(self):
         nc = self._nc()
         nc.notify("High CPU", source="monitor", urgency="critical")
@@ -106,6 +127,16 @@ class TestNotificationCenter(unittest.TestCase):
         self.assertIn("from monitor", text)
         self.assertNotIn("from gpu", text)
 
+    def test_format_history_limit_keeps_newest(self):
+        nc = self._nc(dedup_seconds=0, throttle_seconds=0)
+        for i in range(5):
+            nc.notify(f"msg {i}", source="s", topic=f"t{i}")
+        text = nc.format_history(limit=2)
+        self.assertIn("2 shown", text)
+        self.assertIn("msg 4", text)
+        self.assertIn("msg 3", text)
+        self.assertNotIn("msg 2", text)
+
     def test_stats_string(self):
         nc = self._nc()
         nc.notify("msg", source="s", urgency="critical")
@@ -113,10 +144,31 @@ class TestNotificationCenter(unittest.TestCase):
         self.assertIn("active", stats)
         self.assertIn("critical", stats)
 
+    def test_stats_counts_track_evictions(self):
+        nc = self._nc(history_size=3, dedup_seconds=60, throttle_seconds=0)
+        nc.notify("a", source="s", urgency="critical")
+        nc.notify("a", source="s")  # suppressed
+        nc.notify("b", source="s")
+        self.assertEqual(
+            nc.stats(),
+            "Notifications: 2 active, 1 suppressed, 1 critical, 0 escalated",
+        )
+        nc.notify("c", source="s")  # evicts the critical "a"
+        self.assertEqual(
+            nc.stats(),
+            "Notifications: 2 active, 1 suppressed, 0 critical, 0 escalated",
+        )
+        nc.clear_history()
+        self.assertEqual(
+            nc.stats(),
+            "Notifications: 0 active, 0 suppressed, 0 critical, 0 escalated",
+        )
+
     def test_on_notify_callback_called(self):
         received = []
         nc = self._nc(on_notify=received.append)
         nc.notify("test", source="s")
+        self.assertTrue(nc.flush(timeout=5))
         self.assertEqual(len(received), 1)
         self.assertEqual(received[0].message, "test")
 
@@ -125,8 +177,41 @@ class TestNotificationCenter(unittest.TestCase):
         nc = self._nc(dedup_seconds=60, on_notify=received.append)
         nc.notify("dup", source="s")
         nc.notify("dup", source="s")
+        self.assertTrue(nc.flush(timeout=5))
         self.assertEqual(len(received), 1)
 
+    def test_on_notify_runs_off_the_calling_thread(self):
+        release = threading.Event()
+        threads = []
+
+        def slow(rec):
+            threads.append(threading.current_thread())
+            release.wait(5)
+
+        nc = self._nc(on_notify=slow)
+        nc.notify("a", source="s")  # returns without waiting on the callback
+        self.assertFalse(nc.flush(timeout=0.05))
+        release.set()
+        self.assertTrue(nc.flush(timeout=5))
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_on_notify_overflow_drops_oldest(self):
+        release = threading.Event()
+        received = []
+
+        def blocking(rec):
+            release.wait(5)
+            received.append(rec.message)
+
+        nc = self._nc(dedup_seconds=0, throttle_seconds=0, max_inflight=2,
+                      on_notify=blocking)
+        for i in range(5):
+            nc.notify(f"m{i}", source="s", topic=f"t{i}")
+        release.set()
+        self.assertTrue(nc.flush(timeout=5))
+        self.assertEqual(received[-2:], ["m3", "m4"])
+        self.assertIn("callbacks dropped", nc.stats())
+
     def test_clear_history(self):
         nc = self._nc()
         nc.notify("a", source="s")
@@ -148,6 +233,32 @@ class TestNotificationCenter(unittest.TestCase):
                                  topic="t", escalated=True)
         self.assertIn("ESCALATED", str(rec))
 
+    def test_notification_record_time_str(self):
+        ts = time.mktime((2024, 1, 2, 3, 4, 5, 0, 0, -1))
+        rec = NotificationRecord(message="x", source="s", urgency="low", topic="t", ts=ts)
+        self.assertEqual(rec.time_str, "2024-01-02 03:04:05")
+        self.assertIn("[2024-01-02 03:04:05]", str(rec))
+
+    def test_notification_record_has_no_instance_dict(self):
+        rec = NotificationRecord(message="x", source="s", urgency="low", topic="t")
+        self.assertFalse(hasattr(rec, "__dict__"))
+
+    def test_purge_drops_expired_state(self):
+        nc = self._nc(dedup_seconds=0.01, throttle_seconds=0.01, escalate_window=0.01)
+        nc.notify("a", source="s", topic="t1")
+        nc.notify("b", source="s", topic="t2")
+        time.sleep(0.05)
+        nc._purge(time.monotonic())
+        self.assertEqual(nc._last_fire, {})
+        self.assertEqual(nc._last_topic, {})
+        self.assertEqual(len(nc._fire_times), 0)
+
+    def test_purge_keeps_live_state(self):
+        nc = self._nc(dedup_seconds=60)
+        nc.notify("a", source="s")
+        nc._purge(time.monotonic())
+        self.assertTrue(nc.notify("a", source="s").suppressed)
+
     def test_history_maxsize(self):
         nc = self._nc(history_size=5, dedup_seconds=0, throttle_seconds=0)
         for i in range(10):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -10,6 +12,7 @@ from unittest.mock import MagicMock, patch
 from ai_helper.memory import Memory
 from ai_helper.notification_center import NotificationCenter
 from ai_helper.orchestrator import Orchestrator
+from ai_helper.scheduler import TaskScheduler
 
 
 class TestOrchestratorWithMemoryAndNC(unittest.TestCase):
@@ -22,7 +25,7 @@ class TestOrchestratorWithMemoryAndNC(unittest.TestCase):
     def tearDown(self):
         self._tmp.cleanup()
 
-    def _make_orchestrator(self):
+    def _make_orchestrator(self, **kwargs):
         monitor = MagicMock()
         monitor.snapshot.return_value = MagicMock(
             cpu_percent=45.0,
@@ -51,6 +54,7 @@ class TestOrchestratorWithMemoryAndNC(unittest.TestCase):
             ai_registry=ai_reg,
             notification_center=self.nc,
             memory=self.mem,
+            **kwargs,
         )
 
     def test_tick_no_alerts(self):
@@ -99,6 +103,56 @@ class TestOrchestratorWithMemoryAndNC(unittest.TestCase):
         active = orch.notification_center.active_alerts()
         self.assertEqual(len(active), 1)
 
+    def test_debug_summaries_skipped_when_debug_disabled(self):
+        orch = self._make_orchestrator()
+        with patch("ai_helper.orchestrator.logger.isEnabledFor", return_value=False):
+            orch.tick()
+        orch.monitor.format_snapshot.assert_not_called()
+        orch.process_manager.summary.assert_not_called()
+
+    def test_sequential_tick_fires_alerts(self):
+        orch = self._make_orchestrator(parallel=False)
+        orch.monitor.alerts.return_value = ["CPU is 97%"]
+        orch.tick()
+        self.assertIsNone(orch._executor)
+        self.assertEqual(len(self.nc.active_alerts()), 1)
+
+    def test_parallel_tick_collects_both_sources(self):
+        orch = self._make_orchestrator()
+        orch.tick()
+        orch.monitor.snapshot.assert_called_once()
+        orch.process_manager.list_processes.assert_called_once()
+        orch.stop()
+        self.assertIsNone(orch._executor)
+
+    def test_interval_backs_off_while_calm(self):
+        orch = self._make_orchestrator()
+        orch.poll_interval = orch._current_interval = 10.0
+        orch.tick()
+        intervals = []
+        for _ in range(4):
+            orch._current_interval = orch._next_interval()
+            intervals.append(orch._current_interval)
+        self.assertEqual(intervals, [15.0, 20.0, 20.0, 20.0])
+
+    def test_interval_resets_on_alert(self):
+        orch = self._make_orchestrator()
+        orch.poll_interval = 10.0
+        orch._current_interval = 20.0
+        orch.monitor.alerts.return_value = ["CPU is 97%"]
+        orch.tick()
+        self.assertEqual(orch._next_interval(), 10.0)
+
+    def test_tick_delivers_alerts_in_one_batch(self):
+        orch = self._make_orchestrator()
+        orch.communicator = MagicMock()
+        orch.monitor.alerts.return_value = ["CPU is 97%", "Memory is 95%"]
+        orch.tick()
+        orch.communicator.alert.assert_not_called()
+        orch.communicator.alert_batch.assert_called_once()
+        batch = orch.communicator.alert_batch.call_args[0][0]
+        self.assertEqual([a[0] for a in batch], ["CPU is 97%", "Memory is 95%"])
+
     def test_orchestrator_has_memory(self):
         orch = self._make_orchestrator()
         self.assertIsNotNone(orch.memory)
@@ -114,6 +168,74 @@ class TestOrchestratorWithMemoryAndNC(unittest.TestCase):
         orch.stop()
         self.assertFalse(orch.running)
 
+    def test_orchestrators_share_scheduler_thread(self):
+        sched = TaskScheduler(resolution=0.05)
+        first = self._make_orchestrator(scheduler=sched)
+        second = self._make_orchestrator(scheduler=sched)
+        first.start()
+        second.start()
+        try:
+            self.assertTrue(first.running)
+            self.assertTrue(second.running)
+            self.assertIsNone(first._thread)
+            self.assertEqual(len(sched.status()), 2)
+            first._scheduled_tick()
+            first.monitor.snapshot.assert_called_once()
+        finally:
+            first.stop()
+            second.stop()
+            sched.stop()
+        self.assertFalse(first.running)
+        self.assertEqual(sched.status(), [])
+
+    def test_stop_during_scheduled_tick_defers_executor_shutdown(self):
+        sched = TaskScheduler(resolution=0.05)
+        orch = self._make_orchestrator(scheduler=sched, poll_interval=60)
+        in_tick, release = threading.Event(), threading.Event()
+        snap = orch.monitor.snapshot.return_value
+        orch.monitor.snapshot.side_effect = lambda: (in_tick.set(), release.wait(5), snap)[2]
+        orch.start()
+        worker = threading.Thread(target=orch._scheduled_tick)
+        try:
+            worker.start()
+            self.assertTrue(in_tick.wait(5))
+            orch.stop()
+            executor = orch._executor
+            self.assertIsNotNone(executor)          # still in use by the tick
+            release.set()
+            worker.join(5)
+            self.assertIsNone(orch._executor)       # shut down by the tick itself
+            orch.monitor.snapshot.reset_mock()
+            orch._scheduled_tick()                  # a late tick is a no-op
+            orch.monitor.snapshot.assert_not_called()
+            self.assertIsNone(orch._executor)
+        finally:
+            release.set()
+            sched.stop()
+
+    def test_tick_after_stop_does_not_create_executor(self):
+        orch = self._make_orchestrator()
+        orch.stop()
+        orch.tick()
+        orch.monitor.snapshot.assert_called_once()
+        self.assertIsNone(orch._executor)
+
+    def test_arun_ticks_until_stopped(self):
+        orch = self._make_orchestrator()
+        orch.poll_interval = 0.01
+
+        async def _drive():
+            task = asyncio.create_task(orch.arun())
+            while orch.monitor.snapshot.call_count < 2:
+                await asyncio.sleep(0.01)
+            self.assertTrue(orch.running)
+            orch.stop()
+            await asyncio.wait_for(task, timeout=5)
+
+        asyncio.run(_drive())
+        self.assertFalse(orch.running)
+        self.assertIsNone(orch._executor)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import errno
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from ai_helper.organizer import (
     FileCategory,
     FileOrganizer,
     OrganiseResult,
+    _DestNames,
+    _default_target_dir,
     categorise_file,
 )
 
@@ -37,6 +41,42 @@ class TestCategoriseFile(unittest.TestCase):
         self.assertEqual(categorise_file(Path("IMAGE.PNG")), FileCategory.IMAGES)
 
 
+class TestCategoriseName(unittest.TestCase):
+    def setUp(self):
+        self.organizer = FileOrganizer(target_dir=Path("."), downloads_dir=Path("."))
+
+    def test_matches_path_suffix_semantics(self):
+        for name in ("a.PDF", "archive.tar.gz", ".bashrc", "noext", "trailing.", ".hidden.py"):
+            self.assertEqual(
+                self.organizer._categorise_name(name),
+                categorise_file(Path(name)),
+                name,
+            )
+
+    def test_custom_map_is_case_insensitive(self):
+        organizer = FileOrganizer(target_dir=Path("."), downloads_dir=Path("."),
+                                  custom_map={".BLEND": FileCategory.DATA})
+        self.assertEqual(organizer._categorise_name("scene.blend"), FileCategory.DATA)
+        self.assertEqual(organizer._categorise_name("scene.Blend"), FileCategory.DATA)
+
+    def test_default_target_dir_resolved_once(self):
+        _default_target_dir.cache_clear()
+        try:
+            with patch("ai_helper.organizer.Path.home", return_value=Path("/h")) as home:
+                a = FileOrganizer(downloads_dir=Path("."))
+                b = FileOrganizer(downloads_dir=Path("."))
+            self.assertEqual((a.target_dir, b.target_dir), (Path("/h/Desktop"),) * 2)
+            self.assertEqual(home.call_count, 1)
+        finally:
+            _default_target_dir.cache_clear()
+
+    def test_default_map_is_shared_not_copied(self):
+        other = FileOrganizer(target_dir=Path("."), downloads_dir=Path("."))
+        self.assertIs(self.organizer._ext_map, other._ext_map)
+        with self.assertRaises(TypeError):
+            self.organizer._ext_map[".blend"] = FileCategory.DATA
+
+
 class TestFileOrganizerDryRun(unittest.TestCase):
     def setUp(self):
         self._tmp = TemporaryDirectory()
@@ -80,6 +120,26 @@ class TestFileOrganizerDryRun(unittest.TestCase):
         expected = self.dst_path / FileCategory.DOCUMENTS.value / "document.pdf"
         self.assertTrue(expected.exists(), f"Expected file at {expected}")
 
+    def test_same_filesystem_move_uses_rename(self):
+        self._create_file("a.txt")
+        self._create_file("b.txt")
+        organizer = FileOrganizer(target_dir=self.src_path, downloads_dir=self.dst_path)
+        with patch("ai_helper.organizer.shutil.move") as move:
+            result = organizer.organise()
+        move.assert_not_called()
+        self.assertEqual(len(result.moves), 2)
+        for record in result.moves:
+            self.assertTrue(record.destination.exists())
+
+    def test_cross_filesystem_move_falls_back_to_shutil(self):
+        self._create_file("a.txt")
+        organizer = FileOrganizer(target_dir=self.src_path, downloads_dir=self.dst_path)
+        with patch("ai_helper.organizer.os.replace",
+                   side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            result = organizer.organise()
+        self.assertEqual(result.errors, [])
+        self.assertTrue(result.moves[0].destination.exists())
+
     def test_real_move_to_downloads_dir(self):
         """Organised files go to downloads_dir, not a subfolder of target_dir."""
         self._create_file("video.mp4")
@@ -102,6 +162,32 @@ class TestFileOrganizerDryRun(unittest.TestCase):
         self.assertTrue((self.src_path / "song.flac").exists())
         self.assertIn(Path(self.src_path / "song.flac"), mapping[FileCategory.MUSIC])
 
+    def test_scan_non_recursive_ignores_subdirs(self):
+        self._create_file("top.txt")
+        (self.src_path / "sub").mkdir()
+        (self.src_path / "sub" / "nested.txt").write_text("x")
+        organizer = FileOrganizer(target_dir=self.src_path, downloads_dir=self.dst_path)
+        self.assertEqual(organizer.scan()[FileCategory.DOCUMENTS], [self.src_path / "top.txt"])
+
+    def test_recursive_organise_skips_nested_files(self):
+        self._create_file("top.txt")
+        (self.src_path / "sub").mkdir()
+        (self.src_path / "sub" / "nested.txt").write_text("x")
+        organizer = FileOrganizer(
+            target_dir=self.src_path,
+            downloads_dir=self.dst_path,
+            dry_run=True,
+            recursive=True,
+        )
+        result = organizer.organise()
+        self.assertEqual([m.source.name for m in result.moves], ["top.txt"])
+        self.assertEqual(result.skipped, [self.src_path / "sub" / "nested.txt"])
+
+    def test_missing_target_dir_yields_nothing(self):
+        organizer = FileOrganizer(target_dir=self.src_path / "missing",
+                                  downloads_dir=self.dst_path)
+        self.assertEqual(organizer.organise().total_files, 0)
+
     def test_unique_dest_avoids_collision(self):
         # Create two files with same name
         self._create_file("readme.txt")
@@ -120,6 +206,30 @@ class TestFileOrganizerDryRun(unittest.TestCase):
         # The moved file should have been renamed
         self.assertEqual(result.moves[0].destination.name, "readme (1).txt")
 
+    def test_dry_run_reserves_destination_names(self):
+        dest_dir = self.dst_path / FileCategory.DOCUMENTS.value
+        dest_dir.mkdir(parents=True)
+        (dest_dir / "a.txt").write_text("existing")
+        (dest_dir / "a (1).txt").write_text("existing")
+        self._create_file("a.txt")
+        organizer = FileOrganizer(target_dir=self.src_path, downloads_dir=self.dst_path,
+                                  dry_run=True)
+        result = organizer.organise()
+        self.assertEqual(result.moves[0].destination.name, "a (2).txt")
+
+    def test_unique_dest_with_taken_names(self):
+        taken = _DestNames(iter(["x.txt", "x (2).txt"]))
+        names = [FileOrganizer._unique_dest(self.dst_path, "x.txt", taken).name
+                 for _ in range(3)]
+        self.assertEqual(names, ["x (1).txt", "x (3).txt", "x (4).txt"])
+        self.assertEqual(taken.claim("y.txt"), "y.txt")
+
+    def test_claim_matches_path_stem_and_suffix(self):
+        for name in (".env", "noext", "archive.tar.gz"):
+            taken = _DestNames(iter([name]))
+            p = Path(name)
+            self.assertEqual(taken.claim(name), f"{p.stem} (1){p.suffix}")
+
     def test_undo_restores_files(self):
         self._create_file("undo_me.json")
         organizer = FileOrganizer(
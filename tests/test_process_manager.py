@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -24,6 +26,37 @@ class TestProcessManager(unittest.TestCase):
         self.assertIsInstance(procs, list)
         self.assertGreater(len(procs), 0)
 
+    def test_thread_counts_only_when_requested(self):
+        self.assertTrue(all(p.num_threads == 0 for p in self.pm.list_processes()))
+        pm = ProcessManager(include_threads=True)
+        self.assertTrue(any(p.num_threads > 0 for p in pm.list_processes()))
+
+    def test_list_processes_cached_within_ttl(self):
+        pm = ProcessManager(cache_ttl=60.0)
+        with patch("ai_helper.process_manager.psutil.process_iter", return_value=[]) as it:
+            first = pm.list_processes()
+            second = pm.list_processes()
+            self.assertIs(first, second)
+            self.assertEqual(it.call_count, 1)
+            pm.invalidate()
+            pm.list_processes()
+            self.assertEqual(it.call_count, 2)
+
+    def test_denied_attributes_keep_process(self):
+        proc = MagicMock()
+        proc.info = {"pid": 7, "name": None, "status": "sleeping",
+                     "cpu_percent": None, "memory_info": None}
+        with patch("ai_helper.process_manager.psutil.process_iter", return_value=[proc]):
+            procs = ProcessManager(cache_ttl=0).list_processes()
+        self.assertEqual(procs, [ProcessInfo(7, "<unknown>", "sleeping", 0.0, 0.0, 0)])
+
+    def test_zero_ttl_disables_cache(self):
+        pm = ProcessManager(cache_ttl=0)
+        with patch("ai_helper.process_manager.psutil.process_iter", return_value=[]) as it:
+            pm.list_processes()
+            pm.list_processes()
+        self.assertEqual(it.call_count, 2)
+
     def test_high_cpu_processes(self):
         procs = [
             _make_proc(pid=1, cpu=10.0),
@@ -46,11 +79,37 @@ class TestProcessManager(unittest.TestCase):
         procs = self.pm.find_by_name("python")
         self.assertIsInstance(procs, list)
 
+    def test_find_by_name_matches_own_process(self):
+        found = ProcessManager(cache_ttl=0).find_by_name("python")
+        self.assertIn(os.getpid(), [p.pid for p in found])
+        me = next(p for p in found if p.pid == os.getpid())
+        self.assertGreater(me.memory_mb, 0)
+
+    def test_find_by_name_uses_fresh_cache(self):
+        pm = ProcessManager(cache_ttl=60.0)
+        pm._cache = [_make_proc(pid=1, name="Chrome"), _make_proc(pid=2, name="bash")]
+        pm._cache_ts = time.monotonic()
+        with patch("ai_helper.process_manager.psutil.process_iter") as it:
+            found = pm.find_by_name("chrome")
+        it.assert_not_called()
+        self.assertEqual([p.pid for p in found], [1])
+
     def test_summary_contains_total(self):
         procs = [_make_proc(pid=i) for i in range(5)]
         summary = self.pm.summary(procs)
         self.assertIn("5", summary)
 
+    def test_summary_tallies_status_and_hogs(self):
+        procs = [
+            _make_proc(pid=1, name="a", status="running", cpu=90.0),
+            _make_proc(pid=2, name="b", status="sleeping", mem=900.0),
+            _make_proc(pid=3, name="c", status="zombie"),
+        ]
+        summary = self.pm.summary(procs)
+        self.assertIn("Running:  1  Sleeping: 1  Zombie: 1", summary)
+        self.assertIn("a[1](90.0%)", summary)
+        self.assertIn("b[2](900 MB)", summary)
+
     def test_terminate_nonexistent_returns_false(self):
         result = self.pm.terminate(pid=99999999)
         self.assertFalse(result)
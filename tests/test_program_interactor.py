@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import signal
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 from ai_helper.program_interactor import (
@@ -11,6 +14,9 @@ from ai_helper.program_interactor import (
     CommunicateResult,
     LaunchResult,
     ProgramInteractor,
+    _path_roots,
+    _program_files_roots,
+    _win_iter_dir,
 )
 
 
@@ -34,6 +40,18 @@ class TestProgramInteractor(unittest.TestCase):
         self.assertEqual(result.returncode, 0)
         self.assertIn("hello", result.stdout)
 
+    def test_communicate_accepts_argv_list(self):
+        with patch("ai_helper.program_interactor.shlex.split") as split:
+            result = self.pi.communicate(["echo", "a b"], args=["c"])
+        split.assert_not_called()
+        self.assertEqual(result.stdout.strip(), "a b c")
+        self.assertEqual(result.command, "echo 'a b'")
+
+    def test_communicate_binary_returns_bytes(self):
+        result = self.pi.communicate("cat", input_data=b"\xff\x00", binary=True)
+        self.assertEqual(result.stdout, b"\xff\x00")
+        self.assertEqual(result.stderr, b"")
+
     def test_communicate_nonexistent_command(self):
         result = self.pi.communicate("nonexistent_program_xyz_404")
         self.assertIsInstance(result, CommunicateResult)
@@ -59,6 +77,14 @@ class TestProgramInteractor(unittest.TestCase):
         result = self.pi.launch("echo", args=["hi"], detach=False)
         self.assertIsInstance(result, LaunchResult)
 
+    def test_launch_env_only_copied_when_given(self):
+        with patch("ai_helper.program_interactor.subprocess.Popen") as popen:
+            popen.return_value.pid = 1
+            self.pi.launch("echo", detach=False)
+            self.assertNotIn("env", popen.call_args.kwargs)
+            self.pi.launch("echo", env={"AI_HELPER_X": "1"}, detach=False)
+            self.assertEqual(popen.call_args.kwargs["env"]["AI_HELPER_X"], "1")
+
     def test_find_running_python(self):
         # The test process itself is Python, so there must be at least one.
         found = self.pi.find_running("python")
@@ -78,6 +104,104 @@ class TestProgramInteractor(unittest.TestCase):
         # On any platform there should be at least a few executables
         self.assertGreater(len(apps), 0)
 
+    def test_list_installed_windows_walks_program_files(self):
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "Vendor" / "App").mkdir(parents=True)
+            (root / "Vendor" / "App" / "Tool.EXE").write_text("")
+            (root / "Vendor" / "readme.txt").write_text("")
+            (root / "Other").mkdir()
+            (root / "Other" / "other.exe").write_text("")
+            (root / "top.exe").write_text("")
+            env = {"PROGRAMFILES": tmp, "PROGRAMFILES(X86)": str(root / "missing")}
+            with patch.dict(os.environ, env):
+                apps = self.pi._list_installed_windows()
+        self.assertEqual([a.name for a in apps], ["other", "Tool", "top"])
+        self.assertTrue(apps[1].path.endswith("Tool.EXE"))
+
+    def test_win_iter_dir_falls_back_without_kernel32(self):
+        with TemporaryDirectory() as tmp:
+            (Path(tmp) / "sub").mkdir()
+            (Path(tmp) / "a.exe").write_text("")
+            with patch("ai_helper.program_interactor._win_find_api", return_value=None):
+                entries = sorted(_win_iter_dir(tmp))
+        self.assertEqual(entries, [("a.exe", False), ("sub", True)])
+
+    def test_list_installed_cached_until_root_changes(self):
+        with TemporaryDirectory() as tmp:
+            bin_dir = Path(tmp) / "bin"
+            bin_dir.mkdir()
+            tool = bin_dir / "tool"
+            tool.write_text("")
+            tool.chmod(0o755)
+            with patch("ai_helper.program_interactor._SYSTEM", "Linux"), \
+                    patch("ai_helper.program_interactor._LIST_INSTALLED", "_list_installed_linux"), \
+                    patch("ai_helper.program_interactor._INSTALLED_ROOTS", _path_roots), \
+                    patch.dict(os.environ, {"PATH": str(bin_dir)}):
+                pi = ProgramInteractor()
+                with patch.object(pi, "_list_installed_linux",
+                                  wraps=pi._list_installed_linux) as scan:
+                    self.assertEqual([a.name for a in pi.list_installed()], ["tool"])
+                    pi.list_installed()
+                    self.assertEqual(scan.call_count, 1)
+                    other = bin_dir / "other"
+                    other.write_text("")
+                    other.chmod(0o755)
+                    os.utime(bin_dir, ns=(0, os.stat(bin_dir).st_mtime_ns + 10**9))
+                    self.assertEqual(len(pi.list_installed()), 2)
+                    self.assertEqual(scan.call_count, 2)
+
+    def test_list_installed_sees_install_inside_existing_subdirectory(self):
+        with TemporaryDirectory() as tmp:
+            vendor = Path(tmp) / "Vendor"
+            vendor.mkdir()
+            (vendor / "old.exe").write_text("")
+            with patch("ai_helper.program_interactor._LIST_INSTALLED", "_list_installed_windows"), \
+                    patch("ai_helper.program_interactor._INSTALLED_ROOTS", _program_files_roots), \
+                    patch.dict(os.environ, {"PROGRAMFILES": tmp,
+                                            "PROGRAMFILES(X86)": str(Path(tmp) / "missing")}):
+                pi = ProgramInteractor()
+                self.assertEqual([a.name for a in pi.list_installed()], ["old"])
+                root_mtime = os.stat(tmp).st_mtime_ns
+                (vendor / "new.exe").write_text("")
+                os.utime(vendor, ns=(0, os.stat(vendor).st_mtime_ns + 10**9))
+                os.utime(tmp, ns=(0, root_mtime))     # top level untouched
+                self.assertEqual([a.name for a in pi.list_installed()], ["new", "old"])
+
+    def test_list_installed_rescans_after_ttl(self):
+        with TemporaryDirectory() as bin_dir:
+            with patch("ai_helper.program_interactor._LIST_INSTALLED", "_list_installed_linux"), \
+                    patch("ai_helper.program_interactor._INSTALLED_ROOTS", _path_roots), \
+                    patch.dict(os.environ, {"PATH": bin_dir}):
+                pi = ProgramInteractor(cache_ttl=60)
+                with patch.object(pi, "_list_installed_linux", return_value=[]) as scan, \
+                        patch("ai_helper.program_interactor.time.time", return_value=1000.0):
+                    pi.list_installed()
+                    pi.list_installed()
+                self.assertEqual(scan.call_count, 1)
+                with patch.object(pi, "_list_installed_linux", return_value=[]) as scan, \
+                        patch("ai_helper.program_interactor.time.time", return_value=1061.0):
+                    pi.list_installed()
+                scan.assert_called_once()
+
+    def test_list_installed_persists_cache_file(self):
+        with TemporaryDirectory() as tmp, TemporaryDirectory() as bin_dir:
+            cache = Path(tmp) / "cache" / "installed.json"
+            with patch("ai_helper.program_interactor._SYSTEM", "Linux"), \
+                    patch("ai_helper.program_interactor._LIST_INSTALLED", "_list_installed_linux"), \
+                    patch("ai_helper.program_interactor._INSTALLED_ROOTS", _path_roots), \
+                    patch.dict(os.environ, {"PATH": bin_dir}):
+                first = ProgramInteractor(cache_file=cache).list_installed()
+                self.assertTrue(cache.exists())
+                second_pi = ProgramInteractor(cache_file=cache)
+                with patch.object(second_pi, "_list_installed_linux") as scan:
+                    self.assertEqual(second_pi.list_installed(), first)
+                scan.assert_not_called()
+
+    def test_list_installed_unknown_platform_is_empty(self):
+        with patch("ai_helper.program_interactor._LIST_INSTALLED", None):
+            self.assertEqual(ProgramInteractor().list_installed(), [])
+
     def test_communicate_result_str(self):
         r = CommunicateResult(command="ls", returncode=0, stdout="file.txt\n", stderr="")
         self.assertIn("ls", str(r))
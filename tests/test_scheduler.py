@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import unittest
 
@@ -25,6 +26,18 @@ class TestTask(unittest.TestCase):
         self.assertEqual(task.error_count, 1)
         self.assertIsNotNone(task.last_error)
 
+    def test_repeated_failures_log_traceback_sparsely(self):
+        def bad():
+            raise ValueError("boom")
+
+        task = Task(name="bad", func=bad, interval=60.0)
+        with self.assertLogs("ai_helper.scheduler", level="DEBUG") as logs:
+            for _ in range(8):
+                task.run()
+        errors = [r for r in logs.records if r.levelname == "ERROR"]
+        self.assertEqual(len(errors), 4)  # failures 1, 2, 4 and 8
+        self.assertEqual(task.last_error, "ValueError: boom")
+
     def test_is_due_after_interval(self):
         task = Task(name="t", func=lambda: None, interval=0.01)
         time.sleep(0.05)
@@ -34,6 +47,26 @@ class TestTask(unittest.TestCase):
         task = Task(name="t", func=lambda: None, interval=999.0)
         self.assertFalse(task.is_due())
 
+    def test_is_due_against_supplied_clock(self):
+        task = Task(name="t", func=lambda: None, interval=5.0)
+        self.assertIsInstance(task._next_run_ns, int)
+        self.assertFalse(task.is_due(task._next_run_ns - 1))
+        self.assertTrue(task.is_due(task._next_run_ns))
+
+    def test_overrun_skips_missed_slots(self):
+        task = Task(name="t", func=lambda: None, interval=1.0)
+        due = task._next_run_ns
+        task._schedule_next(due + 2_500_000_000)
+        self.assertEqual(task._next_run_ns, due + 3_000_000_000)
+        self.assertEqual(task.missed_runs, 2)
+
+    def test_on_time_run_keeps_cadence(self):
+        task = Task(name="t", func=lambda: None, interval=1.0)
+        due = task._next_run_ns
+        task._schedule_next(due + 10_000_000)
+        self.assertEqual(task._next_run_ns, due + 1_000_000_000)
+        self.assertEqual(task.missed_runs, 0)
+
     def test_disabled_task_not_due(self):
         task = Task(name="t", func=lambda: None, interval=0.0, enabled=False)
         self.assertFalse(task.is_due())
@@ -93,6 +126,83 @@ class TestTaskScheduler(unittest.TestCase):
         self.sched.stop()
         self.assertGreaterEqual(len(calls), 1)
 
+    def test_new_task_wakes_sleeping_thread(self):
+        sched = TaskScheduler(resolution=5.0)
+        sched.add("long", lambda: None, interval=60.0)
+        sched.start()
+        try:
+            time.sleep(0.05)
+            fired = []
+            sched.add("short", lambda: fired.append(1), interval=0.01)
+            time.sleep(0.2)
+        finally:
+            sched.stop()
+        self.assertGreaterEqual(len(fired), 1)
+
+    def test_stop_interrupts_long_sleep(self):
+        sched = TaskScheduler(resolution=5.0)
+        sched.add("long", lambda: None, interval=600.0)
+        sched.start()
+        time.sleep(0.05)
+        t0 = time.monotonic()
+        sched.stop()
+        self.assertLess(time.monotonic() - t0, 1.0)
+        self.assertFalse(sched.running)
+
+    def test_slow_task_does_not_block_others(self):
+        release = threading.Event()
+        slow_calls, fast_calls = [], []
+
+        def slow():
+            slow_calls.append(1)
+            release.wait(2)
+
+        self.sched.add("slow", slow, interval=0.01)
+        self.sched.add("fast", lambda: fast_calls.append(1), interval=0.01)
+        self.sched.start()
+        try:
+            time.sleep(0.3)
+            self.assertTrue(self.sched.get("slow").running)
+            self.assertGreater(len(fast_calls), 3)
+            # The slow task is not dispatched again while still running.
+            self.assertEqual(len(slow_calls), 1)
+        finally:
+            release.set()
+            self.sched.stop()
+
+    def test_removed_and_replaced_tasks_do_not_run(self):
+        calls = []
+        self.sched.add("gone", lambda: calls.append("gone"), interval=0.0)
+        self.sched.add("rep", lambda: calls.append("old"), interval=0.0)
+        self.sched.remove("gone")
+        self.sched.add("rep", lambda: calls.append("new"), interval=0.0, replace=True)
+        self.assertEqual(self.sched.run_due(), 1)
+        self.assertEqual(calls, ["new"])
+
+    def test_heap_compacted_when_most_tasks_paused(self):
+        for i in range(40):
+            self.sched.add(f"t{i}", lambda: None, interval=60.0)
+        for i in range(30):
+            self.sched.disable(f"t{i}")
+        self.assertLessEqual(len(self.sched._heap), 25)
+        self.sched.remove("t39")
+        self.sched.enable("t0")
+        live = {e[2].name for e in self.sched._heap if e[2].enabled}
+        self.assertIn("t0", live)
+        self.assertIn("t30", live)
+
+    def test_reenabled_task_runs_once_per_due_time(self):
+        calls = []
+        self.sched.add("tog", lambda: calls.append(1), interval=0.0)
+        self.sched.disable("tog")
+        self.assertEqual(self.sched.run_due(), 0)
+        self.sched.enable("tog")
+        self.sched.disable("tog")
+        self.sched.enable("tog")
+        self.assertEqual(self.sched.run_due(), 1)
+        self.assertEqual(self.sched.run_due(), 1)
+        self.assertEqual(len(calls), 2)
+
     def test_status_returns_list(self):
         self.sched.add("s1", lambda: None, interval=10.0)
         self.sched.add("s2", lambda: None, interval=20.0)
@@ -102,6 +212,20 @@ class TestTaskScheduler(unittest.TestCase):
         self.assertIn("s1", names)
         self.assertIn("s2", names)
 
+    def test_iter_status_matches_status(self):
+        self.sched.add("s1", lambda: None, interval=10.0)
+        rows = list(self.sched.iter_status())
+        st = self.sched.status()[0]
+        self.assertEqual(rows, [(st.name, st.interval, st.enabled, st.run_count,
+                                 st.error_count, st.last_run, st.last_error)])
+
+    def test_status_str_formats_last_run(self):
+        self.sched.add("s1", lambda: None, interval=10.0)
+        self.sched.get("s1").run()
+        line = str(self.sched.status()[0])
+        self.assertIn("[s1] enabled", line)
+        self.assertNotIn("never", line)
+
     def test_start_stop_idempotent(self):
         self.sched.start()
         self.assertTrue(self.sched.running)
@@ -0,0 +1,66 @@
+"""Tests for ai_helper.service."""
+
+from __future__ import annotations
+
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+from ai_helper.service import ServiceManager
+
+_ENABLE = ["systemctl", "--user", "enable", "--now", "ai-helper.service"]
+_RELOAD = ["systemctl", "--user", "daemon-reload"]
+
+
+class TestInstallLinux(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        env = patch.dict(os.environ, {"XDG_CONFIG_HOME": str(self.root / "config")})
+        env.start()
+        self.addCleanup(env.stop)
+        which = patch("ai_helper.service._which", return_value="/usr/bin/systemctl")
+        which.start()
+        self.addCleanup(which.stop)
+        self.mgr = ServiceManager(python_executable="/usr/bin/python3",
+                                  install_dir=self.root / "install")
+        self.unit = self.mgr._systemd_service_file
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _install(self, *returncodes: int) -> list:
+        results = [MagicMock(returncode=rc, stderr="") for rc in returncodes]
+        with patch("ai_helper.service.subprocess.run",
+                   side_effect=lambda *a, **k: results.pop(0) if a[0] == _ENABLE
+                   else MagicMock(returncode=0)) as run:
+            self.assertTrue(self.mgr._install_linux())
+        return [c.args[0] for c in run.call_args_list]
+
+    def test_new_unit_runs_enable_once(self):
+        self.assertEqual(self._install(0), [_ENABLE])
+        self.assertEqual(self.unit.read_text(encoding="utf-8"), self.mgr._systemd_unit_text)
+
+    def test_identical_unit_is_not_rewritten_or_reloaded(self):
+        self.unit.parent.mkdir(parents=True)
+        self.unit.write_text(self.mgr._systemd_unit_text, encoding="utf-8")
+        os.utime(self.unit, ns=(0, 0))
+        self.assertEqual(self._install(0), [_ENABLE])
+        self.assertEqual(os.stat(self.unit).st_mtime_ns, 0)
+
+    def test_changed_unit_reloads_then_retries_failed_enable(self):
+        self.unit.parent.mkdir(parents=True)
+        self.unit.write_text("[Unit]\nDescription=old\n", encoding="utf-8")
+        self.assertEqual(self._install(1, 0), [_RELOAD, _ENABLE, _ENABLE])
+        self.assertEqual(self.unit.read_text(encoding="utf-8"), self.mgr._systemd_unit_text)
+
+    def test_identical_unit_reloads_only_after_failed_enable(self):
+        self.unit.parent.mkdir(parents=True)
+        self.unit.write_text(self.mgr._systemd_unit_text, encoding="utf-8")
+        self.assertEqual(self._install(1, 0), [_ENABLE, _RELOAD, _ENABLE])
+
+
+if __name__ == "__main__":
+    unittest.main()
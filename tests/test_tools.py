@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -30,6 +31,13 @@ class TestToolResult(unittest.TestCase):
         r = ToolResult(tool_name="read_file", success=True, output="hello")
         self.assertEqual(str(r), "hello")
 
+    def test_repr_is_compact(self):
+        r = ToolResult("read_file", True, "x" * 100_000, data={"content": "x" * 100_000})
+        text = repr(r)
+        self.assertLess(len(text), 200)
+        self.assertIn("output_len=100000", text)
+        self.assertIn("<dict len=1>", text)
+
     def test_str_failure(self):
         r = ToolResult(tool_name="read_file", success=False, output="", error="not found")
         self.assertIn("ERROR", str(r))
@@ -56,6 +64,13 @@ class TestTool(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("required_arg", result.error)
 
+    def test_missing_reports_first_declared_param(self):
+        tool = Tool("t", "d", [ToolParam("a", "str", ""), ToolParam("b", "str", "")],
+                    handler=lambda **kw: ToolResult("t", True, "ok"))
+        self.assertIn("'a'", tool.invoke().error)
+        self.assertIn("'b'", tool.invoke(a=1).error)
+        self.assertTrue(tool.invoke(a=1, b=2).success)
+
     def test_handler_called_with_kwargs(self):
         received = {}
         def handler(**kw):
@@ -73,6 +88,14 @@ class TestTool(unittest.TestCase):
         result = tool.invoke(required_arg="x")
         self.assertFalse(result.success)
         self.assertIn("ValueError", result.error)
+        self.assertNotIn("Traceback", result.error)
+
+    def test_include_traceback_opt_in(self):
+        def bad(**kw):
+            raise ValueError("boom")
+        tool = self._make_tool(bad)
+        tool.include_traceback = True
+        self.assertIn("Traceback", tool.invoke(required_arg="x").error)
 
     def test_describe_contains_name(self):
         tool = self._make_tool()
@@ -133,11 +156,63 @@ class TestToolRegistry(unittest.TestCase):
         self.assertEqual(len(test_tools), 1)
         self.assertEqual(test_tools[0].name, "t1")
 
+    def test_list_tools_sorted_after_register(self):
+        self._add_tool("b")
+        self._add_tool("c")
+        self.assertEqual([t.name for t in self.reg.list_tools()], ["b", "c"])
+        self._add_tool("a")
+        self.assertEqual([t.name for t in self.reg.list_tools()], ["a", "b", "c"])
+
     def test_describe_all_contains_tool_name(self):
         self._add_tool("echo")
         desc = self.reg.describe_all()
         self.assertIn("echo", desc)
 
+    def test_invoke_many_preserves_order(self):
+        self._add_tool("echo")
+        self.reg.register(Tool(
+            name="slow", description="", params=[],
+            handler=lambda: (time.sleep(0.05), ToolResult("slow", True, "late"))[1],
+        ))
+        self.reg.register(Tool(
+            name="write", description="", params=[], is_concurrency_safe=False,
+            handler=lambda: ToolResult("write", True, "w"),
+        ))
+        results = self.reg.invoke_many([
+            ("slow", {}), ("echo", {"text": "hi"}), ("write", {}), ("nope", {}),
+        ])
+        self.assertEqual([r.output for r in results[:3]], ["late", "hi", "w"])
+        self.assertFalse(results[3].success)
+
+    def test_invoke_many_timeout(self):
+        self._add_tool("echo")
+        self.reg.register(Tool(
+            name="slow", description="", params=[],
+            handler=lambda: (time.sleep(0.3), ToolResult("slow", True, ""))[1],
+        ))
+        results = self.reg.invoke_many([("slow", {}), ("echo", {})], timeout=0.01)
+        self.assertFalse(results[0].success)
+        self.assertIn("Timed out", results[0].error)
+        self.assertTrue(results[1].success)
+
+    def test_describe_all_refreshed_after_register(self):
+        self._add_tool("echo")
+        first = self.reg.describe_all()
+        self.assertIs(self.reg.describe_all(), first)
+        self._add_tool("zulu")
+        self.assertIn("zulu", self.reg.describe_all())
+        self.reg.unregister("zulu")
+        self.assertEqual(self.reg.describe_all(), first)
+
+    def test_builtins_built_on_first_lookup(self):
+        reg = ToolRegistry()
+        self.assertIn("read_file", reg.describe_all())
+        self.assertNotIn("read_file", reg._tools)
+        tool = reg.get("read_file")
+        self.assertIs(reg.get("read_file"), tool)
+        self.assertTrue(reg.unregister("list_directory"))
+        self.assertIsNone(reg.get("list_directory"))
+
 
 # ---------------------------------------------------------------------------
 # Built-in tools (smoke tests — mock side-effectful deps)
@@ -187,6 +262,22 @@ class TestBuiltinTools(unittest.TestCase):
         self.assertTrue(result.success)
         self.assertIn("sub", result.output)
 
+    def test_list_directory_dirs_first_with_sizes(self):
+        (self.root / "b.txt").write_text("x" * 2048)
+        (self.root / "a_dir").mkdir()
+        result = self.reg.invoke("list_directory", path=str(self.root))
+        lines = result.output.splitlines()[1:]
+        self.assertEqual(lines[0].strip(), "a_dir/")
+        self.assertIn("b.txt  2.0 KB", result.output)
+        self.assertIn(str(self.root / "b.txt"), result.data)
+
+    def test_list_directory_on_file(self):
+        f = self.root / "f.txt"
+        f.write_text("")
+        result = self.reg.invoke("list_directory", path=str(f))
+        self.assertFalse(result.success)
+        self.assertIn("not a directory", result.error)
+
     def test_list_directory_missing(self):
         result = self.reg.invoke("list_directory", path=str(self.root / "nope"))
         self.assertFalse(result.success)
@@ -196,6 +287,21 @@ class TestBuiltinTools(unittest.TestCase):
         self.assertTrue(result.success)
         self.assertIn("hello", result.output)
 
+    def test_run_program_quoted_args(self):
+        result = self.reg.invoke("run_program", command="echo", args="'hello   world'")
+        self.assertTrue(result.success)
+        self.assertIn("hello   world", result.output)
+
+    def test_tokenize_args_windows_keeps_backslashes(self):
+        from ai_helper.tools import _tokenize_args  # noqa: PLC0415
+        with patch("ai_helper.tools.os.name", "nt"):
+            _tokenize_args.cache_clear()
+            try:
+                self.assertEqual(_tokenize_args(r'"C:\Program Files\x" -v'),
+                                 (r"C:\Program Files\x", "-v"))
+            finally:
+                _tokenize_args.cache_clear()
+
     def test_list_programs(self):
         result = self.reg.invoke("list_programs")
         self.assertTrue(result.success)
@@ -206,6 +312,13 @@ class TestBuiltinTools(unittest.TestCase):
         self.assertTrue(result.success)
         self.assertIn("CPU", result.output)
 
+    def test_system_snapshot_reuses_monitor(self):
+        from ai_helper.tools import _system_monitor  # noqa: PLC0415
+        self.reg.invoke("system_snapshot")
+        mon = _system_monitor()
+        self.reg.invoke("system_snapshot")
+        self.assertIs(_system_monitor(), mon)
+
     def test_gpu_stats_no_crash(self):
         # No GPU in CI — must not crash, just return gracefully
         result = self.reg.invoke("gpu_stats")
@@ -223,6 +336,15 @@ class TestBuiltinTools(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("not running", result.error)
 
+    def test_ask_ollama_skips_reachability_probe_on_success(self):
+        with patch("ai_helper.ai_integrations._post",
+                   return_value={"response": "hi", "done": True}), \
+             patch("ai_helper.ai_integrations._reachable") as reachable:
+            result = self.reg.invoke("ask_ollama", prompt="hello")
+        self.assertTrue(result.success)
+        self.assertEqual(result.output, "hi")
+        reachable.assert_not_called()
+
     def test_list_ollama_models_not_running(self):
         with patch("ai_helper.ai_integrations._get", return_value=None):
             result = self.reg.invoke("list_ollama_models")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import unittest
 from pathlib import Path
@@ -24,6 +26,10 @@ class TestVersionComparison(unittest.TestCase):
     def test_major_bump(self):
         self.assertTrue(Updater._version_gt("2.0.0", "1.9.9"))
 
+    def test_non_numeric_version_counts_as_zero(self):
+        self.assertTrue(Updater._version_gt("0.0.1", "unknown"))
+        self.assertFalse(Updater._version_gt("unknown", "0"))
+
 
 class TestAssetPicker(unittest.TestCase):
     def _assets(self, names):
@@ -45,6 +51,12 @@ class TestAssetPicker(unittest.TestCase):
             url, name = Updater._pick_asset(assets)
         self.assertIn("linux", name.lower())
 
+    def test_most_markers_wins(self):
+        assets = self._assets(["ai-helper-windows-win64.zip", "ai-helper-win32.zip"])
+        with patch("ai_helper.updater.platform.system", return_value="Windows"):
+            url, name = Updater._pick_asset(assets)
+        self.assertEqual(name, "ai-helper-windows-win64.zip")
+
     def test_empty_assets(self):
         url, name = Updater._pick_asset([])
         self.assertEqual(url, "")
@@ -71,8 +83,9 @@ class TestUpdaterCheck(unittest.TestCase):
             ],
         }
 
-    def _mock_urlopen(self, release_data: dict):
+    def _mock_urlopen(self, release_data: dict, etag: str = ""):
         mock_resp = MagicMock()
+        mock_resp.headers = {"ETag": etag} if etag else {}
         mock_resp.read.return_value = json.dumps(release_data).encode()
         mock_resp.__enter__ = lambda s: s
         mock_resp.__exit__ = MagicMock(return_value=False)
@@ -101,6 +114,48 @@ class TestUpdaterCheck(unittest.TestCase):
         self.assertFalse(info.update_available)
         self.assertNotEqual(info.error, "")
 
+    def test_fresh_result_served_from_cache(self):
+        u = Updater(current_version="0.1.0", download_dir=self.download_dir)
+        with self._mock_urlopen(self._make_release("v0.2.0")):
+            u.check()
+        with patch("ai_helper.updater.urllib.request.urlopen") as urlopen:
+            info = Updater(current_version="0.2.0", download_dir=self.download_dir).check()
+        urlopen.assert_not_called()
+        self.assertEqual(info.latest_version, "0.2.0")
+        self.assertFalse(info.update_available)
+
+    def test_stale_result_returned_and_refreshed(self):
+        u = Updater(current_version="0.1.0", download_dir=self.download_dir, cache_ttl=0)
+        with self._mock_urlopen(self._make_release("v0.2.0")):
+            u.check()
+        with self._mock_urlopen(self._make_release("v0.3.0")):
+            info = u.check()
+            self.assertEqual(info.latest_version, "0.2.0")
+            with u._refresh_lock:   # wait for the background refresh
+                pass
+        self.assertEqual(u._load_cache()[0].latest_version, "0.3.0")
+
+    def test_not_modified_reuses_saved_result(self):
+        import urllib.error  # noqa: PLC0415
+        u = Updater(current_version="0.1.0", download_dir=self.download_dir)
+        with self._mock_urlopen(self._make_release("v0.2.0"), etag='"abc"'):
+            u.check()
+        not_modified = urllib.error.HTTPError(u.api_url, 304, "Not Modified", {}, None)
+        with patch("ai_helper.updater.urllib.request.urlopen",
+                   side_effect=not_modified) as urlopen:
+            info = u.check(force=True)
+        self.assertEqual(urlopen.call_args[0][0].get_header("If-none-match"), '"abc"')
+        self.assertEqual(info.latest_version, "0.2.0")
+        self.assertEqual(info.error, "")
+
+    def test_errors_are_not_cached(self):
+        import urllib.error  # noqa: PLC0415
+        u = Updater(current_version="0.1.0", download_dir=self.download_dir)
+        with patch("ai_helper.updater.urllib.request.urlopen",
+                   side_effect=urllib.error.URLError("offline")):
+            u.check()
+        self.assertIsNone(u._load_cache())
+
     def test_update_info_str_available(self):
         info = UpdateInfo(
             current_version="0.1.0", latest_version="0.2.0",
@@ -116,6 +171,14 @@ class TestUpdaterCheck(unittest.TestCase):
         )
         self.assertIn("up to date", str(info))
 
+    def test_update_info_repr_caps_release_notes(self):
+        info = UpdateInfo(
+            current_version="0.1.0", latest_version="0.2.0",
+            update_available=True, release_notes="n" * 500,
+        )
+        self.assertIn("release_notes='" + "n" * 200 + "'", repr(info))
+        self.assertNotIn("n" * 201, repr(info))
+
     def test_update_info_str_error(self):
         info = UpdateInfo(
             current_version="0.1.0", latest_version="unknown",
@@ -124,6 +187,101 @@ class TestUpdaterCheck(unittest.TestCase):
         self.assertIn("failed", str(info))
 
 
+class TestUpdaterDownload(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.info = UpdateInfo(
+            current_version="0.1.0", latest_version="0.2.0", update_available=True,
+            asset_url="http://example.com/release.zip", asset_name="release.zip",
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _response(self, body: bytes, status: int = 200, headers: dict | None = None):
+        mock_resp = MagicMock()
+        mock_resp.status = status
+        mock_resp.headers = headers or {}
+        mock_resp.read.side_effect = io.BytesIO(body).read
+        mock_resp.__enter__ = lambda s: s
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        return mock_resp
+
+    def _mock_urlopen(self, body: bytes, status: int = 200, headers: dict | None = None):
+        return patch("ai_helper.updater.urllib.request.urlopen",
+                     return_value=self._response(body, status, headers))
+
+    def _leave_partial(self, data: bytes, url: str = "http://example.com/release.zip",
+                       validator: str = '"v1"'):
+        (self.root / "release.zip.part").write_bytes(data)
+        (self.root / "release.zip.part.json").write_text(
+            json.dumps({"url": url, "validator": validator}))
+
+    def test_download_writes_file_and_checksum(self):
+        u = Updater(download_dir=self.root)
+        with self._mock_urlopen(b"archive bytes", headers={"ETag": '"v1"'}):
+            dest = u.download(self.info)
+        self.assertEqual(dest.read_bytes(), b"archive bytes")
+        self.assertFalse((self.root / "release.zip.part").exists())
+        self.assertFalse((self.root / "release.zip.part.json").exists())
+        digest = hashlib.sha256(b"archive bytes").hexdigest()
+        self.assertEqual((self.root / "release.zip.sha256").read_text(),
+                         f"{digest}  release.zip\n")
+
+    def test_download_resumes_partial_file(self):
+        self._leave_partial(b"abc")
+        u = Updater(download_dir=self.root)
+        with self._mock_urlopen(b"def", status=206) as urlopen:
+            dest = u.download(self.info)
+        req = urlopen.call_args[0][0]
+        self.assertEqual(req.get_header("Range"), "bytes=3-")
+        self.assertEqual(req.get_header("If-range"), '"v1"')
+        self.assertEqual(dest.read_bytes(), b"abcdef")
+        self.assertIn(hashlib.sha256(b"abcdef").hexdigest(),
+                      (self.root / "release.zip.sha256").read_text())
+
+    def test_download_restarts_when_range_ignored(self):
+        self._leave_partial(b"abc")
+        u = Updater(download_dir=self.root)
+        with self._mock_urlopen(b"abcdef", status=200):
+            dest = u.download(self.info)
+        self.assertEqual(dest.read_bytes(), b"abcdef")
+
+    def test_partial_without_matching_validator_is_discarded(self):
+        for url, validator in (("http://example.com/old.zip", '"v1"'),
+                               ("http://example.com/release.zip", "")):
+            with self.subTest(url=url, validator=validator):
+                self._leave_partial(b"old", url=url, validator=validator)
+                u = Updater(download_dir=self.root)
+                with self._mock_urlopen(b"new file") as urlopen:
+                    dest = u.download(self.info)
+                self.assertIsNone(urlopen.call_args[0][0].get_header("Range"))
+                self.assertEqual(dest.read_bytes(), b"new file")
+
+    def test_partial_without_metadata_is_discarded(self):
+        (self.root / "release.zip.part").write_bytes(b"old")
+        u = Updater(download_dir=self.root)
+        with self._mock_urlopen(b"new file") as urlopen:
+            dest = u.download(self.info)
+        self.assertIsNone(urlopen.call_args[0][0].get_header("Range"))
+        self.assertEqual(dest.read_bytes(), b"new file")
+
+    def test_range_not_satisfiable_restarts_download(self):
+        import urllib.error  # noqa: PLC0415
+        self._leave_partial(b"abcdef")
+        u = Updater(download_dir=self.root)
+        err = urllib.error.HTTPError(self.info.asset_url, 416, "Range Not Satisfiable", {}, None)
+        with patch("ai_helper.updater.urllib.request.urlopen",
+                   side_effect=[err, self._response(b"abcdef")]) as urlopen:
+            dest = u.download(self.info)
+        self.assertEqual(urlopen.call_count, 2)
+        self.assertIsNone(urlopen.call_args[0][0].get_header("Range"))
+        self.assertEqual(dest.read_bytes(), b"abcdef")
+        self.assertIn(hashlib.sha256(b"abcdef").hexdigest(),
+                      (self.root / "release.zip.sha256").read_text())
+
+
 class TestUpdaterExtract(unittest.TestCase):
     def setUp(self):
         self._tmp = TemporaryDirectory()
@@ -142,6 +300,43 @@ class TestUpdaterExtract(unittest.TestCase):
         self.assertIsNotNone(target)
         self.assertTrue((target / "ai_helper" / "__init__.py").exists())
 
+    def test_extract_tarball(self):
+        import tarfile  # noqa: PLC0415
+        src = self.root / "run.sh"
+        src.write_text("#!/bin/sh\n")
+        src.chmod(0o755)
+        archive = self.root / "release.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            tf.add(src, arcname="pkg/run.sh")
+        u = Updater(download_dir=self.root)
+        target = u.extract(archive, self.root / "extracted")
+        out = target / "pkg" / "run.sh"
+        self.assertEqual(out.read_text(), "#!/bin/sh\n")
+        self.assertEqual(out.stat().st_mode & 0o777, 0o755)
+
+    def test_extract_rejects_path_traversal(self):
+        import zipfile  # noqa: PLC0415
+        archive = self.root / "evil.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("good.txt", "ok")
+            zf.writestr("../escaped.txt", "x")
+        u = Updater(download_dir=self.root)
+        self.assertIsNone(u.extract(archive, self.root / "extracted"))
+        self.assertFalse((self.root / "escaped.txt").exists())
+        self.assertFalse((self.root / "extracted" / "good.txt").exists())
+
+    def test_extract_tarball_rejects_traversal_before_writing(self):
+        import tarfile  # noqa: PLC0415
+        good = self.root / "good.txt"
+        good.write_text("ok")
+        archive = self.root / "evil.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            tf.add(good, arcname="good.txt")
+            tf.add(good, arcname="../escaped.txt")
+        u = Updater(download_dir=self.root)
+        self.assertIsNone(u.extract(archive, self.root / "extracted"))
+        self.assertFalse((self.root / "extracted" / "good.txt").exists())
+
     def test_extract_unknown_format_returns_none(self):
         archive = self.root / "unknown.exe"
         archive.write_bytes(b"MZ")
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import queue
+import threading
 import time
 import unittest
 from unittest.mock import MagicMock, patch
 
-from ai_helper.voice import Speaker, VoiceSettings, _cli_fallback_available
+from ai_helper.voice import Speaker, VoiceSettings, _SpeechQueue
 
 
 class TestVoiceSettings(unittest.TestCase):
@@ -23,6 +25,23 @@ class TestVoiceSettings(unittest.TestCase):
         self.assertEqual(s.voice_id, "english")
 
 
+class TestSpeechQueue(unittest.TestCase):
+    def test_fifo_and_wakeup(self):
+        q = _SpeechQueue()
+        q.put("a")
+        q.put("b")
+        self.assertEqual([q.get(), q.get()], ["a", "b"])
+        threading.Timer(0.05, q.put, args=("c",)).start()
+        self.assertEqual(q.get(timeout=2.0), "c")
+
+    def test_empty(self):
+        q = _SpeechQueue()
+        with self.assertRaises(queue.Empty):
+            q.get_nowait()
+        with self.assertRaises(queue.Empty):
+            q.get(timeout=0.01)
+
+
 class TestSpeakerDisabled(unittest.TestCase):
     """When enabled=False the speaker must be silent and non-blocking."""
 
@@ -79,6 +98,47 @@ class TestSpeakerEnabled(unittest.TestCase):
         finally:
             speaker.shutdown()
 
+    def test_queued_messages_spoken_in_one_batch(self):
+        speaker, mock_engine = self._make_speaker()
+        release = threading.Event()
+        mock_engine.runAndWait.side_effect = lambda: release.wait(2.0)
+        try:
+            speaker.speak("first")
+            time.sleep(0.1)               # worker is now busy with "first"
+            for text in ("CPU high", "Disk full.", "GPU hot"):
+                speaker.speak(text)
+            release.set()
+            time.sleep(0.3)
+            spoken = [c.args[0] for c in mock_engine.say.call_args_list]
+            self.assertEqual(spoken, ["first", "CPU high. Disk full. GPU hot."])
+        finally:
+            release.set()
+            speaker.shutdown()
+
+    def test_long_text_queued_per_sentence(self):
+        speaker, mock_engine = self._make_speaker()
+        try:
+            text = "First sentence is here. " * 6 + "Last one!"
+            speaker._utter_pyttsx3(text)
+            spoken = [c.args[0] for c in mock_engine.say.call_args_list]
+            self.assertEqual(len(spoken), 7)
+            self.assertEqual(spoken[-1], "Last one!")
+            mock_engine.runAndWait.assert_called_once()
+        finally:
+            speaker.shutdown()
+
+    def test_cli_fallback_runs_without_engine_lock(self):
+        speaker, mock_engine = self._make_speaker()
+        mock_engine.runAndWait.side_effect = RuntimeError("driver gone")
+        held = []
+        try:
+            with patch.object(speaker, "_utter_cli",
+                              side_effect=lambda text: held.append(speaker._lock.locked())):
+                speaker._utter_pyttsx3("hello")
+            self.assertEqual(held, [False])
+        finally:
+            speaker.shutdown()
+
     def test_stop_clears_queue(self):
         speaker, _ = self._make_speaker()
         try:
@@ -111,6 +171,82 @@ class TestSpeakerEnabled(unittest.TestCase):
         self.assertIn("Test Voice", voices)
         speaker.shutdown()
 
+    def test_list_voices_uses_worker_engine_and_caches(self):
+        mock_voice = MagicMock()
+        mock_voice.name = "Worker Voice"
+        speaker, mock_engine = self._make_speaker()
+        mock_engine.getProperty.return_value = [mock_voice]
+        try:
+            self.assertEqual(speaker.list_voices(), ["Worker Voice"])
+            self.assertEqual(speaker.list_voices(), ["Worker Voice"])
+            mock_engine.getProperty.assert_called_once_with("voices")
+            speaker._pyttsx3.init.assert_called_once()   # only the worker's engine
+        finally:
+            speaker.shutdown()
+
+    def test_list_voices_served_ahead_of_queued_speech(self):
+        mock_voice = MagicMock()
+        mock_voice.name = "Worker Voice"
+        speaker, mock_engine = self._make_speaker()
+        order = []
+        mock_engine.getProperty.side_effect = lambda name: order.append(name) or [mock_voice]
+        mock_engine.say.side_effect = order.append
+        release = threading.Event()
+        mock_engine.runAndWait.side_effect = lambda: release.wait(2.0)
+        try:
+            speaker.speak("first")
+            time.sleep(0.1)               # worker is now busy with "first"
+            for text in ("CPU high", "Disk full", "GPU hot"):
+                speaker.speak(text)
+            threading.Timer(0.2, release.set).start()
+            self.assertEqual(speaker.list_voices(timeout=1.0), ["Worker Voice"])
+            self.assertEqual(order[:2], ["first", "voices"])
+        finally:
+            release.set()
+            speaker.shutdown()
+
+    def test_list_voices_holds_engine_lock(self):
+        mock_voice = MagicMock()
+        mock_voice.name = "Worker Voice"
+        speaker, mock_engine = self._make_speaker()
+        held = []
+        mock_engine.getProperty.side_effect = (
+            lambda name: held.append(speaker._lock.locked()) or [mock_voice]
+        )
+        try:
+            self.assertEqual(speaker.list_voices(), ["Worker Voice"])
+            self.assertEqual(held, [True])
+        finally:
+            speaker.shutdown()
+
+    def test_list_voices_worker_failure_answers_immediately(self):
+        speaker, mock_engine = self._make_speaker()
+        mock_engine.getProperty.side_effect = RuntimeError("driver gone")
+        try:
+            started = time.monotonic()
+            self.assertEqual(speaker.list_voices(timeout=5.0), [])
+            self.assertLess(time.monotonic() - started, 1.0)
+            self.assertIsNone(speaker._voices)    # a failure is not cached
+        finally:
+            speaker.shutdown()
+
+    def test_list_voices_falls_back_when_worker_busy(self):
+        mock_voice = MagicMock()
+        mock_voice.name = "Fresh Voice"
+        speaker, mock_engine = self._make_speaker()
+        fresh_engine = MagicMock()
+        fresh_engine.getProperty.return_value = [mock_voice]
+        speaker._pyttsx3.init.return_value = fresh_engine
+        release = threading.Event()
+        mock_engine.runAndWait.side_effect = lambda: release.wait(2.0)
+        try:
+            speaker.speak("long speech")
+            time.sleep(0.1)
+            self.assertEqual(speaker.list_voices(timeout=0.1), ["Fresh Voice"])
+        finally:
+            release.set()
+            speaker.shutdown()
+
 
 class TestSpeakerCliFallback(unittest.TestCase):
     """Test CLI fallback path when pyttsx3 is unavailable."""
@@ -154,6 +290,59 @@ class TestSpeakerCliFallback(unittest.TestCase):
             self.assertEqual(cmd[0], "powershell")
         speaker.shutdown()
 
+    def test_cli_command_resolved_once_per_settings(self):
+        speaker = Speaker(enabled=True, settings=VoiceSettings(rate=150, volume=0.5))
+        speaker._engine = None
+        with patch("ai_helper.voice._SYSTEM", "Linux"), \
+             patch("ai_helper.voice.shutil.which", return_value="/usr/bin/espeak") as which, \
+             patch("ai_helper.voice.subprocess.run") as mock_run:
+            speaker._utter_cli("one")
+            speaker._utter_cli("two")
+            self.assertEqual(which.call_count, 1)
+            self.assertEqual(mock_run.call_args[0][0], ["espeak", "-s", "150", "-a", "50", "two"])
+            speaker.settings = VoiceSettings(rate=300)
+            speaker._utter_cli("three")
+            self.assertEqual(mock_run.call_args[0][0][:3], ["espeak", "-s", "300"])
+        speaker.shutdown()
+
+    def test_windows_reuses_powershell_host(self):
+        speaker = Speaker(enabled=True)
+        speaker._engine = None
+        proc = MagicMock()
+        proc.poll.return_value = None
+        proc.stdout.readline.return_value = ".\n"
+        with patch("ai_helper.voice._SYSTEM", "Windows"), \
+             patch("ai_helper.voice.subprocess.Popen", return_value=proc) as mock_popen, \
+             patch("ai_helper.voice.subprocess.run") as mock_run:
+            speaker._utter_cli("first line")
+            speaker._utter_cli('second\n"line"')
+            mock_popen.assert_called_once()
+            mock_run.assert_not_called()
+            written = [c.args[0] for c in proc.stdin.write.call_args_list]
+            self.assertEqual(written, ["first line\n", 'second "line"\n'])
+            script = mock_popen.call_args[0][0][-1]
+            self.assertTrue(script.startswith("[Console]::InputEncoding = [System.Text.Encoding]::UTF8;"))
+            speaker.shutdown()
+        proc.stdin.close.assert_called_once()
+
+    def test_windows_falls_back_when_host_dies(self):
+        speaker = Speaker(enabled=True)
+        speaker._engine = None
+        proc = MagicMock()
+        proc.poll.return_value = None
+        proc.stdout.readline.return_value = ""      # host exited
+        with patch("ai_helper.voice._SYSTEM", "Windows"), \
+             patch("ai_helper.voice.subprocess.Popen", return_value=proc), \
+             patch("ai_helper.voice.subprocess.run") as mock_run:
+            speaker._utter_cli('hello"); Remove-Item x; ("')
+            mock_run.assert_called_once()
+            script = mock_run.call_args[0][0][-1]
+            self.assertNotIn("Remove-Item", script)
+            self.assertTrue(script.startswith("[Console]::InputEncoding = [System.Text.Encoding]::UTF8;"))
+            self.assertEqual(mock_run.call_args.kwargs["encoding"], "utf-8")
+            self.assertEqual(mock_run.call_args.kwargs["input"], 'hello"); Remove-Item x; ("')
+        speaker.shutdown()
+
     def test_quotes_sanitised(self):
         """Double-quotes in text must be converted to single-quotes for shell safety."""
         speaker = Speaker(enabled=True)
@@ -190,6 +379,15 @@ class TestPsRate(unittest.TestCase):
         self.assertEqual(s._ps_rate(), 10)
         s.shutdown()
 
+    def test_ps_setup_built_once_per_settings(self):
+        s = Speaker(settings=VoiceSettings(rate=300, volume=0.5), enabled=False)
+        setup = s._ps_setup()
+        self.assertIn("$s.Rate = 5; $s.Volume = 50;", setup)
+        self.assertIs(s._ps_setup(), setup)
+        s.settings = VoiceSettings(rate=100)
+        self.assertIn("$s.Rate = -5; $s.Volume = 100;", s._ps_setup())
+        s.shutdown()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,163 @@
+"""Tests for ai_helper.wake_word."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+try:
+    import numpy as np
+except ImportError:  # wake_word needs numpy, which isn't a core dependency
+    np = None
+
+if np is not None:
+    from ai_helper.wake_word import _AUDIO_QUEUE_SIZE, WakeWordListener
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestRecognizeLoop(unittest.TestCase):
+    def setUp(self):
+        self.listener = WakeWordListener(wake_word="mossy", phrase_time_limit=6.0)
+        self.commands = []
+        self.listener._executor = MagicMock()
+        self.listener._executor.submit.side_effect = lambda fn, text: fn(text)
+
+    def _feed(self, *phrases):
+        with self.listener._audio_cv:
+            for text, captured_at in phrases:
+                self.listener._audio_q.append((text, captured_at))
+            self.listener._audio_cv.notify()
+
+    def _drain(self):
+        finished = threading.Event()
+        finished.set()   # capture has ended: return once the queue is empty
+        with patch.object(self.listener, "_recognize", side_effect=lambda audio, rec: audio):
+            self.listener._recognize_loop(None, self.commands.append, finished)
+
+    def test_phrase_before_deadline_is_the_command(self):
+        now = time.monotonic()
+        self._feed(("hey mossy", now), ("open notepad", now + 1))
+        self._drain()
+        self.assertEqual(self.commands, ["open notepad"])
+
+    def test_phrase_after_deadline_is_ignored(self):
+        now = time.monotonic()
+        self._feed(("hey mossy", now), ("open notepad", now + 5 + 6.0 + 60))
+        self._drain()
+        self.assertEqual(self.commands, [])
+
+    def test_phrase_without_wake_word_is_ignored(self):
+        now = time.monotonic()
+        self._feed(("open notepad", now), ("mossyard", now), ("close it", now + 1))
+        self._drain()
+        self.assertEqual(self.commands, [])
+
+    def test_stop_ends_consumer(self):
+        worker = threading.Thread(
+            target=self.listener._recognize_loop,
+            args=(None, self.commands.append, threading.Event()),
+        )
+        worker.start()
+        self.listener.stop()
+        worker.join(2)
+        self.assertFalse(worker.is_alive())
+
+    def test_full_queue_drops_oldest(self):
+        self._feed(*((f"phrase {i}", float(i)) for i in range(_AUDIO_QUEUE_SIZE + 1)))
+        queued = [text for text, _ in self.listener._audio_q]
+        self.assertEqual(queued, [f"phrase {i}" for i in range(1, _AUDIO_QUEUE_SIZE + 1)])
+
+
+def _audio(samples) -> MagicMock:
+    """Fake ``sr.AudioData`` holding 16 kHz int16 *samples*."""
+    audio = MagicMock()
+    audio.get_raw_data.return_value = np.asarray(samples, dtype=np.int16).tobytes()
+    return audio
+
+
+def _speech(seconds: float, silence: float = 0.0):
+    """A 440 Hz tone of *seconds* followed by *silence* seconds of zeros."""
+    t = np.arange(int(seconds * 16000)) / 16000
+    tone = (10000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+    return np.concatenate([tone, np.zeros(int(silence * 16000), dtype=np.int16)])
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestVoiceActivityGate(unittest.TestCase):
+    def setUp(self):
+        self.listener = WakeWordListener()
+        self.recognizer = MagicMock(energy_threshold=300)
+
+    def _voiced(self, samples) -> bool:
+        return self.listener._is_voiced(_audio(samples), self.recognizer)
+
+    def test_energy_fallback(self):
+        self.listener._vad = None
+        self.assertFalse(self._voiced(np.zeros(16000)))
+        self.assertTrue(self._voiced(_speech(1.0)))
+        # A short wake word padded by listen()'s silence still passes...
+        self.assertTrue(self._voiced(_speech(0.3, silence=0.7)))
+        # ...but a click in a second of quiet does not.
+        self.assertFalse(self._voiced(_speech(0.1, silence=0.9)))
+
+    def test_webrtc_vad(self):
+        vad = MagicMock()
+        vad.is_speech.side_effect = lambda frame, rate: any(frame)
+        self.listener._vad = vad
+        self.assertFalse(self._voiced(np.zeros(16000)))
+        self.assertTrue(self._voiced(_speech(0.3, silence=0.7)))
+        self.assertFalse(self._voiced(_speech(0.1, silence=0.9)))
+        frame, rate = vad.is_speech.call_args.args
+        self.assertEqual((len(frame), rate), (320, 16000))   # 10 ms at 16 kHz
+
+    def test_empty_audio_is_not_voiced(self):
+        self.assertFalse(self._voiced(np.zeros(0)))
+        self.assertFalse(self._voiced(np.zeros(100)))        # under one frame
+
+    def test_gate_fails_open(self):
+        audio = MagicMock()
+        audio.get_raw_data.side_effect = RuntimeError("bad audio")
+        self.assertTrue(self.listener._is_voiced(audio, self.recognizer))
+
+    def test_unvoiced_phrase_skips_recognition(self):
+        self.listener._vad = None
+        with patch.object(self.listener, "_recognize_google") as google:
+            self.assertEqual(self.listener._recognize(_audio(np.zeros(16000)), self.recognizer), "")
+        google.assert_not_called()
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestToFloat32(unittest.TestCase):
+    def test_scaling(self):
+        listener = WakeWordListener()
+        raw = np.array([-32768, 0, 16384, 32767], dtype=np.int16).tobytes()
+        out = listener._to_float32(raw)
+        self.assertEqual(out.dtype, np.float32)
+        self.assertEqual(out.tolist()[:3], [-1.0, 0.0, 0.5])
+        self.assertLess(out[3], 1.0)
+
+    def test_buffer_grows_and_is_reused(self):
+        listener = WakeWordListener(phrase_time_limit=0.0)   # no pre-sizing
+        first = listener._to_float32(np.ones(4, dtype=np.int16).tobytes())
+        small_buf = listener._f32_buf
+        self.assertEqual(small_buf.size, 4)
+        self.assertTrue(np.shares_memory(first, small_buf))
+
+        longer = listener._to_float32(np.full(8, 16384, dtype=np.int16).tobytes())
+        grown = listener._f32_buf
+        self.assertIsNot(grown, small_buf)
+        self.assertEqual(grown.size, 8)
+        self.assertEqual(longer.tolist(), [0.5] * 8)
+
+        shorter = listener._to_float32(np.full(2, -32768, dtype=np.int16).tobytes())
+        self.assertIs(listener._f32_buf, grown)
+        self.assertTrue(np.shares_memory(shorter, grown))
+        self.assertEqual(shorter.tolist(), [-1.0, -1.0])
+        # The returned view is only valid until the next call.
+        self.assertEqual(longer.tolist()[:2], [-1.0, -1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()